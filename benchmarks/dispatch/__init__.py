@@ -0,0 +1,15 @@
+"""Broker-free message dispatch benchmark suite.
+
+Drives `SubscriberUsecase.consume` with synthetic raw messages of each broker
+(aiokafka `ConsumerRecord`, aio-pika `IncomingMessage`, nats `Msg` and Redis
+channel message dicts) across a matrix of middlewares, serializers, handlers
+and workers numbers. A single handler is measured with the default filter
+(subscriber fast path) and with a custom one (generic handlers lookup).
+No broker server or network access is required.
+
+Comparison with a baseline fails on median time or allocations growth only,
+p99 latency changes are reported without failing the run.
+
+Usage:
+    python -m benchmarks.dispatch [--save results.json] [--compare baseline.json]
+"""
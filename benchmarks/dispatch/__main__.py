@@ -0,0 +1,178 @@
+import argparse
+import asyncio
+import json
+import platform
+import sys
+from pathlib import Path
+from typing import Any
+
+from faststream.__about__ import __version__
+
+from .cases import BROKERS, FILTERS, SERIALIZERS, iter_cases
+from .measure import CaseResult, measure_case
+
+METRICS = ("us_per_msg", "p99_us", "alloc_bytes")
+# tail latency is too noisy on shared machines to fail the comparison
+GATED_METRICS = ("us_per_msg", "alloc_bytes")
+
+
+def _str_list(value: str) -> tuple[str, ...]:
+    return tuple(v.strip() for v in value.split(",") if v.strip())
+
+
+def _int_list(value: str) -> tuple[int, ...]:
+    return tuple(int(v) for v in _str_list(value))
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.dispatch",
+        description="Broker-free message dispatch benchmark.",
+    )
+    parser.add_argument("--brokers", type=_str_list, default=BROKERS)
+    parser.add_argument("--serializers", type=_str_list, default=SERIALIZERS)
+    parser.add_argument("--middlewares", type=_int_list, default=(0, 3))
+    parser.add_argument("--handlers", type=_int_list, default=(1, 4))
+    parser.add_argument("--max-workers", type=_int_list, default=(1, 4))
+    parser.add_argument("--filters", type=_str_list, default=FILTERS)
+    parser.add_argument("--messages", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--alloc-messages", type=int, default=200)
+    parser.add_argument(
+        "--save",
+        type=Path,
+        help="Write results to this JSON file to use it as a baseline later.",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="Baseline JSON file to compare results with.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help=(
+            "Relative median time or allocations growth over the baseline "
+            "treated as a regression. p99 changes are reported only."
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> dict[str, CaseResult]:
+    results: dict[str, CaseResult] = {}
+    skipped: set[str] = set()
+
+    print(f"{'case':<44}{'us/msg':>10}{'p99 us':>10}{'alloc B':>10}")
+
+    for case in iter_cases(
+        args.brokers,
+        args.serializers,
+        args.middlewares,
+        args.handlers,
+        args.max_workers,
+        args.filters,
+    ):
+        if case.broker in skipped:
+            continue
+
+        try:
+            result = await measure_case(
+                case,
+                messages=args.messages,
+                repeat=args.repeat,
+                alloc_messages=args.alloc_messages,
+            )
+        except ImportError as e:
+            skipped.add(case.broker)
+            print(f"{case.broker:<44}skipped: {e}")
+            continue
+
+        results[case.name] = result
+        print(
+            f"{case.name:<44}{result.us_per_msg:>10.2f}"
+            f"{result.p99_us:>10.2f}{result.alloc_bytes:>10}",
+        )
+
+    return results
+
+
+def compare(
+    results: dict[str, CaseResult],
+    baseline: dict[str, Any],
+    threshold: float,
+) -> bool:
+    """Print the metrics changes and return `True` if there are regressions.
+
+    Only `GATED_METRICS` growth counts as a regression.
+    """
+    base_results: dict[str, dict[str, float]] = baseline["results"]
+
+    print(
+        f"\nCompared with FastStream {baseline.get('faststream')} "
+        f"on Python {baseline.get('python')}:",
+    )
+    print(f"{'case':<44}" + "".join(f"{m:>14}" for m in METRICS))
+
+    regressed = False
+    for name, result in results.items():
+        if (base := base_results.get(name)) is None:
+            print(f"{name:<44}{'new case':>14}")
+            continue
+
+        current = result.as_dict()
+        row = f"{name:<44}"
+        for metric in METRICS:
+            if not base[metric]:
+                row += f"{'-':>14}"
+                continue
+
+            change = current[metric] / base[metric] - 1
+            mark = ""
+            if change > threshold:
+                mark = " ?"
+                if metric in GATED_METRICS:
+                    regressed = True
+                    mark = " !"
+            row += f"{f'{change:+.1%}{mark}':>14}"
+        print(row)
+
+    if missing := len(base_results.keys() - results.keys()):
+        print(f"{missing} baseline cases were not measured")
+
+    return regressed
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    results = asyncio.run(run(args))
+
+    if args.save:
+        args.save.write_text(
+            json.dumps(
+                {
+                    "faststream": __version__,
+                    "python": platform.python_version(),
+                    "messages": args.messages,
+                    "results": {k: v.as_dict() for k, v in results.items()},
+                },
+                indent=2,
+            )
+            + "\n",
+        )
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if compare(results, baseline, args.threshold):
+            print(
+                "\nRegression: median time or allocations grew "
+                f"more than {args.threshold:.0%}",
+            )
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+import asyncio
+from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import product
+from typing import Any
+
+from faststream import BaseMiddleware
+
+BROKERS = ("kafka", "rabbit", "nats", "redis")
+SERIALIZERS = ("none", "pydantic", "msgspec")
+FILTERS = ("default", "custom")
+
+PAYLOAD = {
+    "name": "John",
+    "age": 39,
+    "fullname": "LongString" * 8,
+    "children": [{"name": "Mike", "age": 8, "fullname": "LongString" * 8}],
+}
+
+
+class NoopMiddleware(BaseMiddleware):
+    """Middleware passing messages through to measure the middlewares stack cost."""
+
+
+@dataclass(frozen=True)
+class Case:
+    broker: str
+    serializer: str
+    middlewares: int
+    handlers: int
+    max_workers: int
+    filter: str = "default"
+
+    @property
+    def name(self) -> str:
+        handlers = f"h{self.handlers}"
+        if self.filter != "default":
+            handlers += f"-{self.filter}"
+
+        return (
+            f"{self.broker}-{self.serializer}"
+            f"-mw{self.middlewares}-{handlers}-w{self.max_workers}"
+        )
+
+
+class Counter:
+    """Processed messages counter to wait for concurrent workers."""
+
+    def __init__(self) -> None:
+        self.value = 0
+        self._expected = 0
+        self._event = asyncio.Event()
+
+    def increment(self) -> None:
+        self.value += 1
+        if self.value == self._expected:
+            self._event.set()
+
+    async def wait(self, value: int) -> None:
+        if self.value >= value:
+            return
+
+        self._expected = value
+        self._event.clear()
+        await self._event.wait()
+
+
+@dataclass
+class Target:
+    """Prepared subscriber and the raw message to consume."""
+
+    subscriber: Any
+    message: Any
+    processed: Counter
+
+
+def iter_cases(
+    brokers: tuple[str, ...],
+    serializers: tuple[str, ...],
+    middlewares: tuple[int, ...],
+    handlers: tuple[int, ...],
+    max_workers: tuple[int, ...],
+    filters: tuple[str, ...] = ("default",),
+) -> Iterator[Case]:
+    for broker, serializer, mw, h, w, f in product(
+        brokers,
+        serializers,
+        middlewares,
+        handlers,
+        max_workers,
+        filters,
+    ):
+        # RabbitMQ subscribers have no in-process workers
+        if broker == "rabbit" and w > 1:
+            continue
+
+        # several handlers always use the generic lookup
+        if h > 1 and f != "default":
+            continue
+
+        yield Case(broker, serializer, mw, h, w, f)
+
+
+def build_target(case: Case) -> Target:
+    """Build a not connected broker subscriber ready to consume messages.
+
+    All handlers except the last one are filtered out by a message header,
+    so the handlers number reflects the lookup cost for the matching one.
+    A single handler with the default filter uses the subscriber fast path,
+    the `custom` filter forces the generic handlers lookup for it.
+    """
+    broker, message = _build_broker(case)
+
+    subscriber_kwargs: dict[str, Any] = {}
+    if case.max_workers > 1:
+        subscriber_kwargs["max_workers"] = case.max_workers
+
+    sub = broker.subscriber("test", **subscriber_kwargs)
+
+    processed = Counter()
+    schema = _build_schema(case.serializer)
+
+    if schema is None:
+
+        async def handler(msg: Any) -> None:
+            processed.increment()
+
+    else:
+
+        async def handler(msg: schema) -> None:  # type: ignore[valid-type]
+            processed.increment()
+
+    for _ in range(case.handlers - 1):
+
+        @sub(filter=lambda m: m.headers.get("route") == "other")
+        async def other(msg: Any) -> None: ...
+
+    if case.filter == "custom":
+        sub(filter=lambda m: True)(handler)
+    else:
+        sub(handler)
+
+    broker._setup_logger()
+    sub._build_fastdepends_model()
+    sub._post_start()
+
+    return Target(
+        subscriber=sub,
+        message=message,
+        processed=processed,
+    )
+
+
+def _build_broker(case: Case) -> tuple[Any, Any]:
+    broker_kwargs: dict[str, Any] = {
+        "logger": None,
+        "middlewares": (NoopMiddleware,) * case.middlewares,
+    }
+
+    if case.serializer == "none":
+        broker_kwargs["apply_types"] = False
+
+    elif case.serializer == "msgspec":
+        from fast_depends.msgspec import MsgSpecSerializer
+
+        broker_kwargs["serializer"] = MsgSpecSerializer(use_fastdepends_errors=False)
+
+    if case.broker == "kafka":
+        from faststream.kafka import KafkaBroker
+        from faststream.kafka.testing import build_message as build_kafka_message
+
+        return (
+            KafkaBroker(**broker_kwargs),
+            build_kafka_message(PAYLOAD, "test", serializer=None),
+        )
+
+    if case.broker == "rabbit":
+        from faststream.rabbit import RabbitBroker
+        from faststream.rabbit.testing import build_message as build_rabbit_message
+
+        return RabbitBroker(**broker_kwargs), build_rabbit_message(PAYLOAD, "test")
+
+    if case.broker == "nats":
+        from faststream.nats import NatsBroker
+        from faststream.nats.testing import build_message as build_nats_message
+
+        return NatsBroker(**broker_kwargs), build_nats_message(PAYLOAD, "test")
+
+    if case.broker == "redis":
+        from faststream.redis import RedisBroker
+        from faststream.redis.parser import BinaryMessageFormatV1
+        from faststream.redis.testing import build_message as build_redis_message
+
+        return RedisBroker(**broker_kwargs), {
+            "type": "message",
+            "channel": b"test",
+            "pattern": None,
+            "data": build_redis_message(
+                PAYLOAD,
+                correlation_id="1",
+                message_format=BinaryMessageFormatV1,
+            ),
+        }
+
+    msg = f"Unknown broker `{case.broker}`"
+    raise ValueError(msg)
+
+
+def _build_schema(serializer: str) -> type | None:
+    if serializer == "pydantic":
+        from pydantic import BaseModel
+
+        class PydanticChild(BaseModel):
+            name: str
+            age: int
+            fullname: str
+
+        class PydanticSchema(PydanticChild):
+            children: list[PydanticChild]
+
+        return PydanticSchema
+
+    if serializer == "msgspec":
+        from msgspec import Struct
+
+        class MsgspecChild(Struct):
+            name: str
+            age: int
+            fullname: str
+
+        class MsgspecSchema(MsgspecChild):
+            children: list[MsgspecChild]
+
+        return MsgspecSchema
+
+    return None
@@ -0,0 +1,126 @@
+import asyncio
+import gc
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from .cases import Case, Target, build_target
+
+
+@dataclass
+class CaseResult:
+    us_per_msg: float
+    p99_us: float
+    alloc_bytes: int
+
+    def as_dict(self) -> dict[str, float]:
+        return asdict(self)
+
+
+async def measure_case(
+    case: Case,
+    *,
+    messages: int,
+    repeat: int,
+    alloc_messages: int,
+) -> CaseResult:
+    target = build_target(case)
+
+    latencies: list[float] = []
+
+    # warm up caches and lazy imports
+    await _run(target, min(messages, 100), workers=case.max_workers, latencies=[])
+
+    elapsed = [
+        await _run(target, messages, workers=case.max_workers, latencies=latencies)
+        for _ in range(repeat)
+    ]
+
+    return CaseResult(
+        us_per_msg=statistics.median(elapsed) / messages * 1_000_000,
+        p99_us=_percentile(latencies, 0.99) * 1_000_000,
+        alloc_bytes=await _measure_allocations(target, alloc_messages),
+    )
+
+
+async def _run(
+    target: Target,
+    messages: int,
+    *,
+    workers: int,
+    latencies: list[float],
+) -> float:
+    """Consume messages and return the total elapsed time in seconds.
+
+    Each `consume` call latency is appended to `latencies`. With workers
+    messages are put to the subscriber in-memory queue as a real consumer does.
+    """
+    sub = target.subscriber
+    msg = target.message
+    consume = sub.consume
+
+    async def timed_consume(raw: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return await consume(raw)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    expected = target.processed.value + messages
+    sub.consume = timed_consume
+
+    try:
+        if workers <= 1:
+            start = time.perf_counter()
+            for _ in range(messages):
+                await timed_consume(msg)
+            return time.perf_counter() - start
+
+        sub.start_consume_task()
+        start = time.perf_counter()
+        for _ in range(messages):
+            await sub._put_msg(msg)
+        await target.processed.wait(expected)
+        return time.perf_counter() - start
+
+    finally:
+        del sub.consume
+        await _cancel_tasks(sub)
+
+
+async def _measure_allocations(target: Target, messages: int) -> int:
+    """Return the median peak of memory allocated while consuming a message."""
+    sub = target.subscriber
+    msg = target.message
+
+    peaks: list[int] = []
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for _ in range(messages):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await sub.consume(msg)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - current)
+    finally:
+        tracemalloc.stop()
+
+    return int(statistics.median(peaks))
+
+
+async def _cancel_tasks(sub: Any) -> None:
+    tasks = getattr(sub, "tasks", ())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if tasks:
+        tasks.clear()
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
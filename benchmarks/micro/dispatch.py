@@ -0,0 +1,53 @@
+"""Subscriber dispatch microbenchmark.
+
+Compares a single default-filter handler, which parses the message with the
+composed parser and decoder directly, with the same handler behind a custom
+filter, which still goes through the generic handler lookup.
+
+Cases are shared with the `benchmarks.dispatch` suite (its `--filters`
+dimension), this module is a shortcut to compare both paths.
+
+Usage:
+    python -m benchmarks.micro.dispatch
+"""
+
+import asyncio
+
+from benchmarks.dispatch.cases import Case
+from benchmarks.dispatch.measure import measure_case
+
+MESSAGES = 20_000
+
+
+async def amain() -> None:
+    print(f"{'path':<10}{'us/msg':>12}{'p99 us':>12}{'alloc B':>12}")
+
+    for name, filter_ in (
+        ("generic", "custom"),
+        ("fast", "default"),
+    ):
+        result = await measure_case(
+            Case(
+                broker="redis",
+                serializer="none",
+                middlewares=0,
+                handlers=1,
+                max_workers=1,
+                filter=filter_,
+            ),
+            messages=MESSAGES,
+            repeat=5,
+            alloc_messages=200,
+        )
+        print(
+            f"{name:<10}{result.us_per_msg:>12.3f}"
+            f"{result.p99_us:>12.3f}{result.alloc_bytes:>12}",
+        )
+
+
+def main() -> None:
+    asyncio.run(amain())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Correlation ID generators microbenchmark.
+
+Usage:
+    python -m benchmarks.micro.ids
+"""
+
+import timeit
+
+from faststream.message import IdGenerator, NuidGenerator, UlidGenerator, gen_cor_id
+
+NUMBER = 200_000
+
+
+def measure(generator: IdGenerator, number: int = NUMBER) -> float:
+    """Return generation time per ID in microseconds."""
+    timer = timeit.Timer(generator)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1_000_000
+
+
+def main() -> None:
+    print(f"{'strategy':<10}{'us/id':>10}  example")
+
+    for name, generator in (
+        ("uuid4", gen_cor_id),
+        ("nuid", NuidGenerator()),
+        ("ulid", UlidGenerator()),
+    ):
+        print(f"{name:<10}{measure(generator):>10.3f}  {generator()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Import time benchmark.
+
+Each statement is measured in a fresh interpreter, so the results include
+the whole dependencies import time as it is at the worker process startup.
+With `--check` it also fails if a statement imports modules which should be
+imported lazily (ASGI, observability integrations, AsyncAPI schema models).
+
+Usage:
+    python -m benchmarks.micro.imports [--check]
+"""
+
+import argparse
+import subprocess  # noqa: S404
+import sys
+
+REPEAT = 5
+
+LAZY_MODULES = (
+    "faststream.asgi",
+    "faststream.specification.asyncapi.v2_6_0",
+    "faststream.specification.asyncapi.v3_0_0",
+    "opentelemetry",
+    "prometheus_client",
+    "uvicorn",
+    "email_validator",
+)
+
+CASES: dict[str, tuple[str, tuple[str, ...]]] = {
+    "faststream": (
+        "import faststream",
+        ("fast_depends", "pydantic", *LAZY_MODULES),
+    ),
+    "app": (
+        "from faststream import FastStream",
+        LAZY_MODULES,
+    ),
+    "cli": (
+        "import faststream._internal.cli.main",
+        LAZY_MODULES,
+    ),
+    **{
+        name: (f"from faststream.{name} import {broker}", LAZY_MODULES)
+        for name, broker in (
+            ("kafka", "KafkaBroker"),
+            ("confluent", "KafkaBroker"),
+            ("rabbit", "RabbitBroker"),
+            ("nats", "NatsBroker"),
+            ("redis", "RedisBroker"),
+        )
+    },
+}
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed * 1000)
+print(",".join(m for m in {lazy!r} if m in sys.modules))
+"""
+
+
+def measure(statement: str, lazy: tuple[str, ...]) -> tuple[float, list[str]]:
+    """Return the best import time in milliseconds and loaded lazy modules."""
+    best = float("inf")
+    loaded: list[str] = []
+
+    for _ in range(REPEAT):
+        result = subprocess.run(  # noqa: S603
+            (sys.executable, "-c", SCRIPT.format(statement=statement, lazy=lazy)),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        elapsed, modules = result.stdout.splitlines()
+        best = min(best, float(elapsed))
+        loaded = modules.split(",") if modules else []
+
+    return best, loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="fail if modules expected to be lazy are imported",
+    )
+    args = parser.parse_args()
+
+    print(f"{'case':<12}{'ms':>10}  eagerly imported")
+
+    failed = False
+    for name, (statement, lazy) in CASES.items():
+        try:
+            elapsed, loaded = measure(statement, lazy)
+        except subprocess.CalledProcessError:
+            # optional broker dependency is not installed
+            print(f"{name:<12}{'-':>10}")
+            continue
+
+        print(f"{name:<12}{elapsed:>10.1f}  {', '.join(loaded)}")
+        failed = failed or bool(loaded)
+
+    if args.check and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
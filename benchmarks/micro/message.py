@@ -0,0 +1,100 @@
+"""StreamMessage allocations microbenchmark.
+
+Compares the current slotted `StreamMessage` with the previous dict-based
+layout, which eagerly built headers/path collections, the decode cache
+and a random correlation id for each message.
+
+Usage:
+    python -m benchmarks.micro.message
+"""
+
+import gc
+import timeit
+import tracemalloc
+from typing import Any
+from uuid import uuid4
+
+from faststream.message import SourceType, StreamMessage
+
+MESSAGES = 100_000
+
+
+class LegacyStreamMessage:
+    """Previous `StreamMessage.__init__` layout to compare with."""
+
+    def __init__(
+        self,
+        raw_message: Any,
+        body: Any,
+        *,
+        headers: dict[str, Any] | None = None,
+        reply_to: str = "",
+        batch_headers: list[dict[str, Any]] | None = None,
+        path: dict[str, Any] | None = None,
+        content_type: str | None = None,
+        correlation_id: str | None = None,
+        message_id: str | None = None,
+        source_type: SourceType = SourceType.CONSUME,
+    ) -> None:
+        self.raw_message = raw_message
+        self.body = body
+        self.reply_to = reply_to
+        self.content_type = content_type
+        self.source_type = source_type
+
+        self.headers = headers or {}
+        self.batch_headers = batch_headers or []
+        self.path = path or {}
+        self.correlation_id = correlation_id or str(uuid4())
+        self.message_id = message_id or self.correlation_id
+
+        self.committed = None
+        self.processed = False
+
+        self.__decoder = None
+        self.__decoded_caches: dict[Any, Any] = {}
+
+
+def measure_allocations(msg_cls: type[Any], number: int = MESSAGES) -> tuple[int, int]:
+    """Return (allocated blocks, allocated bytes) per message."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    messages = [msg_cls(None, b"") for _ in range(number)]
+
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    blocks = sum(s.count_diff for s in stats)
+    size = sum(s.size_diff for s in stats)
+
+    # list itself is allocated by the benchmark
+    blocks -= 1
+    size -= messages.__sizeof__()
+
+    del messages
+    return blocks // number, size // number
+
+
+def measure_time(msg_cls: type[Any], number: int = MESSAGES) -> float:
+    """Return construction time per message in microseconds."""
+    timer = timeit.Timer(lambda: msg_cls(None, b""))
+    return min(timer.repeat(repeat=5, number=number)) / number * 1_000_000
+
+
+def main() -> None:
+    print(f"{'layout':<10}{'blocks/msg':>12}{'bytes/msg':>12}{'us/msg':>10}")
+
+    for name, msg_cls in (
+        ("legacy", LegacyStreamMessage),
+        ("slotted", StreamMessage),
+    ):
+        blocks, size = measure_allocations(msg_cls)
+        elapsed = measure_time(msg_cls)
+        print(f"{name:<10}{blocks:>12}{size:>12}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,20 @@
 """A Python framework for building services interacting with Apache Kafka, RabbitMQ, NATS and Redis."""
 
-from faststream._internal.testing.app import TestApp
-from faststream._internal.utils import apply_types
-from faststream.annotations import ContextRepo, Logger
-from faststream.app import FastStream
-from faststream.message import SourceType, StreamMessage
-from faststream.middlewares import AckPolicy, BaseMiddleware, ExceptionMiddleware
-from faststream.params import Context, Depends, Header, NoCast, Path
-from faststream.response import PublishCommand, PublishType, Response
-from faststream.specification import AsyncAPI
+from typing import TYPE_CHECKING
+
+from faststream._internal.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from faststream._internal.endpoint.subscriber.batching import MicroBatch
+    from faststream._internal.testing.app import TestApp
+    from faststream._internal.utils import apply_types
+    from faststream.annotations import ContextRepo, Logger
+    from faststream.app import FastStream
+    from faststream.message import SourceType, StreamMessage
+    from faststream.middlewares import AckPolicy, BaseMiddleware, ExceptionMiddleware
+    from faststream.params import Context, Depends, Header, NoCast, Path
+    from faststream.response import PublishCommand, PublishType, Response
+    from faststream.specification import AsyncAPI
 
 __all__ = (
     "AckPolicy",
@@ -21,6 +27,7 @@ __all__ = (
     "FastStream",
     "Header",
     "Logger",
+    "MicroBatch",
     "NoCast",
     "Path",
     "PublishCommand",
@@ -31,3 +38,29 @@ __all__ = (
     "TestApp",
     "apply_types",
 )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "MicroBatch": "faststream._internal.endpoint.subscriber.batching",
+        "TestApp": "faststream._internal.testing.app",
+        "apply_types": "faststream._internal.utils",
+        "ContextRepo": "faststream.annotations",
+        "Logger": "faststream.annotations",
+        "FastStream": "faststream.app",
+        "SourceType": "faststream.message",
+        "StreamMessage": "faststream.message",
+        "AckPolicy": "faststream.middlewares",
+        "BaseMiddleware": "faststream.middlewares",
+        "ExceptionMiddleware": "faststream.middlewares",
+        "Context": "faststream.params",
+        "Depends": "faststream.params",
+        "Header": "faststream.params",
+        "NoCast": "faststream.params",
+        "Path": "faststream.params",
+        "PublishCommand": "faststream.response",
+        "PublishType": "faststream.response",
+        "Response": "faststream.response",
+        "AsyncAPI": "faststream.specification",
+    },
+)
@@ -180,9 +180,8 @@ else:
     from exceptiongroup import ExceptionGroup
 
 try:
-    import email_validator
-
-    if email_validator is None:
+    # check availability without import, pydantic imports it by validation
+    if find_spec("email_validator") is None:
         raise ImportError
     from pydantic import EmailStr
 except ImportError:  # pragma: no cover
@@ -250,13 +249,4 @@ except ImportError:  # pragma: no cover
             return with_info_plain_validator_function(cls._validate)
 
 
-uvicorn: Any
-
-try:
-    import uvicorn
-
-    HAS_UVICORN = True
-
-except ImportError:
-    uvicorn = None
-    HAS_UVICORN = False
+HAS_UVICORN = find_spec("uvicorn") is not None
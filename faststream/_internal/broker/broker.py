@@ -1,5 +1,8 @@
+import asyncio
+import logging
+import time
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import Awaitable, Iterable, Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -16,6 +19,7 @@ from faststream._internal.types import (
     ConnectionType,
     MsgType,
 )
+from faststream.exceptions import SetupError
 
 from .pub_base import BrokerPublishMixin
 from .registrator import Registrator
@@ -25,6 +29,7 @@ if TYPE_CHECKING:
 
     from faststream._internal.context.repository import ContextRepo
     from faststream._internal.di import FastDependsConfig
+    from faststream._internal.endpoint.subscriber import SubscriberUsecase
     from faststream._internal.producer import ProducerProto
     from faststream.specification.schema import BrokerSpec
 
@@ -49,6 +54,10 @@ class BrokerUsecase(
         routers: Sequence["Registrator[MsgType]"],
         **connection_kwargs: Any,
     ) -> None:
+        if config.start_concurrency < 1:
+            msg = "`start_concurrency` should be greater than 0."
+            raise SetupError(msg)
+
         super().__init__(
             routers=routers,
             config=config,
@@ -96,14 +105,54 @@ class BrokerUsecase(
         self._setup_logger()
 
         # TODO: filter by already running handlers after TestClient refactor
-        for sub in self.subscribers:
-            await sub.start()
+        await self._run_concurrently(
+            self._start_subscriber(sub) for sub in self.subscribers
+        )
 
-        for pub in self.publishers:
-            await pub.start()
+        await self._run_concurrently(pub.start() for pub in self.publishers)
 
         self.running = True
 
+    async def _start_subscriber(self, sub: "SubscriberUsecase[Any]") -> None:
+        started_at = time.perf_counter()
+        await sub.start()
+        sub._log(
+            logging.DEBUG,
+            f"`{sub.specification.call_name}` started in {time.perf_counter() - started_at:.3f}s",
+            extra=sub.get_log_context(None),
+        )
+
+    async def _stop_subscriber(self, sub: "SubscriberUsecase[Any]") -> None:
+        started_at = time.perf_counter()
+        await sub.stop()
+        sub._log(
+            logging.DEBUG,
+            f"`{sub.specification.call_name}` stopped in {time.perf_counter() - started_at:.3f}s",
+            extra=sub.get_log_context(None),
+        )
+
+    async def _run_concurrently(self, calls: Iterable[Awaitable[None]]) -> None:
+        """Await calls limited by `start_concurrency` at the same time.
+
+        All calls are completed even if some of them fail, then the first error is raised.
+        """
+        if (limit := self.config.start_concurrency) <= 1:
+            for call in calls:
+                await call
+            return
+
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(call: Awaitable[None]) -> None:
+            async with semaphore:
+                await call
+
+        results = await asyncio.gather(*map(run, calls), return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
     def _setup_logger(self) -> None:
         for sub in self.subscribers:
             log_context = sub.get_log_context(None)
@@ -129,8 +178,9 @@ class BrokerUsecase(
         exc_tb: Optional["TracebackType"] = None,
     ) -> None:
         """Closes the object."""
-        for sub in self.subscribers:
-            await sub.stop()
+        await self._run_concurrently(
+            self._stop_subscriber(sub) for sub in self.subscribers
+        )
 
         self.running = False
 
@@ -7,18 +7,10 @@ from pprint import pformat
 from typing import TYPE_CHECKING, cast
 
 import typer
-from pydantic import ValidationError
 
 from faststream._internal._compat import json_dumps, model_parse
 from faststream._internal.cli.utils.imports import import_from_string
 from faststream.exceptions import INSTALL_WATCHFILES, INSTALL_YAML, SCHEMA_NOT_SUPPORTED
-from faststream.specification.asyncapi.site import serve_app
-from faststream.specification.asyncapi.v2_6_0.schema import (
-    ApplicationSchema as SchemaV2_6,
-)
-from faststream.specification.asyncapi.v3_0_0.schema import (
-    ApplicationSchema as SchemaV3,
-)
 
 from .options import (
     APP_ARGUMENT,
@@ -169,6 +161,17 @@ def _parse_and_serve(
     port: int = 8000,
     is_factory: bool = False,
 ) -> None:
+    # specification models are imported lazily to not slow down the CLI startup
+    from pydantic import ValidationError
+
+    from faststream.specification.asyncapi.site import serve_app
+    from faststream.specification.asyncapi.v2_6_0.schema import (
+        ApplicationSchema as SchemaV2_6,
+    )
+    from faststream.specification.asyncapi.v3_0_0.schema import (
+        ApplicationSchema as SchemaV3,
+    )
+
     if ":" in docs:
         _, app_obj = import_from_string(docs, is_factory=is_factory)
         schema_factory = cast(
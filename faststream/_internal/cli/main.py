@@ -12,7 +12,6 @@ from faststream import FastStream
 from faststream.__about__ import __version__
 from faststream._internal._compat import IS_WINDOWS, json_loads
 from faststream._internal.application import Application
-from faststream.asgi import AsgiFastStream
 from faststream.exceptions import INSTALL_WATCHFILES, SetupError, StartupValidationError
 
 from .docs import docs_app
@@ -152,6 +151,9 @@ def run(
             ).run()
 
     elif workers > 1:
+        # imported lazily to not slow down the CLI startup
+        from faststream.asgi import AsgiFastStream
+
         if isinstance(app_obj, FastStream):
             from faststream._internal.cli.supervisors.multiprocess import Multiprocess
 
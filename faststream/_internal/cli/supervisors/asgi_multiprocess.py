@@ -2,15 +2,16 @@ import inspect
 from pathlib import Path
 from typing import Any
 
-from faststream._internal._compat import HAS_UVICORN, uvicorn
+from faststream._internal._compat import HAS_UVICORN
 from faststream._internal.basic_types import SettingField
 from faststream.asgi.app import cast_uvicorn_params
 from faststream.exceptions import INSTALL_UVICORN
 
 if HAS_UVICORN:
+    import uvicorn
     from uvicorn.supervisors.multiprocess import Multiprocess, Process
 
-    class UvicornExtraConfig(uvicorn.Config):  # type: ignore[misc]
+    class UvicornExtraConfig(uvicorn.Config):
         def __init__(
             self,
             run_extra_options: dict[str, "SettingField"],
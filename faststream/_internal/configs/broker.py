@@ -7,11 +7,13 @@ from typing_extensions import TypeVar as TypeVar313
 from faststream._internal.di import FastDependsConfig
 from faststream._internal.logger import LoggerState
 from faststream._internal.producer import ProducerProto, ProducerUnset
+from faststream.message.utils import gen_cor_id
 
 if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
     from faststream._internal.types import BrokerMiddleware, CustomCallable
+    from faststream.message.utils import IdGenerator
 
 
 @dataclass(kw_only=True)
@@ -26,10 +28,12 @@ class BrokerConfig:
     producer: "ProducerProto[Any]" = field(default_factory=ProducerUnset)
     logger: "LoggerState" = field(default_factory=LoggerState)
     fd_config: "FastDependsConfig" = field(default_factory=FastDependsConfig)
+    id_generator: "IdGenerator" = gen_cor_id
 
     # subscriber options
     broker_dependencies: Iterable["Dependant"] = ()
     graceful_timeout: float | None = None
+    start_concurrency: int = 1
     extra_context: dict[str, Any] = field(default_factory=dict)
 
     def __repr__(self) -> str:
@@ -95,6 +99,14 @@ class ConfigComposition(Generic[BrokerConfigType]):
     def graceful_timeout(self) -> float | None:
         return self.broker_config.graceful_timeout
 
+    @property
+    def id_generator(self) -> "IdGenerator":
+        return self.broker_config.id_generator
+
+    @property
+    def start_concurrency(self) -> int:
+        return self.broker_config.start_concurrency
+
     def add_middleware(self, middleware: "BrokerMiddleware[Any]") -> None:
         self.broker_config.add_middleware(middleware)
 
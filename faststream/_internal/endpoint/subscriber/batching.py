@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING, Any
+
+from faststream.exceptions import SetupError
+from faststream.message import BatchStreamMessage
+
+if TYPE_CHECKING:
+    from faststream._internal.basic_types import DecodedMessage
+    from faststream._internal.types import AsyncCallable
+    from faststream.message import StreamMessage
+
+
+class MicroBatch:
+    """A class to represent subscriber micro-batching options.
+
+    Messages are collected to a batch and passed to the handler as a list
+    by a single call. Batch is flushed by any of the following limits.
+
+    Args:
+        max_size (int): Maximum messages number in the batch (default is `100`).
+        max_bytes (:obj:`int`, optional): Maximum summary size of messages bodies in
+            the batch. Batch is flushed by the message exceeds the limit (default is `None`).
+        max_latency (float): Maximum time to wait for the batch to be filled since
+            the first message received in seconds (default is `0.1`).
+    """
+
+    __slots__ = (
+        "max_bytes",
+        "max_latency",
+        "max_size",
+    )
+
+    def __init__(
+        self,
+        max_size: int = 100,
+        max_bytes: int | None = None,
+        max_latency: float = 0.1,
+    ) -> None:
+        if max_size < 1:
+            msg = "`max_size` should be greater than 0."
+            raise SetupError(msg)
+
+        if max_bytes is not None and max_bytes < 1:
+            msg = "`max_bytes` should be greater than 0."
+            raise SetupError(msg)
+
+        if max_latency <= 0:
+            msg = "`max_latency` should be greater than 0."
+            raise SetupError(msg)
+
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.max_latency = max_latency
+
+
+class BatchParser:
+    """Parse collected raw messages batch using the subscriber single message parser."""
+
+    __slots__ = ("decoder", "parser")
+
+    def __init__(
+        self,
+        parser: "AsyncCallable",
+        decoder: "AsyncCallable",
+    ) -> None:
+        self.parser = parser
+        self.decoder = decoder
+
+    async def parse_message(self, message: Any) -> BatchStreamMessage[Any]:
+        # single messages come from `get_one`, iterator and TestClient
+        raw_messages = message if isinstance(message, tuple) else (message,)
+
+        messages: list[StreamMessage[Any]] = []
+        for raw in raw_messages:
+            msg = await self.parser(raw)
+            msg.set_decoder(self.decoder)
+            messages.append(msg)
+
+        return BatchStreamMessage(raw_messages, messages)
+
+    async def decode_message(
+        self,
+        msg: "StreamMessage[Any]",
+    ) -> "DecodedMessage":
+        assert isinstance(msg, BatchStreamMessage)
+        return [await m.decode() for m in msg.messages]
@@ -2,7 +2,7 @@ from collections import UserList
 from collections.abc import Iterable, Reversible, Sequence
 from functools import partial
 from inspect import unwrap
-from itertools import chain
+from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -11,8 +11,10 @@ from typing import (
     cast,
 )
 
+from faststream._internal.endpoint.subscriber.utils import default_filter
 from faststream._internal.types import MsgType
 from faststream.exceptions import IgnoredException, SetupError
+from faststream.filters import MessageFilter
 from faststream.specification.asyncapi.utils import to_camelcase
 
 if TYPE_CHECKING:
@@ -34,6 +36,7 @@ class HandlerItem(Generic[MsgType]):
     """A class representing handler overloaded item."""
 
     __slots__ = (
+        "_compiled_call",
         "dependant",
         "dependencies",
         "filter",
@@ -62,6 +65,7 @@ class HandlerItem(Generic[MsgType]):
         self.item_middlewares = item_middlewares
         self.dependencies = dependencies
         self.dependant = None
+        self._compiled_call: AsyncFuncAny | None = None
 
     def __repr__(self) -> str:
         filter_call = unwrap(self.filter)
@@ -87,6 +91,12 @@ class HandlerItem(Generic[MsgType]):
                 config=config,
             )
 
+            # item middlewares are static, so we can wrap the handler once
+            call: AsyncFuncAny = self.handler.call_wrapped
+            for middleware in self.item_middlewares[::-1]:
+                call = cast("AsyncFuncAny", partial(middleware, call))
+            self._compiled_call = call
+
     @property
     def name(self) -> str:
         """Returns the name of the original call."""
@@ -137,9 +147,11 @@ class HandlerItem(Generic[MsgType]):
         _extra_middlewares: Iterable["SubscriberMiddleware[Any]"],
     ) -> Any:
         """Execute wrapped handler with consume middlewares."""
-        call: AsyncFuncAny = self.handler.call_wrapped
+        if (call := self._compiled_call) is None:
+            error_msg = "You should setup `HandlerItem` at first."
+            raise SetupError(error_msg)
 
-        for middleware in chain(self.item_middlewares[::-1], _extra_middlewares):
+        for middleware in _extra_middlewares:
             call = partial(middleware, call)
 
         try:
@@ -158,9 +170,152 @@ class HandlerItem(Generic[MsgType]):
             return result
 
 
+class _HandlersIndex(Generic[MsgType]):
+    """Hash index to select handlers by declarative filters values."""
+
+    __slots__ = ("decoder", "dimensions", "fallback", "parser")
+
+    def __init__(
+        self,
+        handlers: Sequence[HandlerItem[MsgType]],
+        *,
+        parser: "AsyncCallable",
+        decoder: "AsyncCallable",
+    ) -> None:
+        self.parser = parser
+        self.decoder = decoder
+
+        # (position, handler, is already matched by index)
+        self.fallback: list[tuple[int, HandlerItem[MsgType], bool]] = []
+
+        dimensions: dict[
+            Any,
+            tuple[MessageFilter, dict[Any, list[tuple[int, HandlerItem[MsgType], bool]]]],
+        ] = {}
+
+        for position, h in enumerate(handlers):
+            if isinstance(h.filter, MessageFilter):
+                _, values = dimensions.setdefault(h.filter.index_key, (h.filter, {}))
+                values.setdefault(h.filter.value, []).append((position, h, True))
+            else:
+                self.fallback.append((position, h, False))
+
+        self.dimensions = tuple(dimensions.values())
+
+    @classmethod
+    def build(
+        cls,
+        handlers: Sequence[HandlerItem[MsgType]],
+    ) -> Optional["_HandlersIndex[MsgType]"]:
+        if sum(isinstance(h.filter, MessageFilter) for h in handlers) < 2:
+            return None
+
+        # index works only if all handlers parse message the same way
+        parsers = {id(h.item_parser) for h in handlers}
+        decoders = {id(h.item_decoder) for h in handlers}
+        if len(parsers) != 1 or len(decoders) != 1:
+            return None
+
+        parser, decoder = handlers[0].item_parser, handlers[0].item_decoder
+        if parser is None or decoder is None:
+            return None
+
+        return cls(
+            handlers,
+            parser=cast("AsyncCallable", parser),
+            decoder=cast("AsyncCallable", decoder),
+        )
+
+    async def find(
+        self,
+        msg: MsgType,
+        cache: dict[Any, Any],
+    ) -> tuple[HandlerItem[MsgType], "StreamMessage[MsgType]"] | None:
+        message = cache[self.parser] = cast(
+            "StreamMessage[MsgType]",
+            cache.get(self.parser) or await self.parser(msg),
+        )
+        message.set_decoder(self.decoder)
+
+        candidates = list(self.fallback)
+        for message_filter, values in self.dimensions:
+            try:
+                matched = values.get(await message_filter.extract(message))
+            except TypeError:  # unhashable value
+                matched = None
+
+            if matched:
+                candidates.extend(matched)
+
+        if len(self.dimensions) > 1 or self.fallback:
+            candidates.sort(key=itemgetter(0))
+
+        for _, h, is_matched in candidates:
+            if is_matched:
+                return h, message
+
+            if (suitable_message := await h.is_suitable(msg, cache)) is not None:
+                return h, suitable_message
+
+        return None
+
+
 class CallsCollection(UserList[HandlerItem[MsgType]]):
+    _index: _HandlersIndex[MsgType] | None = None
+    _single: tuple[HandlerItem[MsgType], "AsyncCallable", "AsyncCallable"] | None = None
+
     def add_call(self, call: "HandlerItem[MsgType]") -> None:
         self.data.append(call)
+        self._index = None
+        self._single = None
+
+    def compile(self) -> None:
+        """Build declarative filters index for already setup handlers."""
+        self._index = _HandlersIndex.build(self.data)
+        self._single = None
+
+        if len(self.data) == 1:
+            h = self.data[0]
+            if (
+                h.filter is default_filter
+                and h.item_parser is not None
+                and h.item_decoder is not None
+            ):
+                self._single = (
+                    h,
+                    cast("AsyncCallable", h.item_parser),
+                    cast("AsyncCallable", h.item_decoder),
+                )
+
+    async def find_handler(
+        self,
+        msg: MsgType,
+        cache: dict[Any, Any] | None = None,
+    ) -> tuple[HandlerItem[MsgType], "StreamMessage[MsgType]"] | None:
+        """Find the first handler suitable for the message."""
+        if self._single is not None:
+            # the only handler with the default filter: parse the message once
+            # and check it in place without the filter call and parsing cache
+            h, parser, decoder = self._single
+
+            parsed: StreamMessage[MsgType] = await parser(msg)
+            parsed.set_decoder(decoder)
+
+            if parsed.processed:
+                return None
+            return h, parsed
+
+        if cache is None:
+            cache = {}
+
+        if self._index is not None:
+            return await self._index.find(msg, cache)
+
+        for h in self.data:
+            if (message := await h.is_suitable(msg, cache)) is not None:
+                return h, message
+
+        return None
 
     @property
     def name(self) -> str | None:
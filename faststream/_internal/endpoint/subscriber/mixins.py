@@ -1,16 +1,26 @@
 import asyncio
-from collections.abc import Coroutine
-from typing import TYPE_CHECKING, Any, Generic
+import logging
+from abc import abstractmethod
+from collections.abc import Collection, Coroutine, Hashable
+from itertools import cycle
+from typing import TYPE_CHECKING, Any, Generic, Optional
 
 import anyio
 
 from faststream._internal.types import MsgType
 
+from .batching import BatchParser
+from .offsets import OffsetTracker
 from .usecase import SubscriberUsecase
 
 if TYPE_CHECKING:
     from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
+    from faststream._internal.types import AsyncCallable, OrderingKey
+
+    from .batching import MicroBatch
+    from .offsets import DeferredCommit
+
 
 class TasksMixin(SubscriberUsecase[Any]):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -39,15 +49,30 @@ class ConcurrentMixin(TasksMixin, Generic[MsgType]):
         self,
         *args: Any,
         max_workers: int,
+        ordering_key: Optional["OrderingKey[MsgType]"] = None,
+        queue_size: int | None = None,
         **kwargs: Any,
     ) -> None:
         self.max_workers = max_workers
+        self.ordering_key = ordering_key
 
         self.send_stream, self.receive_stream = anyio.create_memory_object_stream(
-            max_buffer_size=max_workers,
+            max_buffer_size=queue_size or max_workers,
         )
         self.limiter = anyio.Semaphore(max_workers)
 
+        # Worker lanes to keep the same key messages order
+        self._lanes: tuple[
+            tuple[MemoryObjectSendStream[MsgType], MemoryObjectReceiveStream[MsgType]],
+            ...,
+        ] = ()
+        if ordering_key is not None:
+            self._lanes = tuple(
+                anyio.create_memory_object_stream(max_buffer_size=1)
+                for _ in range(max_workers)
+            )
+        self._lanes_cycle = cycle(range(max_workers))
+
         super().__init__(*args, **kwargs)
 
     def start_consume_task(self) -> None:
@@ -61,8 +86,21 @@ class ConcurrentMixin(TasksMixin, Generic[MsgType]):
         Suitable to batch messages by amount, timestamps, etc and call `consume` for this batches.
         """
         async with anyio.create_task_group() as tg:
-            async for msg in self.receive_stream:
-                tg.start_soon(self._consume_msg, msg)
+            if self._lanes:
+                for _, receive_stream in self._lanes:
+                    tg.start_soon(self._serve_lane, receive_stream)
+
+            else:
+                async for msg in self.receive_stream:
+                    tg.start_soon(self._consume_msg, msg)
+
+    async def _serve_lane(
+        self,
+        receive_stream: "MemoryObjectReceiveStream[MsgType]",
+    ) -> None:
+        """Consume lane messages one by one to keep their order."""
+        async for msg in receive_stream:
+            await self.consume(msg)
 
     async def _consume_msg(self, msg: "MsgType") -> None:
         """Proxy method to call `self.consume` with semaphore block."""
@@ -71,5 +109,285 @@ class ConcurrentMixin(TasksMixin, Generic[MsgType]):
 
     async def _put_msg(self, msg: "MsgType") -> None:
         """Proxy method to put msg into in-memory queue with semaphore block."""
+        if self._lanes:
+            send_stream, _ = self._lanes[self._get_lane(msg)]
+            await send_stream.send(msg)
+            return
+
         async with self.limiter:
             await self.send_stream.send(msg)
+
+    def _get_lane(self, msg: "MsgType") -> int:
+        """Select worker lane by message ordering key hash.
+
+        Messages without key are distributed between lanes by round-robin.
+        """
+        assert self.ordering_key
+
+        try:
+            key = self.ordering_key(msg)
+        except Exception as e:
+            self._log(
+                logging.ERROR,
+                "Ordering key calculation failed, message is sent to a random lane",
+                exc_info=e,
+            )
+            key = None
+
+        if key is None:
+            return next(self._lanes_cycle)
+
+        return hash(key) % self.max_workers
+
+
+class BatchingMixin(ConcurrentMixin[MsgType]):
+    """Collect single messages from in-memory queue to batches.
+
+    Each batch is consumed by one handler call as a tuple of raw messages,
+    so the subscriber parser is replaced by `BatchParser` wrapping the original one.
+    Handlers custom parsers and decoders are applied to each batch message.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        micro_batch: "MicroBatch",
+        **kwargs: Any,
+    ) -> None:
+        self.max_size = micro_batch.max_size
+        self.max_bytes = micro_batch.max_bytes
+        self.max_latency = micro_batch.max_latency
+
+        # messages received by the collector, but not dispatched yet
+        self._collecting: list[MsgType] = []
+
+        super().__init__(*args, queue_size=micro_batch.max_size, **kwargs)
+
+        self._msg_parser, self._msg_decoder = self._parser, self._decoder
+        self._batch_parsers: dict[
+            tuple[int, int],
+            tuple[AsyncCallable, AsyncCallable],
+        ] = {}
+
+        parser = BatchParser(self._parser, self._decoder)
+        self._parser = parser.parse_message
+        self._decoder = parser.decode_message
+
+    def _build_fastdepends_model(self) -> None:
+        self._batch_parsers.clear()
+        super()._build_fastdepends_model()
+
+    def _get_message_parsers(self) -> tuple["AsyncCallable", "AsyncCallable"]:
+        return self._msg_parser, self._msg_decoder
+
+    def _wrap_call_parsers(
+        self,
+        parser: "AsyncCallable",
+        decoder: "AsyncCallable",
+    ) -> tuple["AsyncCallable", "AsyncCallable"]:
+        # share batch parsers between handlers to parse the batch once
+        key = (id(parser), id(decoder))
+        if (parsers := self._batch_parsers.get(key)) is None:
+            batch_parser = BatchParser(parser, decoder)
+            parsers = self._batch_parsers[key] = (
+                batch_parser.parse_message,
+                batch_parser.decode_message,
+            )
+        return parsers
+
+    @abstractmethod
+    def _get_msg_size(self, msg: "MsgType") -> int:
+        """Get message body size to limit batch by bytes."""
+        raise NotImplementedError
+
+    async def _return_msgs(self, msgs: list["MsgType"]) -> None:
+        """Return received, but not consumed at stop messages to the broker."""
+
+    async def stop(self) -> None:
+        tasks = tuple(self.tasks)
+        await super().stop()
+
+        # wait for the collector cancellation to get its not dispatched batch
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        pending, self._collecting = self._collecting, []
+        while True:
+            try:
+                pending.append(self.receive_stream.receive_nowait())
+            except (anyio.WouldBlock, anyio.EndOfStream):  # noqa: PERF203
+                break
+
+        if pending:
+            await self._return_msgs(pending)
+
+    async def _serve_consume_queue(
+        self,
+    ) -> None:
+        """Endless task collecting messages from in-memory queue to batches."""
+        async with anyio.create_task_group() as tg:
+            closed = False
+            while not closed:
+                try:
+                    first = await self.receive_stream.receive()
+                except anyio.EndOfStream:
+                    break
+
+                batch = self._collecting = [first]
+                size = self._get_msg_size(first) if self.max_bytes else 0
+                deadline = anyio.current_time() + self.max_latency
+
+                while len(batch) < self.max_size and (
+                    self.max_bytes is None or size < self.max_bytes
+                ):
+                    with anyio.move_on_after(deadline - anyio.current_time()):
+                        try:
+                            msg = await self.receive_stream.receive()
+                        except anyio.EndOfStream:
+                            # dispatch already collected messages
+                            closed = True
+                            break
+
+                        batch.append(msg)
+                        if self.max_bytes:
+                            size += self._get_msg_size(msg)
+                        continue
+
+                    break
+
+                # wait for a free worker to not collect batches unlimitedly
+                await self.limiter.acquire()
+                self._collecting = []
+                tg.start_soon(self._consume_batch, tuple(batch))
+
+    async def _consume_batch(self, batch: tuple["MsgType", ...]) -> None:
+        """Proxy method to call `self.consume` releasing the worker acquired by collector."""
+        try:
+            await self.consume(batch)
+        finally:
+            self.limiter.release()
+
+    async def _put_msg(self, msg: "MsgType") -> None:
+        """Proxy method to put msg into in-memory queue.
+
+        Queue is limited by batch size, so the next batch is collected
+        while workers are processing previous ones.
+        """
+        await self.send_stream.send(msg)
+
+
+class DeferredCommitMixin(TasksMixin, Generic[MsgType]):
+    """Commit processed messages offsets by batches.
+
+    Only contiguous processed offsets of each partition are committed, so messages
+    can be processed out of order. Subscriber should register received messages
+    by `_track_offset` in the receiving order.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        deferred_commit: "DeferredCommit",
+        **kwargs: Any,
+    ) -> None:
+        self.commit_max_messages = deferred_commit.max_messages
+        self.commit_interval = deferred_commit.interval_ms / 1000
+
+        self._offsets: OffsetTracker[Any] = OffsetTracker()
+        self._nacked: set[tuple[Hashable, int]] = set()
+        self._processed = 0
+
+        # created at start to be bound to the running event loop
+        self._commit_event: anyio.Event | None = None
+        self._commit_lock: anyio.Lock | None = None
+
+        super().__init__(*args, **kwargs)
+
+    @abstractmethod
+    def _get_offset(self, msg: "MsgType") -> tuple[Hashable, int]:
+        """Get message partition and offset."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _commit(self, offsets: dict[Any, int]) -> None:
+        """Commit partitions offsets by the consumer."""
+        raise NotImplementedError
+
+    def start_commit_task(self) -> None:
+        self._offsets = OffsetTracker()
+        self._nacked = set()
+        self._processed = 0
+
+        self._commit_event = anyio.Event()
+        self._commit_lock = anyio.Lock()
+
+        self.add_task(self._serve_commits())
+
+    async def stop(self) -> None:
+        # wait for processing messages to commit their offsets before consumer closing
+        await SubscriberUsecase.stop(self)
+        await self._commit_offsets()
+        await super().stop()
+
+    async def consume(self, msg: "MsgType") -> Any:
+        # do not mark skipped messages as processed
+        if not self.running:
+            return None
+
+        result = await super().consume(msg)
+
+        key = self._get_offset(msg)
+        if key in self._nacked:
+            # nacked message is received again after seek
+            self._nacked.discard(key)
+
+        else:
+            self._offsets.complete(*key)
+            self._processed += 1
+            if (
+                self._processed >= self.commit_max_messages
+                and self._commit_event is not None
+            ):
+                self._commit_event.set()
+
+        return result
+
+    def _track_offset(self, msg: "MsgType") -> None:
+        self._offsets.add(*self._get_offset(msg))
+
+    def _reset_offset(self, partition: Hashable, offset: int) -> None:
+        """Forget nacked message and all next partition ones to receive them again."""
+        self._nacked.add((partition, offset))
+        self._offsets.reset(partition, offset)
+
+    async def _serve_commits(self) -> None:
+        """Endless task committing processed offsets by timer or messages number."""
+        while True:
+            assert self._commit_event
+            with anyio.move_on_after(self.commit_interval):
+                await self._commit_event.wait()
+
+            self._commit_event = anyio.Event()
+            await self._commit_offsets()
+
+    async def _commit_offsets(self, partitions: Collection[Any] | None = None) -> None:
+        if self._commit_lock is None:  # subscriber was not started
+            return
+
+        async with self._commit_lock:
+            if not (offsets := self._offsets.committable(partitions)):
+                return
+
+            self._processed = 0
+
+            try:
+                await self._commit(offsets)
+
+            except Exception as e:
+                self._log(logging.ERROR, "Offsets commit failed", exc_info=e)
+
+            else:
+                self._offsets.mark_committed(offsets)
+
+    async def _revoke_partitions(self, partitions: Collection[Any]) -> None:
+        await self._commit_offsets(partitions)
+        self._offsets.remove(partitions)
@@ -0,0 +1,139 @@
+from collections import deque
+from collections.abc import Collection, Hashable, Iterable
+from typing import Generic, TypeVar
+
+from faststream.exceptions import SetupError
+
+PartitionT = TypeVar("PartitionT", bound=Hashable)
+
+
+class DeferredCommit:
+    """A class to represent Kafka subscriber deferred offsets commit options.
+
+    Processed messages offsets are committed by batches instead of a commit per
+    message. Only contiguous processed offsets of each partition are committed,
+    so messages can be processed concurrently without at-least-once guarantee loss.
+    Offsets are committed by any of the following limits, before partitions
+    revocation and at subscriber stop.
+
+    Args:
+        max_messages (int): Processed messages number to commit offsets (default is `100`).
+        interval_ms (int): Maximum time between offsets commits in milliseconds (default is `1000`).
+    """
+
+    __slots__ = (
+        "interval_ms",
+        "max_messages",
+    )
+
+    def __init__(
+        self,
+        max_messages: int = 100,
+        interval_ms: int = 1000,
+    ) -> None:
+        if max_messages < 1:
+            msg = "`max_messages` should be greater than 0."
+            raise SetupError(msg)
+
+        if interval_ms <= 0:
+            msg = "`interval_ms` should be greater than 0."
+            raise SetupError(msg)
+
+        self.max_messages = max_messages
+        self.interval_ms = interval_ms
+
+
+class _PartitionOffsets:
+    __slots__ = ("committed", "done", "pending", "position")
+
+    def __init__(self) -> None:
+        # offsets in the receiving order
+        self.pending: deque[int] = deque()
+        self.done: set[int] = set()
+        self.position: int | None = None
+        self.committed: int | None = None
+
+
+class OffsetTracker(Generic[PartitionT]):
+    """Track processed offsets to commit only contiguous ones.
+
+    Offsets are registered in the order they are received and can be completed
+    in any order. Commit position of a partition is the offset next to the last
+    one of the completed prefix, so a record is committed only after all previous
+    partition records are processed. Offsets gaps (compacted topics, transaction
+    markers) are not a problem, because only received offsets are tracked.
+    """
+
+    __slots__ = ("_partitions",)
+
+    def __init__(self) -> None:
+        self._partitions: dict[PartitionT, _PartitionOffsets] = {}
+
+    def add(self, partition: PartitionT, offset: int) -> None:
+        """Register received offset."""
+        if (state := self._partitions.get(partition)) is None:
+            state = self._partitions[partition] = _PartitionOffsets()
+        state.pending.append(offset)
+
+    def complete(self, partition: PartitionT, offset: int) -> None:
+        """Mark offset as processed."""
+        state = self._partitions.get(partition)
+
+        # ignore offsets of revoked partitions and already committed ones
+        if state is not None and state.pending and offset >= state.pending[0]:
+            state.done.add(offset)
+
+    def reset(self, partition: PartitionT, offset: int) -> None:
+        """Forget the offset and all next ones to receive them again after seek."""
+        if (state := self._partitions.get(partition)) is None:
+            return
+
+        while state.pending and state.pending[-1] >= offset:
+            state.pending.pop()
+
+        state.done = {o for o in state.done if o < offset}
+
+    def committable(
+        self,
+        partitions: Iterable[PartitionT] | None = None,
+    ) -> dict[PartitionT, int]:
+        """Get partitions commit positions changed since the last commit."""
+        offsets: dict[PartitionT, int] = {}
+
+        states: Iterable[tuple[PartitionT, _PartitionOffsets]]
+        if partitions is None:
+            states = self._partitions.items()
+        else:
+            states = (
+                (p, s) for p in partitions if (s := self._partitions.get(p)) is not None
+            )
+
+        for partition, state in states:
+            pending, done = state.pending, state.done
+
+            while pending and pending[0] in done:
+                offset = pending.popleft()
+                done.discard(offset)
+                state.position = offset + 1
+
+            if state.position is not None and state.position != state.committed:
+                offsets[partition] = state.position
+
+        return offsets
+
+    def mark_committed(self, offsets: dict[PartitionT, int]) -> None:
+        """Save successfully committed positions."""
+        for partition, offset in offsets.items():
+            if (state := self._partitions.get(partition)) is not None:
+                state.committed = offset
+
+    def pop(self, partitions: Collection[PartitionT]) -> dict[PartitionT, int]:
+        """Stop tracking revoked partitions and get their commit positions."""
+        offsets = self.committable(partitions)
+        self.remove(partitions)
+        return offsets
+
+    def remove(self, partitions: Iterable[PartitionT]) -> None:
+        """Stop tracking revoked partitions."""
+        for partition in partitions:
+            self._partitions.pop(partition, None)
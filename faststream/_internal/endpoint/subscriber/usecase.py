@@ -63,6 +63,13 @@ class _CallOptions(NamedTuple):
     dependencies: Iterable["Dependant"]
 
 
+class _Pipeline(NamedTuple):
+    """Frozen per-subscriber message processing options."""
+
+    middlewares: tuple["BrokerMiddleware[Any]", ...]
+    extra_context: tuple[tuple[str, Any], ...]
+
+
 class SubscriberUsecase(Endpoint, Generic[MsgType]):
     """A class representing an asynchronous handler."""
 
@@ -101,6 +108,8 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
 
         self.extra_watcher_options = {}
 
+        self._pipeline: _Pipeline | None = None
+
     @property
     def _broker_middlewares(self) -> Sequence["BrokerMiddleware[MsgType]"]:
         return self._outer_config.broker_middlewares
@@ -117,16 +126,34 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         )
 
     def _build_fastdepends_model(self) -> None:
+        # share compositions between handlers to parse message once
+        parsers: dict[int, AsyncCallable] = {}
+        decoders: dict[int, AsyncCallable] = {}
+
+        default_parser, default_decoder = self._get_message_parsers()
+
         for call in self.calls:
+            # use composed functions directly to not call them through the wrapper
             if parser := call.item_parser or self._outer_config.broker_parser:
-                async_parser: AsyncCallable = ParserComposition(parser, self._parser)
+                async_parser = parsers.get(id(parser)) or parsers.setdefault(
+                    id(parser),
+                    ParserComposition(parser, default_parser).wrapped_func,
+                )
             else:
-                async_parser = self._parser
+                async_parser = default_parser
 
             if decoder := call.item_decoder or self._outer_config.broker_decoder:
-                async_decoder: AsyncCallable = ParserComposition(decoder, self._decoder)
+                async_decoder = decoders.get(id(decoder)) or decoders.setdefault(
+                    id(decoder),
+                    ParserComposition(decoder, default_decoder).wrapped_func,
+                )
             else:
-                async_decoder = self._decoder
+                async_decoder = default_decoder
+
+            async_parser, async_decoder = self._wrap_call_parsers(
+                async_parser,
+                async_decoder,
+            )
 
             call._setup(
                 parser=async_parser,
@@ -138,7 +165,22 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
 
             call.handler.refresh(with_mock=False)
 
+        self.calls.compile()
+
+    def _get_message_parsers(self) -> tuple["AsyncCallable", "AsyncCallable"]:
+        """Get parser and decoder to compose the handlers custom ones with."""
+        return self._parser, self._decoder
+
+    def _wrap_call_parsers(
+        self,
+        parser: "AsyncCallable",
+        decoder: "AsyncCallable",
+    ) -> tuple["AsyncCallable", "AsyncCallable"]:
+        """Wrap handler composed parser and decoder before the handler setup."""
+        return parser, decoder
+
     def _post_start(self) -> None:
+        self._pipeline = self._compile_pipeline()
         self.running = True
 
     @abstractmethod
@@ -284,67 +326,64 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         """Execute all message processing stages."""
         context = self._outer_config.fd_config.context
         logger_state = self._outer_config.logger
+        pipeline = self._pipeline or self._compile_pipeline()
 
         async with AsyncExitStack() as stack:
             stack.enter_context(self.lock)
 
             # Enter context before middlewares
             stack.enter_context(context.scope("logger", logger_state.logger.logger))
-            for k, v in self._outer_config.extra_context.items():
+            for k, v in pipeline.extra_context:
                 stack.enter_context(context.scope(k, v))
 
             # enter all middlewares
             middlewares: list[BaseMiddleware] = []
-            for base_m in self.__build__middlewares_stack():
+            for base_m in pipeline.middlewares:
                 middleware = base_m(msg, context=context)
                 middlewares.append(middleware)
                 await middleware.__aenter__()
 
-            cache: dict[Any, Any] = {}
             parsing_error: Exception | None = None
-            for h in self.calls:
-                try:
-                    message = await h.is_suitable(msg, cache)
-                except Exception as e:
-                    parsing_error = e
-                    break
-
-                if message is not None:
-                    stack.enter_context(
-                        context.scope("log_context", self.get_log_context(message)),
+            try:
+                suitable = await self.calls.find_handler(msg)
+            except Exception as e:
+                parsing_error = e
+                suitable = None
+
+            if suitable is not None:
+                h, message = suitable
+
+                stack.enter_context(
+                    context.scope("log_context", self.get_log_context(message)),
+                )
+                stack.enter_context(context.scope("message", message))
+
+                # Middlewares should be exited before scope release
+                for m in middlewares:
+                    stack.push_async_exit(m.__aexit__)
+
+                result_msg = ensure_response(
+                    await h.call(
+                        message=message,
+                        # consumer middlewares
+                        _extra_middlewares=(m.consume_scope for m in middlewares[::-1]),
+                    ),
+                )
+
+                if not result_msg.correlation_id:
+                    result_msg.correlation_id = message.correlation_id
+
+                for p in chain(
+                    self.__get_response_publisher(message),
+                    h.handler._publishers,
+                ):
+                    await p._publish(
+                        result_msg.as_publish_command(),
+                        _extra_middlewares=(m.publish_scope for m in middlewares[::-1]),
                     )
-                    stack.enter_context(context.scope("message", message))
-
-                    # Middlewares should be exited before scope release
-                    for m in middlewares:
-                        stack.push_async_exit(m.__aexit__)
-
-                    result_msg = ensure_response(
-                        await h.call(
-                            message=message,
-                            # consumer middlewares
-                            _extra_middlewares=(
-                                m.consume_scope for m in middlewares[::-1]
-                            ),
-                        ),
-                    )
-
-                    if not result_msg.correlation_id:
-                        result_msg.correlation_id = message.correlation_id
 
-                    for p in chain(
-                        self.__get_response_publisher(message),
-                        h.handler._publishers,
-                    ):
-                        await p._publish(
-                            result_msg.as_publish_command(),
-                            _extra_middlewares=(
-                                m.publish_scope for m in middlewares[::-1]
-                            ),
-                        )
-
-                    # Return data for tests
-                    return result_msg
+                # Return data for tests
+                return result_msg
 
             # Suitable handler was not found or
             # parsing/decoding exception occurred
@@ -361,7 +400,12 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         # An error was raised and processed by some middleware
         return ensure_response(None)
 
-    def __build__middlewares_stack(self) -> tuple["BrokerMiddleware[MsgType]", ...]:
+    def _compile_pipeline(self) -> _Pipeline:
+        """Freeze middlewares and context options to reuse them for each message.
+
+        Broker, router and subscriber options are collected once at start,
+        so runtime changes take effect after the subscriber restart.
+        """
         logger_state = self._outer_config.logger
 
         if self.ack_policy is AckPolicy.MANUAL:
@@ -381,7 +425,10 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
                 *self._broker_middlewares,
             )
 
-        return broker_middlewares
+        return _Pipeline(
+            middlewares=broker_middlewares,
+            extra_context=tuple(self._outer_config.extra_context.items()),
+        )
 
     def __get_response_publisher(
         self,
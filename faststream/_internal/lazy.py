@@ -0,0 +1,40 @@
+"""PEP 562 module attributes imported on the first access.
+
+Public packages use it to not import all brokers, ASGI and observability
+dependencies at the package import time, which speeds up the CLI startup.
+This module should not import anything heavy itself.
+"""
+
+import sys
+from collections.abc import Callable, Mapping
+from importlib import import_module
+from typing import Any
+
+
+def lazy_attributes(
+    module_name: str,
+    attributes: Mapping[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Make module `__getattr__` and `__dir__` functions for lazy attributes.
+
+    Args:
+        module_name: The module `__name__` to make attributes for.
+        attributes: Attribute names mapping to the modules to import them from.
+            Relative modules are resolved from the `module_name` package.
+    """
+
+    def module_getattr(name: str) -> Any:
+        if (module_path := attributes.get(name)) is None:
+            msg = f"module {module_name!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+
+        value = getattr(import_module(module_path, module_name), name)
+
+        # cache the attribute to not call `__getattr__` again
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted({*vars(sys.modules[module_name]), *attributes})
+
+    return module_getattr, module_dir
@@ -1,4 +1,4 @@
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Hashable
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -42,6 +42,8 @@ SyncFilter: TypeAlias = Callable[[StreamMsg], bool]
 AsyncFilter: TypeAlias = Callable[[StreamMsg], Awaitable[bool]]
 Filter: TypeAlias = SyncFilter[StreamMsg] | AsyncFilter[StreamMsg]
 
+OrderingKey: TypeAlias = Callable[[MsgType], Hashable | None]
+
 SyncCallable: TypeAlias = Callable[
     [Any],
     Any,
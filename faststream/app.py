@@ -20,7 +20,6 @@ from faststream._internal.constants import EMPTY
 from faststream._internal.context import ContextRepo
 from faststream._internal.di import FastDependsConfig
 from faststream._internal.logger import logger
-from faststream.asgi.app import AsgiFastStream
 
 if TYPE_CHECKING:
     from fast_depends.library.serializer import SerializerProto
@@ -33,6 +32,7 @@ if TYPE_CHECKING:
     )
     from faststream._internal.broker import BrokerUsecase
     from faststream.asgi import AsyncAPIRoute
+    from faststream.asgi.app import AsgiFastStream
     from faststream.asgi.types import ASGIApp
     from faststream.specification.base import SpecificationFactory
 
@@ -107,7 +107,9 @@ class FastStream(Application):
         self,
         asgi_routes: Sequence[tuple[str, "ASGIApp"]] = (),
         asyncapi_path: Union[str, "AsyncAPIRoute", None] = None,
-    ) -> AsgiFastStream:
+    ) -> "AsgiFastStream":
+        from faststream.asgi.app import AsgiFastStream
+
         return AsgiFastStream.from_app(
             self,
             asgi_routes=asgi_routes,
@@ -1,7 +1,12 @@
-from .app import AsgiFastStream
-from .factories import AsyncAPIRoute, make_asyncapi_asgi, make_ping_asgi
-from .handlers import get
-from .response import AsgiResponse
+from typing import TYPE_CHECKING
+
+from faststream._internal.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .app import AsgiFastStream
+    from .factories import AsyncAPIRoute, make_asyncapi_asgi, make_ping_asgi
+    from .handlers import get
+    from .response import AsgiResponse
 
 __all__ = (
     "AsgiFastStream",
@@ -11,3 +16,15 @@ __all__ = (
     "make_asyncapi_asgi",
     "make_ping_asgi",
 )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AsgiFastStream": ".app",
+        "AsyncAPIRoute": ".factories",
+        "make_asyncapi_asgi": ".factories",
+        "make_ping_asgi": ".factories",
+        "get": ".handlers",
+        "AsgiResponse": ".response",
+    },
+)
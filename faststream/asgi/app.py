@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any, Optional, Protocol
 import anyio
 from fast_depends import Provider
 
-from faststream._internal._compat import HAS_TYPER, HAS_UVICORN, ExceptionGroup, uvicorn
+from faststream._internal._compat import HAS_TYPER, HAS_UVICORN, ExceptionGroup
 from faststream._internal.application import Application
 from faststream._internal.constants import EMPTY
 from faststream._internal.di import FastDependsConfig
@@ -182,17 +182,20 @@ class AsgiFastStream(Application):
         if not HAS_UVICORN:
             raise ImportError(INSTALL_UVICORN)
 
+        import uvicorn
+
         self._log_level = log_level
         self._run_extra_options = cast_uvicorn_params(run_extra_options or {})
 
+        config_params = set(inspect.signature(uvicorn.Config).parameters.keys())
+        extra_options: dict[str, Any] = {
+            key: v for key, v in self._run_extra_options.items() if key in config_params
+        }
+
         config = uvicorn.Config(
             app=self,
             log_level=self._log_level,
-            **{
-                key: v
-                for key, v in self._run_extra_options.items()
-                if key in set(inspect.signature(uvicorn.Config).parameters.keys())
-            },
+            **extra_options,
         )
 
         server = uvicorn.Server(config)
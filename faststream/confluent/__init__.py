@@ -1,21 +1,25 @@
-from faststream._internal.testing.app import TestApp
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+from faststream._internal.lazy import lazy_attributes
+
+if find_spec("confluent_kafka") is None:
+    from faststream.exceptions import INSTALL_FASTSTREAM_CONFLUENT
+
+    raise ImportError(INSTALL_FASTSTREAM_CONFLUENT)
+
+if TYPE_CHECKING:
+    from faststream._internal.endpoint.subscriber.offsets import DeferredCommit
+    from faststream._internal.testing.app import TestApp
 
-try:
     from .annotations import KafkaMessage
     from .broker import KafkaBroker, KafkaPublisher, KafkaRoute, KafkaRouter
     from .response import KafkaPublishCommand, KafkaResponse
     from .schemas import TopicPartition
     from .testing import TestKafkaBroker
 
-except ImportError as e:
-    if "'confluent_kafka'" not in e.msg:
-        raise
-
-    from faststream.exceptions import INSTALL_FASTSTREAM_CONFLUENT
-
-    raise ImportError(INSTALL_FASTSTREAM_CONFLUENT) from e
-
 __all__ = (
+    "DeferredCommit",
     "KafkaBroker",
     "KafkaMessage",
     "KafkaPublishCommand",
@@ -27,3 +31,20 @@ __all__ = (
     "TestKafkaBroker",
     "TopicPartition",
 )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DeferredCommit": "faststream._internal.endpoint.subscriber.offsets",
+        "TestApp": "faststream._internal.testing.app",
+        "KafkaMessage": ".annotations",
+        "KafkaBroker": ".broker",
+        "KafkaPublisher": ".broker",
+        "KafkaRoute": ".broker",
+        "KafkaRouter": ".broker",
+        "KafkaPublishCommand": ".response",
+        "KafkaResponse": ".response",
+        "TopicPartition": ".schemas",
+        "TestKafkaBroker": ".testing",
+    },
+)
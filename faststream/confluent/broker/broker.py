@@ -50,6 +50,7 @@ if TYPE_CHECKING:
     )
     from faststream.confluent.helpers.config import ConfluentConfig
     from faststream.confluent.message import KafkaMessage
+    from faststream.message import IdGenerator
     from faststream.security import BaseSecurity
     from faststream.specification.schema.extra import Tag, TagDict
 
@@ -92,6 +93,8 @@ class KafkaBroker(
         transaction_timeout_ms: int = 60 * 1000,
         # broker base args
         graceful_timeout: float | None = 15.0,
+        id_generator: "IdGenerator" = gen_cor_id,
+        start_concurrency: int = 1,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         dependencies: Iterable["Dependant"] = (),
@@ -195,6 +198,8 @@ class KafkaBroker(
             transactional_id: Transactional ID for the producer.
             transaction_timeout_ms: Transaction timeout in milliseconds.
             graceful_timeout: Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            id_generator: Function to generate `correlation_id` header of produced messages.
+            start_concurrency: Maximum number of subscribers started or stopped concurrently by the broker.
             decoder: Custom decoder object.
             parser: Custom parser object.
             dependencies: Dependencies to apply to all broker subscribers.
@@ -276,6 +281,8 @@ class KafkaBroker(
                 # subscriber args
                 graceful_timeout=graceful_timeout,
                 broker_dependencies=dependencies,
+                id_generator=id_generator,
+                start_concurrency=start_concurrency,
                 extra_context={
                     "broker": self,
                 },
@@ -398,7 +405,7 @@ class KafkaBroker(
             headers=headers,
             reply_to=reply_to,
             no_confirm=no_confirm,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self.config.id_generator(),
             _publish_type=PublishType.PUBLISH,
         )
         result: (
@@ -427,7 +434,7 @@ class KafkaBroker(
             timestamp_ms=timestamp_ms,
             headers=headers,
             timeout=timeout,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self.config.id_generator(),
             _publish_type=PublishType.REQUEST,
         )
 
@@ -457,7 +464,7 @@ class KafkaBroker(
             headers=headers,
             reply_to=reply_to,
             no_confirm=no_confirm,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self.config.id_generator(),
             _publish_type=PublishType.PUBLISH,
         )
 
@@ -24,9 +24,11 @@ from faststream.middlewares import AckPolicy
 if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
+    from faststream._internal.endpoint.subscriber.offsets import DeferredCommit
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        OrderingKey,
         PublisherMiddleware,
         SubscriberMiddleware,
     )
@@ -224,6 +226,8 @@ class KafkaRegistrator(
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: int | None = None,
+        ordering_key: Optional["OrderingKey[Message]"] = None,
+        deferred_commit: Optional["DeferredCommit"] = None,
     ) -> Union[
         "DefaultSubscriber",
         "BatchSubscriber",
@@ -287,6 +291,8 @@ class KafkaRegistrator(
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: int | None = None,
+        ordering_key: Optional["OrderingKey[Message]"] = None,
+        deferred_commit: Optional["DeferredCommit"] = None,
     ) -> Union[
         "DefaultSubscriber",
         "BatchSubscriber",
@@ -413,6 +419,10 @@ class KafkaRegistrator(
                 Uses decorated docstring as default.
             include_in_schema: Whether to include operation in Specification schema or not.
             max_workers: Number of workers to process messages concurrently.
+            ordering_key: Function to get a key from the raw message to process messages with the same key in order. Requires `max_workers` > 1.
+            deferred_commit: Commit processed offsets by batches instead of a commit per acknowledged message.
+                With `max_workers` > 1 messages are processed concurrently regardless of their partitions
+                and only contiguous processed offsets are committed. Requires manual commit mode.
 
         Returns:
             Union of DefaultSubscriber, BatchSubscriber, or ConcurrentDefaultSubscriber
@@ -423,6 +433,8 @@ class KafkaRegistrator(
         subscriber = create_subscriber(
             *topics,
             max_workers=workers,
+            ordering_key=ordering_key,
+            deferred_commit=deferred_commit,
             polling_interval=polling_interval,
             partitions=partitions,
             batch=batch,
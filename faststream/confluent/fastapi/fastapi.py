@@ -25,6 +25,7 @@ from faststream._internal.constants import EMPTY
 from faststream._internal.context import ContextRepo
 from faststream._internal.fastapi.router import StreamRouter
 from faststream.confluent.broker import KafkaBroker as KB
+from faststream.message import gen_cor_id
 from faststream.middlewares import AckPolicy
 
 if TYPE_CHECKING:
@@ -35,9 +36,11 @@ if TYPE_CHECKING:
     from starlette.types import ASGIApp, Lifespan
 
     from faststream._internal.basic_types import LoggerProto
+    from faststream._internal.endpoint.subscriber.offsets import DeferredCommit
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        OrderingKey,
         PublisherMiddleware,
         SubscriberMiddleware,
     )
@@ -53,6 +56,7 @@ if TYPE_CHECKING:
         ConcurrentDefaultSubscriber,
         DefaultSubscriber,
     )
+    from faststream.message import IdGenerator
     from faststream.security import BaseSecurity
     from faststream.specification.base import SpecificationFactory
     from faststream.specification.schema.extra import Tag, TagDict
@@ -94,6 +98,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         transaction_timeout_ms: int = 60 * 1000,
         # broker base args
         graceful_timeout: float | None = 15.0,
+        id_generator: "IdGenerator" = gen_cor_id,
+        start_concurrency: int = 1,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         middlewares: Sequence["BrokerMiddleware[Any, Any]"] = (),
@@ -217,6 +223,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             transactional_id: Transactional ID for the producer.
             transaction_timeout_ms: Transaction timeout in milliseconds.
             graceful_timeout: Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            id_generator: Function to generate `correlation_id` header of produced messages.
+            start_concurrency: Maximum number of subscribers started or stopped concurrently by the broker.
             decoder: Custom decoder object.
             parser: Custom parser object.
             middlewares: Middlewares to apply to all broker publishers/subscribers.
@@ -363,6 +371,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             transaction_timeout_ms=transaction_timeout_ms,
             # broker args
             graceful_timeout=graceful_timeout,
+            id_generator=id_generator,
+            start_concurrency=start_concurrency,
             decoder=decoder,
             parser=parser,
             middlewares=middlewares,
@@ -661,6 +671,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         response_model_exclude_defaults: bool = False,
         response_model_exclude_none: bool = False,
         max_workers: int = 1,
+        ordering_key: Optional["OrderingKey[Message]"] = None,
+        deferred_commit: Optional["DeferredCommit"] = None,
     ) -> Union["BatchSubscriber", "DefaultSubscriber", "ConcurrentDefaultSubscriber"]:
         """Create a subscriber for Kafka topics.
 
@@ -783,6 +795,10 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
                 Uses decorated docstring as default.
             include_in_schema: Whether to include operation in Specification schema or not.
             max_workers: Number of workers to process messages concurrently.
+            ordering_key: Function to get a key from the raw message to process messages with the same key in order. Requires `max_workers` > 1.
+            deferred_commit: Commit processed offsets by batches instead of a commit per acknowledged message.
+                With `max_workers` > 1 messages are processed concurrently regardless of their partitions
+                and only contiguous processed offsets are committed. Requires manual commit mode.
             response_model: The type to use for the response.
 
                 It could be any valid Pydantic *field* type. So, it doesn't have to
@@ -867,6 +883,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             *topics,
             polling_interval=polling_interval,
             max_workers=max_workers,
+            ordering_key=ordering_key,
+            deferred_commit=deferred_commit,
             partitions=partitions,
             group_id=group_id,
             group_instance_id=group_instance_id,
@@ -3,11 +3,18 @@ import logging
 from collections.abc import Callable, Sequence
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from itertools import count
 from time import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
-import anyio
-from confluent_kafka import Consumer, KafkaError, KafkaException, Message, Producer
+from confluent_kafka import (
+    Consumer,
+    KafkaError,
+    KafkaException,
+    Message,
+    Producer,
+    TopicPartition as ConfluentPartition,
+)
 
 from faststream._internal.utils.functions import call_or_await, run_in_executor
 from faststream.confluent.schemas import TopicPartition
@@ -25,7 +32,7 @@ if TYPE_CHECKING:
     class _SendKwargs(TypedDict):
         value: bytes | str | None
         key: bytes | str | None
-        headers: list[tuple[str, str | bytes]] | None
+        headers: list[tuple[str, str | bytes | None]] | None
         partition: NotRequired[int]
         timestamp: NotRequired[int]
         on_delivery: NotRequired[Callable[..., None]]
@@ -81,7 +88,7 @@ class AsyncConfluentProducer:
         kwargs: _SendKwargs = {
             "value": value,
             "key": key,
-            "headers": headers,
+            "headers": cast("list[tuple[str, str | bytes | None]] | None", headers),
         }
 
         if partition is not None:
@@ -123,19 +130,75 @@ class AsyncConfluentProducer:
         partition: int | None,
         no_confirm: bool = False,
     ) -> None:
-        """Sends a batch of messages to a Kafka topic."""
-        async with anyio.create_task_group() as tg:
-            for msg in batch._builder:
-                tg.start_soon(
-                    self.send,
-                    topic,
-                    msg["value"],
-                    msg["key"],
-                    partition,
-                    msg["timestamp_ms"],
-                    msg["headers"],
-                    no_confirm,
-                )
+        """Sends a batch of messages to a Kafka topic.
+
+        All messages are produced by a single synchronous loop and confirmed by
+        one aggregate future resolved by the last delivery callback.
+        """
+        if not (messages := batch._builder):
+            return
+
+        loop = asyncio.get_running_loop()
+        result_future: asyncio.Future[None] = loop.create_future()
+
+        total = len(messages)
+        delivered = count(1)
+        errors: list[KafkaError] = []
+
+        def ack_callback(err: Any, msg: Message | None) -> None:
+            if err or (msg is not None and (err := msg.error())):
+                errors.append(err)
+
+            # callbacks can be called by different threads, `next` is atomic
+            if next(delivered) == total:
+                if errors:
+                    loop.call_soon_threadsafe(
+                        _set_future_exception,
+                        result_future,
+                        KafkaException(errors[0]),
+                    )
+                else:
+                    loop.call_soon_threadsafe(_set_future_result, result_future)
+
+        kwargs: _SendKwargs = {
+            "value": None,
+            "key": None,
+            "headers": None,
+            "on_delivery": ack_callback,
+        }
+        if partition is not None:
+            kwargs["partition"] = partition
+
+        try:
+            # should be sync to prevent segfault
+            for msg in messages:
+                kwargs["value"] = msg["value"]
+                kwargs["key"] = msg["key"]
+                kwargs["headers"] = msg["headers"]
+                kwargs["timestamp"] = msg["timestamp_ms"]
+                self.producer.produce(topic, **kwargs)
+
+        except BaseException:
+            # the rest messages are not produced, so the batch is never confirmed
+            result_future.cancel()
+            raise
+
+        # serve already available delivery reports without blocking
+        self.producer.poll(0)
+
+        if no_confirm:
+            # nobody awaits the batch, so report delivery errors by the logger
+            result_future.add_done_callback(self._log_batch_error)
+        else:
+            await result_future
+
+    def _log_batch_error(self, future: "asyncio.Future[None]") -> None:
+        if not future.cancelled() and (exc := future.exception()) is not None:
+            self.logger_state.log(
+                "Batch delivery failed",
+                logging.ERROR,
+                exc_info=exc,
+            )
 
     async def ping(
         self,
@@ -191,12 +254,15 @@ class AsyncConfluentConsumer:
         connections_max_idle_ms: int = 540000,
         isolation_level: str = "read_uncommitted",
         allow_auto_create_topics: bool = True,
+        # rebalance callbacks
+        on_revoke: Callable[[Consumer, list[ConfluentPartition]], None] | None = None,
     ) -> None:
         self.admin_client = admin_service
         self.logger_state = logger
 
         self.topics = list(topics)
         self.partitions = partitions
+        self.on_revoke = on_revoke
 
         if not isinstance(partition_assignment_strategy, str):
             partition_assignment_strategy = ",".join(
@@ -266,11 +332,20 @@ class AsyncConfluentConsumer:
             )
 
         if self.topics:
-            await run_in_executor(
-                self._thread_pool,
-                self.consumer.subscribe,
-                topics=self.topics,
-            )
+            if self.on_revoke is not None:
+                await run_in_executor(
+                    self._thread_pool,
+                    self.consumer.subscribe,
+                    topics=self.topics,
+                    on_revoke=self.on_revoke,
+                )
+
+            else:
+                await run_in_executor(
+                    self._thread_pool,
+                    self.consumer.subscribe,
+                    topics=self.topics,
+                )
 
         elif self.partitions:
             await run_in_executor(
@@ -291,6 +366,15 @@ class AsyncConfluentConsumer:
             asynchronous=asynchronous,
         )
 
+    async def commit_offsets(self, offsets: Sequence[TopicPartition]) -> None:
+        """Commits the specified partitions offsets."""
+        await run_in_executor(
+            self._thread_pool,
+            self.consumer.commit,
+            offsets=[p.to_confluent() for p in offsets],
+            asynchronous=False,
+        )
+
     async def stop(self) -> None:
         """Stops the Kafka consumer and releases all resources."""
         # NOTE: If we don't explicitly call commit and then close the consumer, the confluent consumer gets stuck.
@@ -362,6 +446,16 @@ def check_msg_error(msg: Message | None) -> Message | None:
     return msg
 
 
+def _set_future_result(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _set_future_exception(future: "asyncio.Future[None]", exc: Exception) -> None:
+    if not future.done():
+        future.set_exception(exc)
+
+
 class BatchBuilder:
     """A helper class to build a batch of messages to send to Kafka."""
 
@@ -1,9 +1,10 @@
 import warnings
 from collections.abc import Iterable, Sequence
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from faststream._internal.constants import EMPTY
 from faststream._internal.endpoint.subscriber.call_item import CallsCollection
+from faststream._internal.endpoint.subscriber.offsets import DeferredCommit
 from faststream.exceptions import SetupError
 from faststream.middlewares import AckPolicy
 
@@ -12,10 +13,15 @@ from .specification import KafkaSubscriberSpecification
 from .usecase import (
     BatchSubscriber,
     ConcurrentDefaultSubscriber,
+    ConcurrentDeferredCommitSubscriber,
     DefaultSubscriber,
+    DeferredCommitSubscriber,
 )
 
 if TYPE_CHECKING:
+    from confluent_kafka import Message
+
+    from faststream._internal.types import OrderingKey
     from faststream.confluent.configs import KafkaBrokerConfig
     from faststream.confluent.schemas import TopicPartition
 
@@ -34,6 +40,8 @@ def create_subscriber(
     ack_policy: "AckPolicy",
     no_ack: bool,
     max_workers: int,
+    ordering_key: Optional["OrderingKey[Message]"],
+    deferred_commit: DeferredCommit | None,
     no_reply: bool,
     config: "KafkaBrokerConfig",
     # Specification args
@@ -49,6 +57,8 @@ def create_subscriber(
         no_ack=no_ack,
         auto_commit=auto_commit,
         max_workers=max_workers,
+        ordering_key=ordering_key,
+        deferred_commit=deferred_commit,
     )
 
     subscriber_config = KafkaSubscriberConfig(
@@ -88,11 +98,30 @@ def create_subscriber(
         )
 
     if max_workers > 1:
+        if deferred_commit is not None:
+            return ConcurrentDeferredCommitSubscriber(
+                subscriber_config,
+                specification,
+                calls,
+                max_workers=max_workers,
+                ordering_key=ordering_key,
+                deferred_commit=deferred_commit,
+            )
+
         return ConcurrentDefaultSubscriber(
             subscriber_config,
             specification,
             calls,
             max_workers=max_workers,
+            ordering_key=ordering_key,
+        )
+
+    if deferred_commit is not None:
+        return DeferredCommitSubscriber(
+            subscriber_config,
+            specification,
+            calls,
+            deferred_commit=deferred_commit,
         )
 
     return DefaultSubscriber(subscriber_config, specification, calls)
@@ -104,6 +133,8 @@ def _validate_input_for_misconfigure(
     auto_commit: bool,
     no_ack: bool,
     max_workers: int,
+    ordering_key: Optional["OrderingKey[Message]"],
+    deferred_commit: DeferredCommit | None,
     group_id: str | None,
     partitions: Iterable["TopicPartition"],
 ) -> None:
@@ -140,6 +171,14 @@ def _validate_input_for_misconfigure(
         msg = "Max workers not work with manual commit mode."
         raise SetupError(msg)
 
+    if ordering_key is not None and max_workers <= 1:
+        msg = "The `ordering_key` option can be used only with `max_workers` > 1."
+        raise SetupError(msg)
+
+    if deferred_commit is not None and ack_policy is AckPolicy.ACK_FIRST:
+        msg = "The `deferred_commit` option can be used only with manual commit mode."
+        raise SetupError(msg)
+
     if not topics and not partitions:
         msg = "You should provide either `topics` or `partitions`."
         raise SetupError(msg)
@@ -1,6 +1,7 @@
+import asyncio
 import logging
 from abc import abstractmethod
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Callable, Hashable, Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -9,11 +10,20 @@ from typing import (
 )
 
 import anyio
-from confluent_kafka import KafkaException, Message
+from confluent_kafka import (
+    Consumer,
+    KafkaException,
+    Message,
+    TopicPartition as ConfluentPartition,
+)
 from typing_extensions import override
 
 from faststream._internal.endpoint.subscriber import SubscriberUsecase
-from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin, TasksMixin
+from faststream._internal.endpoint.subscriber.mixins import (
+    ConcurrentMixin,
+    DeferredCommitMixin,
+    TasksMixin,
+)
 from faststream._internal.endpoint.utils import process_msg
 from faststream._internal.types import MsgType
 from faststream.confluent.parser import AsyncConfluentParser
@@ -82,6 +92,7 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
             partitions=self.partitions,
             group_id=self.group_id,
             client_id=self.client_id,
+            on_revoke=self._make_revoke_callback(),
             **self.__connection_data,
         )
         self.parser._setup(consumer)
@@ -99,6 +110,11 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
             await self.consumer.stop()
             self.consumer = None
 
+    def _make_revoke_callback(
+        self,
+    ) -> Callable[[Consumer, list[ConfluentPartition]], None] | None:
+        return None
+
     @override
     async def get_one(
         self,
@@ -255,6 +271,95 @@ class ConcurrentDefaultSubscriber(ConcurrentMixin["Message"], DefaultSubscriber)
         await self._put_msg(msg)
 
 
+class DeferredCommitSubscriber(DeferredCommitMixin["Message"], DefaultSubscriber):
+    """Subscriber committing processed messages offsets by batches.
+
+    Acknowledged messages offsets are not committed one by one, but collected
+    and committed by timer or processed messages number.
+    """
+
+    async def start(self) -> None:
+        await super().start()
+
+        self.parser._setup(_TrackedConsumer(self))
+        self.start_commit_task()
+
+    def _make_revoke_callback(
+        self,
+    ) -> Callable[[Consumer, list[ConfluentPartition]], None]:
+        loop = asyncio.get_running_loop()
+
+        async def pop_offsets(
+            partitions: list[tuple[str, int]],
+        ) -> dict[tuple[str, int], int]:
+            return self._offsets.pop(partitions)
+
+        def on_revoke(consumer: Consumer, partitions: list[ConfluentPartition]) -> None:
+            # Callback is called by the consumer thread, so offsets are taken
+            # from the event loop and committed by the blocked consumer directly
+            revoked = [(p.topic, p.partition) for p in partitions]
+            offsets = asyncio.run_coroutine_threadsafe(
+                pop_offsets(revoked),
+                loop,
+            ).result()
+
+            if not offsets:
+                return
+
+            try:
+                consumer.commit(
+                    offsets=[
+                        ConfluentPartition(topic, partition, offset)
+                        for (topic, partition), offset in offsets.items()
+                    ],
+                    asynchronous=False,
+                )
+
+            except KafkaException as e:
+                self._log(logging.ERROR, "Offsets commit failed", exc_info=e)
+
+        return on_revoke
+
+    async def consume_one(self, msg: "Message") -> None:
+        self._track_offset(msg)
+        await self.consume(msg)
+
+    def _get_offset(self, msg: "Message") -> tuple[Hashable, int]:
+        return (msg.topic(), msg.partition()), cast("int", msg.offset())
+
+    async def _commit(self, offsets: dict[tuple[str, int], int]) -> None:
+        assert self.consumer, "You should start subscriber at first."
+        await self.consumer.commit_offsets([
+            TopicPartition(topic, partition, offset)
+            for (topic, partition), offset in offsets.items()
+        ])
+
+    async def _seek(self, topic: str, partition: int, offset: int) -> None:
+        self._reset_offset((topic, partition), offset)
+
+        if self.consumer is not None:
+            await self.consumer.seek(topic, partition, offset)
+
+
+class ConcurrentDeferredCommitSubscriber(
+    ConcurrentMixin["Message"],
+    DeferredCommitSubscriber,
+):
+    """Concurrent subscriber committing only contiguous processed offsets.
+
+    Messages are processed concurrently regardless of their partitions, and offsets
+    are committed by batches up to the contiguous processed messages of each partition.
+    """
+
+    async def start(self) -> None:
+        await super().start()
+        self.start_consume_task()
+
+    async def consume_one(self, msg: "Message") -> None:
+        self._track_offset(msg)
+        await self._put_msg(msg)
+
+
 class BatchSubscriber(LogicSubscriber[tuple[Message, ...]]):
     def __init__(
         self,
@@ -294,3 +399,18 @@ class BatchSubscriber(LogicSubscriber[tuple[Message, ...]]):
             topic=topic,
             group_id=self.group_id,
         )
+
+
+class _TrackedConsumer:
+    """Consumer proxy for subscribers committing processed offsets by themselves."""
+
+    __slots__ = ("subscriber",)
+
+    def __init__(self, subscriber: DeferredCommitSubscriber) -> None:
+        self.subscriber = subscriber
+
+    async def commit(self) -> None:
+        """Processed message offset is committed by the subscriber."""
+
+    async def seek(self, topic: str, partition: int, offset: int) -> None:
+        await self.subscriber._seek(topic, partition, offset)
@@ -25,6 +25,7 @@ if TYPE_CHECKING:
     from faststream.confluent.publisher.usecase import LogicPublisher
     from faststream.confluent.response import KafkaPublishCommand
     from faststream.confluent.subscriber.usecase import LogicSubscriber
+    from faststream.message import IdGenerator
 
 
 __all__ = ("TestKafkaBroker",)
@@ -126,6 +127,7 @@ class FakeProducer(AsyncConfluentFastProducer):
             correlation_id=cmd.correlation_id,
             reply_to=cmd.reply_to,
             serializer=self.broker.config.fd_config._serializer,
+            id_generator=self.broker.config.id_generator,
         )
 
         for handler in _find_handler(
@@ -155,6 +157,7 @@ class FakeProducer(AsyncConfluentFastProducer):
                     correlation_id=cmd.correlation_id,
                     reply_to=cmd.reply_to,
                     serializer=self.broker.config.fd_config._serializer,
+                    id_generator=self.broker.config.id_generator,
                 )
                 for message in cmd.batch_bodies
             )
@@ -177,6 +180,7 @@ class FakeProducer(AsyncConfluentFastProducer):
             headers=cmd.headers,
             correlation_id=cmd.correlation_id,
             serializer=self.broker.config.fd_config._serializer,
+            id_generator=self.broker.config.id_generator,
         )
 
         for handler in _find_handler(
@@ -207,8 +211,9 @@ class FakeProducer(AsyncConfluentFastProducer):
             topic=topic,
             message=result.body,
             headers=result.headers,
-            correlation_id=result.correlation_id or gen_cor_id(),
+            correlation_id=result.correlation_id,
             serializer=self.broker.config.fd_config._serializer,
+            id_generator=self.broker.config.id_generator,
         )
 
 
@@ -278,13 +283,14 @@ def build_message(
     headers: dict[str, str] | None = None,
     reply_to: str = "",
     serializer: Optional["SerializerProto"] = None,
+    id_generator: "IdGenerator" = gen_cor_id,
 ) -> MockConfluentMessage:
     """Build a mock confluent_kafka.Message for a sendable message."""
     msg, content_type = encode_message(message, serializer)
     k = key or b""
     headers = {
         "content-type": content_type or "",
-        "correlation_id": correlation_id or gen_cor_id(),
+        "correlation_id": correlation_id or id_generator(),
         "reply_to": reply_to,
         **(headers or {}),
     }
@@ -0,0 +1,106 @@
+from abc import abstractmethod
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from faststream.message import StreamMessage
+
+__all__ = (
+    "ContentTypeEquals",
+    "HeaderEquals",
+    "JsonFieldEquals",
+    "MessageFilter",
+)
+
+
+_MISSING: Any = object()
+
+
+class MessageFilter:
+    """Base class for declarative message filters.
+
+    Declarative filters compare one message attribute with a constant value.
+    Subscribers with many such filters compile them to a hash index,
+    so suitable handler lookup doesn't depend on the handlers number.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Hashable) -> None:
+        self.value = value
+
+    @property
+    @abstractmethod
+    def index_key(self) -> Hashable:
+        """Key of the message attribute the filter compares with."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def extract(self, msg: "StreamMessage[Any]") -> Any:
+        """Get the compared attribute value from the message."""
+        raise NotImplementedError
+
+    async def __call__(self, msg: "StreamMessage[Any]") -> bool:
+        return bool(await self.extract(msg) == self.value)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.value!r})"
+
+
+class HeaderEquals(MessageFilter):
+    """Filter messages with the header equals to the value."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str, value: Hashable) -> None:
+        super().__init__(value)
+        self.name = name
+
+    @property
+    def index_key(self) -> Hashable:
+        return ("header", self.name)
+
+    async def extract(self, msg: "StreamMessage[Any]") -> Any:
+        return msg.headers.get(self.name, _MISSING)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, {self.value!r})"
+
+
+class ContentTypeEquals(MessageFilter):
+    """Filter messages with the content-type equals to the value."""
+
+    __slots__ = ()
+
+    def __init__(self, value: str | None) -> None:
+        super().__init__(value)
+
+    @property
+    def index_key(self) -> Hashable:
+        return ("content_type",)
+
+    async def extract(self, msg: "StreamMessage[Any]") -> Any:
+        return msg.content_type
+
+
+class JsonFieldEquals(MessageFilter):
+    """Filter messages with the decoded body field equals to the value."""
+
+    __slots__ = ("field",)
+
+    def __init__(self, field: str, value: Hashable) -> None:
+        super().__init__(value)
+        self.field = field
+
+    @property
+    def index_key(self) -> Hashable:
+        return ("json", self.field)
+
+    async def extract(self, msg: "StreamMessage[Any]") -> Any:
+        body = await msg.decode()
+        if isinstance(body, dict):
+            return body.get(self.field, _MISSING)
+        return _MISSING
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.field!r}, {self.value!r})"
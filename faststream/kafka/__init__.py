@@ -1,24 +1,28 @@
-from faststream._internal.testing.app import TestApp
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
 
-try:
+from faststream._internal.lazy import lazy_attributes
+
+if find_spec("aiokafka") is None:
+    from faststream.exceptions import INSTALL_FASTSTREAM_KAFKA
+
+    raise ImportError(INSTALL_FASTSTREAM_KAFKA)
+
+if TYPE_CHECKING:
     from aiokafka import ConsumerRecord, TopicPartition
     from aiokafka.structs import RecordMetadata
 
+    from faststream._internal.endpoint.subscriber.offsets import DeferredCommit
+    from faststream._internal.testing.app import TestApp
+
     from .annotations import KafkaMessage
     from .broker import KafkaBroker, KafkaPublisher, KafkaRoute, KafkaRouter
     from .response import KafkaPublishCommand, KafkaResponse
     from .testing import TestKafkaBroker
 
-except ImportError as e:
-    if "'aiokafka'" not in e.msg:
-        raise
-
-    from faststream.exceptions import INSTALL_FASTSTREAM_KAFKA
-
-    raise ImportError(INSTALL_FASTSTREAM_KAFKA) from e
-
 __all__ = (
     "ConsumerRecord",
+    "DeferredCommit",
     "KafkaBroker",
     "KafkaMessage",
     "KafkaPublishCommand",
@@ -31,3 +35,22 @@ __all__ = (
     "TestKafkaBroker",
     "TopicPartition",
 )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DeferredCommit": "faststream._internal.endpoint.subscriber.offsets",
+        "TestApp": "faststream._internal.testing.app",
+        "ConsumerRecord": "aiokafka",
+        "TopicPartition": "aiokafka",
+        "RecordMetadata": "aiokafka.structs",
+        "KafkaMessage": ".annotations",
+        "KafkaBroker": ".broker",
+        "KafkaPublisher": ".broker",
+        "KafkaRoute": ".broker",
+        "KafkaRouter": ".broker",
+        "KafkaPublishCommand": ".response",
+        "KafkaResponse": ".response",
+        "TestKafkaBroker": ".testing",
+    },
+)
@@ -58,6 +58,7 @@ if TYPE_CHECKING:
         CustomCallable,
     )
     from faststream.kafka.message import KafkaMessage
+    from faststream.message import IdGenerator
     from faststream.security import BaseSecurity
     from faststream.specification.schema.extra import Tag, TagDict
 
@@ -212,6 +213,8 @@ class KafkaBroker(
         transaction_timeout_ms: int = 60 * 1000,
         # broker base args
         graceful_timeout: float | None = 15.0,
+        id_generator: "IdGenerator" = gen_cor_id,
+        start_concurrency: int = 1,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         dependencies: Iterable["Dependant"] = (),
@@ -308,6 +311,10 @@ class KafkaBroker(
                 Transaction timeout in milliseconds.
             graceful_timeout (Optional[float]):
                 Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            id_generator (IdGenerator):
+                Function to generate `correlation_id` header of produced records.
+            start_concurrency (int):
+                Maximum number of subscribers started or stopped concurrently by the broker.
             decoder (Optional[CustomCallable]):
                 Custom decoder object.
             parser (Optional[CustomCallable]):
@@ -418,6 +425,8 @@ class KafkaBroker(
                 # subscriber args
                 graceful_timeout=graceful_timeout,
                 broker_dependencies=dependencies,
+                id_generator=id_generator,
+                start_concurrency=start_concurrency,
                 extra_context={
                     "broker": self,
                 },
@@ -575,7 +584,7 @@ class KafkaBroker(
             headers=headers,
             reply_to=reply_to,
             no_confirm=no_confirm,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self.config.id_generator(),
             _publish_type=PublishType.PUBLISH,
         )
         return await super()._basic_publish(cmd, producer=self.config.producer)
@@ -625,7 +634,7 @@ class KafkaBroker(
             timestamp_ms=timestamp_ms,
             headers=headers,
             timeout=timeout,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self.config.id_generator(),
             _publish_type=PublishType.REQUEST,
         )
 
@@ -720,7 +729,7 @@ class KafkaBroker(
             headers=headers,
             reply_to=reply_to,
             no_confirm=no_confirm,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self.config.id_generator(),
             _publish_type=PublishType.PUBLISH,
         )
 
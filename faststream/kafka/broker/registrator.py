@@ -28,9 +28,11 @@ if TYPE_CHECKING:
     from aiokafka.coordinator.assignors.abstract import AbstractPartitionAssignor
     from fast_depends.dependencies import Dependant
 
+    from faststream._internal.endpoint.subscriber.offsets import DeferredCommit
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        OrderingKey,
         PublisherMiddleware,
         SubscriberMiddleware,
     )
@@ -42,6 +44,8 @@ if TYPE_CHECKING:
         BatchSubscriber,
         ConcurrentBetweenPartitionsSubscriber,
         ConcurrentDefaultSubscriber,
+        ConcurrentDeferredCommitSubscriber,
+        ConcurrentPartitionsSubscriber,
         DefaultSubscriber,
     )
 
@@ -113,6 +117,9 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordering_key: Optional["OrderingKey[ConsumerRecord]"] = None,
+        single_consumer: bool = False,
+        deferred_commit: Optional["DeferredCommit"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -180,6 +187,9 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordering_key: Optional["OrderingKey[ConsumerRecord]"] = None,
+        single_consumer: bool = False,
+        deferred_commit: Optional["DeferredCommit"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -190,6 +200,8 @@ class KafkaRegistrator(
         "DefaultSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentPartitionsSubscriber",
+        "ConcurrentDeferredCommitSubscriber",
     ]: ...
 
     @overload
@@ -251,6 +263,9 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int | None = 0,
+        ordering_key: Optional["OrderingKey[ConsumerRecord]"] = None,
+        single_consumer: bool = False,
+        deferred_commit: Optional["DeferredCommit"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -262,6 +277,8 @@ class KafkaRegistrator(
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentPartitionsSubscriber",
+        "ConcurrentDeferredCommitSubscriber",
     ]: ...
 
     @override
@@ -323,6 +340,9 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordering_key: Optional["OrderingKey[ConsumerRecord]"] = None,
+        single_consumer: bool = False,
+        deferred_commit: Optional["DeferredCommit"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -334,6 +354,8 @@ class KafkaRegistrator(
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentPartitionsSubscriber",
+        "ConcurrentDeferredCommitSubscriber",
     ]:
         """Create a subscriber for Kafka topics.
 
@@ -513,6 +535,13 @@ class KafkaRegistrator(
             decoder: Function to decode FastStream msg bytes body to python objects.
             middlewares: Subscriber middlewares to wrap incoming message processing.
             max_workers: Number of workers to process messages concurrently.
+            ordering_key: Function to get a key from the raw message to process messages with the same key in order. Requires `max_workers` > 1.
+            single_consumer: Whether to use a single consumer in the concurrent manual commit mode.
+                Records are processed concurrently between partitions and only contiguous
+                processed offsets are committed. Requires `max_workers` > 1.
+            deferred_commit: Commit processed offsets by batches instead of a commit per acknowledged record.
+                With `max_workers` > 1 records are processed concurrently regardless of their partitions
+                and only contiguous processed offsets are committed. Requires manual commit mode.
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy for the subscriber.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
@@ -527,6 +556,9 @@ class KafkaRegistrator(
             *topics,
             batch=batch,
             max_workers=workers,
+            ordering_key=ordering_key,
+            single_consumer=single_consumer,
+            deferred_commit=deferred_commit,
             batch_timeout_ms=batch_timeout_ms,
             max_records=max_records,
             group_id=group_id,
@@ -581,6 +613,10 @@ class KafkaRegistrator(
         if workers > 1:
             if auto_commit:
                 return cast("ConcurrentDefaultSubscriber", subscriber)
+            if single_consumer:
+                return cast("ConcurrentPartitionsSubscriber", subscriber)
+            if deferred_commit is not None:
+                return cast("ConcurrentDeferredCommitSubscriber", subscriber)
             return cast("ConcurrentBetweenPartitionsSubscriber", subscriber)
         return cast("DefaultSubscriber", subscriber)
 
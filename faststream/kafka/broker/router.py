@@ -29,9 +29,11 @@ if TYPE_CHECKING:
 
     from faststream._internal.basic_types import SendableMessage
     from faststream._internal.broker.registrator import Registrator
+    from faststream._internal.endpoint.subscriber.offsets import DeferredCommit
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        OrderingKey,
         PublisherMiddleware,
         SubscriberMiddleware,
     )
@@ -182,6 +184,9 @@ class KafkaRoute(SubscriberRoute):
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: int = 1,
+        ordering_key: Optional["OrderingKey[ConsumerRecord]"] = None,
+        single_consumer: bool = False,
+        deferred_commit: Optional["DeferredCommit"] = None,
     ) -> None:
         """Initialize KafkaRoute.
 
@@ -370,12 +375,18 @@ class KafkaRoute(SubscriberRoute):
                 Uses decorated docstring as default.
             include_in_schema: Whetever to include operation in AsyncAPI schema or not.
             max_workers: Number of workers to process messages concurrently.
+            ordering_key: Function to get a key from the raw message to process messages with the same key in order. Requires `max_workers` > 1.
+            single_consumer: Whether to use a single consumer in the concurrent manual commit mode. Requires `max_workers` > 1.
+            deferred_commit: Commit processed offsets by batches instead of a commit per acknowledged record. Requires manual commit mode.
         """
         super().__init__(
             call,
             *topics,
             publishers=publishers,
             max_workers=max_workers,
+            ordering_key=ordering_key,
+            single_consumer=single_consumer,
+            deferred_commit=deferred_commit,
             group_id=group_id,
             key_deserializer=key_deserializer,
             value_deserializer=value_deserializer,
@@ -28,6 +28,7 @@ from faststream._internal.constants import EMPTY
 from faststream._internal.context import ContextRepo
 from faststream._internal.fastapi.router import StreamRouter
 from faststream.kafka.broker.broker import KafkaBroker as KB
+from faststream.message import gen_cor_id
 from faststream.middlewares import AckPolicy
 
 if TYPE_CHECKING:
@@ -42,9 +43,11 @@ if TYPE_CHECKING:
     from starlette.types import ASGIApp, Lifespan
 
     from faststream._internal.basic_types import LoggerProto
+    from faststream._internal.endpoint.subscriber.offsets import DeferredCommit
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        OrderingKey,
         PublisherMiddleware,
         SubscriberMiddleware,
     )
@@ -56,8 +59,11 @@ if TYPE_CHECKING:
         BatchSubscriber,
         ConcurrentBetweenPartitionsSubscriber,
         ConcurrentDefaultSubscriber,
+        ConcurrentDeferredCommitSubscriber,
+        ConcurrentPartitionsSubscriber,
         DefaultSubscriber,
     )
+    from faststream.message import IdGenerator
     from faststream.security import BaseSecurity
     from faststream.specification.base import SpecificationFactory
     from faststream.specification.schema.extra import Tag, TagDict
@@ -263,6 +269,18 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
                 "Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.",
             ),
         ] = 15.0,
+        id_generator: Annotated[
+            "IdGenerator",
+            Doc(
+                "Function to generate `correlation_id` header of produced records.",
+            ),
+        ] = gen_cor_id,
+        start_concurrency: Annotated[
+            int,
+            Doc(
+                "Maximum number of subscribers started or stopped concurrently by the broker.",
+            ),
+        ] = 1,
         decoder: Annotated[
             Optional["CustomCallable"],
             Doc("Custom decoder object."),
@@ -569,6 +587,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             transaction_timeout_ms=transaction_timeout_ms,
             # broker args
             graceful_timeout=graceful_timeout,
+            id_generator=id_generator,
+            start_concurrency=start_concurrency,
             decoder=decoder,
             parser=parser,
             middlewares=middlewares,
@@ -2614,16 +2634,46 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
                 "is equal to the number of partitions in the topic.",
             ),
         ] = 1,
+        ordering_key: Annotated[
+            Optional["OrderingKey[ConsumerRecord]"],
+            Doc(
+                "Function to get a key from the raw message to process messages "
+                "with the same key in order. Requires `max_workers` > 1.",
+            ),
+        ] = None,
+        single_consumer: Annotated[
+            bool,
+            Doc(
+                "Whether to use a single consumer in the concurrent manual commit "
+                "mode. Records are processed concurrently between partitions and "
+                "only contiguous processed offsets are committed. Requires "
+                "`max_workers` > 1.",
+            ),
+        ] = False,
+        deferred_commit: Annotated[
+            Optional["DeferredCommit"],
+            Doc(
+                "Commit processed offsets by batches instead of a commit per "
+                "acknowledged record. With `max_workers` > 1 records are processed "
+                "concurrently regardless of their partitions and only contiguous "
+                "processed offsets are committed. Requires manual commit mode.",
+            ),
+        ] = None,
     ) -> Union[
         "BatchSubscriber",
         "DefaultSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentPartitionsSubscriber",
+        "ConcurrentDeferredCommitSubscriber",
     ]:
         subscriber = super().subscriber(
             *topics,
             group_id=group_id,
             max_workers=max_workers,
+            ordering_key=ordering_key,
+            single_consumer=single_consumer,
+            deferred_commit=deferred_commit,
             key_deserializer=key_deserializer,
             value_deserializer=value_deserializer,
             fetch_max_wait_ms=fetch_max_wait_ms,
@@ -2675,6 +2725,10 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         if max_workers > 1:
             if auto_commit:
                 return cast("ConcurrentDefaultSubscriber", subscriber)
+            if single_consumer:
+                return cast("ConcurrentPartitionsSubscriber", subscriber)
+            if deferred_commit is not None:
+                return cast("ConcurrentDeferredCommitSubscriber", subscriber)
             return cast("ConcurrentBetweenPartitionsSubscriber", subscriber)
         return cast("DefaultSubscriber", subscriber)
 
@@ -1,3 +1,6 @@
-from .rebalance_listener import make_logging_listener
+from .rebalance_listener import make_logging_listener, make_revoke_listener
 
-__all__ = ("make_logging_listener",)
+__all__ = (
+    "make_logging_listener",
+    "make_revoke_listener",
+)
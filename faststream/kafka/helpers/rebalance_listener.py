@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Optional
 
 from aiokafka import ConsumerRebalanceListener
@@ -36,6 +37,36 @@ def make_logging_listener(
     )
 
 
+def make_revoke_listener(
+    *,
+    on_revoked: Callable[[set["TopicPartition"]], Awaitable[None]],
+    listener: Optional["ConsumerRebalanceListener"],
+) -> "ConsumerRebalanceListener":
+    """Call subscriber callback before partitions revocation to commit their offsets."""
+    return _RevokeListener(on_revoked=on_revoked, listener=listener)
+
+
+class _RevokeListener(ConsumerRebalanceListener):  # type: ignore[misc]
+    def __init__(
+        self,
+        *,
+        on_revoked: Callable[[set["TopicPartition"]], Awaitable[None]],
+        listener: Optional["ConsumerRebalanceListener"],
+    ) -> None:
+        self.on_revoked = on_revoked
+        self.listener = listener
+
+    async def on_partitions_revoked(self, revoked: set["TopicPartition"]) -> None:
+        await self.on_revoked(revoked)
+
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_revoked, revoked)
+
+    async def on_partitions_assigned(self, assigned: set["TopicPartition"]) -> None:
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_assigned, assigned)
+
+
 class _LoggingListener(ConsumerRebalanceListener):  # type: ignore[misc]
     _log_unassigned_consumer_delay_seconds = 60 * 2
 
@@ -6,7 +6,6 @@ from typing_extensions import Doc, override
 from faststream._internal.endpoint.publisher import PublisherUsecase
 from faststream.kafka.message import KafkaMessage
 from faststream.kafka.response import KafkaPublishCommand
-from faststream.message import gen_cor_id
 from faststream.response.publish_type import PublishType
 
 if TYPE_CHECKING:
@@ -109,7 +108,7 @@ class LogicPublisher(PublisherUsecase):
             key=key,
             partition=partition or self.partition,
             headers=self.headers | (headers or {}),
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self._outer_config.id_generator(),
             timestamp_ms=timestamp_ms,
             timeout=timeout,
             _publish_type=PublishType.REQUEST,
@@ -237,7 +236,7 @@ class DefaultPublisher(LogicPublisher):
             partition=partition or self.partition,
             reply_to=reply_to or self.reply_to,
             headers=self.headers | (headers or {}),
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self._outer_config.id_generator(),
             timestamp_ms=timestamp_ms,
             no_confirm=no_confirm,
             _publish_type=PublishType.PUBLISH,
@@ -429,7 +428,7 @@ class BatchPublisher(LogicPublisher):
             partition=partition or self.partition,
             reply_to=reply_to or self.reply_to,
             headers=self.headers | (headers or {}),
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self._outer_config.id_generator(),
             timestamp_ms=timestamp_ms,
             no_confirm=no_confirm,
             _publish_type=PublishType.PUBLISH,
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 
 from faststream._internal.constants import EMPTY
 from faststream._internal.endpoint.subscriber.call_item import CallsCollection
+from faststream._internal.endpoint.subscriber.offsets import DeferredCommit
 from faststream.exceptions import SetupError
 from faststream.middlewares import AckPolicy
 
@@ -13,13 +14,17 @@ from .usecase import (
     BatchSubscriber,
     ConcurrentBetweenPartitionsSubscriber,
     ConcurrentDefaultSubscriber,
+    ConcurrentDeferredCommitSubscriber,
+    ConcurrentPartitionsSubscriber,
     DefaultSubscriber,
+    DeferredCommitSubscriber,
 )
 
 if TYPE_CHECKING:
-    from aiokafka import TopicPartition
+    from aiokafka import ConsumerRecord, TopicPartition
     from aiokafka.abc import ConsumerRebalanceListener
 
+    from faststream._internal.types import OrderingKey
     from faststream.kafka.configs import KafkaBrokerConfig
 
 
@@ -38,6 +43,9 @@ def create_subscriber(
     # Subscriber args
     ack_policy: "AckPolicy",
     max_workers: int,
+    ordering_key: Optional["OrderingKey[ConsumerRecord]"],
+    single_consumer: bool,
+    deferred_commit: DeferredCommit | None,
     no_ack: bool,
     no_reply: bool,
     config: "KafkaBrokerConfig",
@@ -50,6 +58,8 @@ def create_subscriber(
     "BatchSubscriber",
     "ConcurrentDefaultSubscriber",
     "ConcurrentBetweenPartitionsSubscriber",
+    "ConcurrentPartitionsSubscriber",
+    "ConcurrentDeferredCommitSubscriber",
 ]:
     _validate_input_for_misconfigure(
         *topics,
@@ -59,6 +69,9 @@ def create_subscriber(
         no_ack=no_ack,
         auto_commit=auto_commit,
         max_workers=max_workers,
+        ordering_key=ordering_key,
+        single_consumer=single_consumer,
+        deferred_commit=deferred_commit,
     )
 
     subscriber_config = KafkaSubscriberConfig(
@@ -106,6 +119,26 @@ def create_subscriber(
                 specification,
                 calls,
                 max_workers=max_workers,
+                ordering_key=ordering_key,
+            )
+
+        if single_consumer:
+            return ConcurrentPartitionsSubscriber(
+                subscriber_config,
+                specification,
+                calls,
+                max_workers=max_workers,
+                deferred_commit=deferred_commit or DeferredCommit(),
+            )
+
+        if deferred_commit is not None:
+            return ConcurrentDeferredCommitSubscriber(
+                subscriber_config,
+                specification,
+                calls,
+                max_workers=max_workers,
+                ordering_key=ordering_key,
+                deferred_commit=deferred_commit,
             )
 
         subscriber_config.topics = (topics[0],)
@@ -116,6 +149,14 @@ def create_subscriber(
             max_workers=max_workers,
         )
 
+    if deferred_commit is not None:
+        return DeferredCommitSubscriber(
+            subscriber_config,
+            specification,
+            calls,
+            deferred_commit=deferred_commit,
+        )
+
     return DefaultSubscriber(subscriber_config, specification, calls)
 
 
@@ -125,6 +166,9 @@ def _validate_input_for_misconfigure(
     auto_commit: bool,
     no_ack: bool,
     max_workers: int,
+    ordering_key: Optional["OrderingKey[ConsumerRecord]"],
+    single_consumer: bool,
+    deferred_commit: DeferredCommit | None,
     pattern: str | None,
     partitions: Iterable["TopicPartition"],
 ) -> None:
@@ -157,7 +201,28 @@ def _validate_input_for_misconfigure(
     if ack_policy is EMPTY:
         ack_policy = AckPolicy.ACK_FIRST
 
-    if max_workers > 1 and ack_policy is not AckPolicy.ACK_FIRST:
+    if ordering_key is not None and (
+        max_workers <= 1
+        or single_consumer
+        or (ack_policy is not AckPolicy.ACK_FIRST and deferred_commit is None)
+    ):
+        msg = "The `ordering_key` option can be used only with `max_workers` > 1 and `AckPolicy.ACK_FIRST` or `deferred_commit`."
+        raise SetupError(msg)
+
+    if single_consumer and (max_workers <= 1 or ack_policy is AckPolicy.ACK_FIRST):
+        msg = "The `single_consumer` option can be used only with `max_workers` > 1 and manual commit mode."
+        raise SetupError(msg)
+
+    if deferred_commit is not None and ack_policy is AckPolicy.ACK_FIRST:
+        msg = "The `deferred_commit` option can be used only with manual commit mode."
+        raise SetupError(msg)
+
+    if (
+        max_workers > 1
+        and ack_policy is not AckPolicy.ACK_FIRST
+        and not single_consumer
+        and deferred_commit is None
+    ):
         if len(topics) > 1:
             msg = "You must use a single topic with concurrent manual commit mode."
             raise SetupError(msg)
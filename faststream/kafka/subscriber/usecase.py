@@ -1,6 +1,8 @@
 import logging
+import math
 from abc import abstractmethod
 from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import suppress
 from itertools import chain
 from typing import TYPE_CHECKING, Any, Optional, cast
 
@@ -9,22 +11,30 @@ from aiokafka import ConsumerRecord, TopicPartition
 from aiokafka.errors import ConsumerStoppedError, KafkaError, UnsupportedCodecError
 from typing_extensions import override
 
-from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin, TasksMixin
+from faststream._internal.endpoint.subscriber.mixins import (
+    ConcurrentMixin,
+    DeferredCommitMixin,
+    TasksMixin,
+)
 from faststream._internal.endpoint.subscriber.usecase import SubscriberUsecase
 from faststream._internal.endpoint.utils import process_msg
 from faststream._internal.types import MsgType
 from faststream._internal.utils.path import compile_path
-from faststream.kafka.helpers import make_logging_listener
+from faststream.kafka.helpers import make_logging_listener, make_revoke_listener
 from faststream.kafka.message import KafkaAckableMessage, KafkaMessage, KafkaRawMessage
 from faststream.kafka.parser import AioKafkaBatchParser, AioKafkaParser
 from faststream.kafka.publisher.fake import KafkaFakePublisher
 
 if TYPE_CHECKING:
     from aiokafka import AIOKafkaConsumer
+    from aiokafka.abc import ConsumerRebalanceListener
+    from anyio.abc import TaskGroup
+    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
     from faststream._internal.endpoint.publisher import PublisherProto
     from faststream._internal.endpoint.subscriber import SubscriberSpecification
     from faststream._internal.endpoint.subscriber.call_item import CallsCollection
+    from faststream._internal.endpoint.subscriber.offsets import DeferredCommit
     from faststream.kafka.configs import KafkaBrokerConfig
     from faststream.message import StreamMessage
 
@@ -103,12 +113,7 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
             consumer.subscribe(
                 topics=self.topics,
                 pattern=self.pattern,
-                listener=make_logging_listener(
-                    consumer=consumer,
-                    logger=self._outer_config.logger.logger.logger,
-                    log_extra=self.get_log_context(None),
-                    listener=self._listener,
-                ),
+                listener=self._make_listener(consumer),
             )
 
         elif self.partitions:
@@ -128,6 +133,17 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
             await self.consumer.stop()
             self.consumer = None
 
+    def _make_listener(
+        self,
+        consumer: "AIOKafkaConsumer",
+    ) -> Optional["ConsumerRebalanceListener"]:
+        return make_logging_listener(
+            consumer=consumer,
+            logger=self._outer_config.logger.logger.logger,
+            log_extra=self.get_log_context(None),
+            listener=self._listener,
+        )
+
     @override
     async def get_one(
         self,
@@ -424,12 +440,7 @@ class ConcurrentBetweenPartitionsSubscriber(DefaultSubscriber):
             for c in self.consumer_subgroup:
                 c.subscribe(
                     topics=self.topics,
-                    listener=make_logging_listener(
-                        consumer=c,
-                        logger=self._outer_config.logger.logger.logger,
-                        log_extra=self.get_log_context(None),
-                        listener=self._listener,
-                    ),
+                    listener=self._make_listener(c),
                 )
 
                 tg.start_soon(c.start)
@@ -455,3 +466,246 @@ class ConcurrentBetweenPartitionsSubscriber(DefaultSubscriber):
         message = await consumer.getone()
         message.consumer = consumer
         return cast("KafkaRawMessage", message)
+
+
+class ConcurrentPartitionsSubscriber(
+    DeferredCommitMixin["ConsumerRecord"],
+    DefaultSubscriber,
+):
+    """Single consumer subscriber processing topic partitions concurrently.
+
+    Records are fetched by `getmany` and distributed between per-partition queues,
+    so records of a partition are processed sequentially and different partitions
+    are processed concurrently by up to `max_workers` workers. Offsets are committed
+    only up to the contiguous processed records of each partition.
+    """
+
+    # `getmany` timeout
+    fetch_timeout_ms = 100
+    # records number in a partition queue to pause the partition fetching
+    partition_buffer_size = 100
+
+    def __init__(
+        self,
+        config: "KafkaSubscriberConfig",
+        specification: "SubscriberSpecification[Any, Any]",
+        calls: "CallsCollection[ConsumerRecord]",
+        max_workers: int,
+        deferred_commit: "DeferredCommit",
+    ) -> None:
+        super().__init__(
+            config,
+            specification,
+            calls,
+            deferred_commit=deferred_commit,
+        )
+
+        self.max_workers = max_workers
+        self.limiter = anyio.Semaphore(max_workers)
+
+        self._lanes: dict[
+            TopicPartition,
+            tuple[
+                MemoryObjectSendStream[ConsumerRecord],
+                MemoryObjectReceiveStream[ConsumerRecord],
+            ],
+        ] = {}
+        self._task_group: TaskGroup | None = None
+
+    async def start(self) -> None:
+        self._lanes = {}
+        await super().start()
+
+        self.parser._setup(_TrackedConsumer(self))
+        self.start_commit_task()
+
+    def _make_listener(
+        self,
+        consumer: "AIOKafkaConsumer",
+    ) -> Optional["ConsumerRebalanceListener"]:
+        return make_logging_listener(
+            consumer=consumer,
+            logger=self._outer_config.logger.logger.logger,
+            log_extra=self.get_log_context(None),
+            listener=make_revoke_listener(
+                on_revoked=self._on_partitions_revoked,
+                listener=self._listener,
+            ),
+        )
+
+    async def _run_consume_loop(self, consumer: "AIOKafkaConsumer") -> None:
+        async with anyio.create_task_group() as tg:
+            self._task_group = tg
+            await super()._run_consume_loop(consumer)
+
+            # let workers finish processing records
+            for send_stream, _ in self._lanes.values():
+                send_stream.close()
+
+    async def get_msg(
+        self,
+        consumer: "AIOKafkaConsumer",
+    ) -> dict[TopicPartition, list["ConsumerRecord"]]:
+        assert consumer, "You should setup subscriber at first."
+
+        records: dict[TopicPartition, list[ConsumerRecord]] = await consumer.getmany(
+            timeout_ms=self.fetch_timeout_ms,
+        )
+        return records
+
+    async def consume_one(
+        self,
+        msg: dict[TopicPartition, list["ConsumerRecord"]],
+    ) -> None:
+        assert self._task_group, "You should start subscriber at first."
+        assert self.consumer, "You should start subscriber at first."
+
+        for partition, records in msg.items():
+            if (lane := self._lanes.get(partition)) is None:
+                lane = self._lanes[partition] = anyio.create_memory_object_stream(
+                    max_buffer_size=math.inf,
+                )
+                self._task_group.start_soon(self._serve_partition, partition, lane[1])
+
+            send_stream, _ = lane
+            for record in records:
+                self._track_offset(record)
+                send_stream.send_nowait(record)
+
+            if send_stream.statistics().current_buffer_used >= self.partition_buffer_size:
+                self.consumer.pause(partition)
+
+    async def _serve_partition(
+        self,
+        partition: TopicPartition,
+        receive_stream: "MemoryObjectReceiveStream[ConsumerRecord]",
+    ) -> None:
+        """Consume partition records one by one to keep their order."""
+        async for record in receive_stream:
+            async with self.limiter:
+                await self.consume(record)
+
+            if (
+                self.consumer is not None
+                and partition in self.consumer.paused()
+                and receive_stream.statistics().current_buffer_used
+                < self.partition_buffer_size // 2
+            ):
+                self.consumer.resume(partition)
+
+    def _get_offset(self, msg: "ConsumerRecord") -> tuple[TopicPartition, int]:
+        return TopicPartition(msg.topic, msg.partition), msg.offset
+
+    async def _commit(self, offsets: dict[TopicPartition, int]) -> None:
+        assert self.consumer, "You should start subscriber at first."
+        await self.consumer.commit(offsets)
+
+    def _seek(self, partition: TopicPartition, offset: int) -> None:
+        self._reset_offset(partition, offset)
+
+        if (lane := self._lanes.get(partition)) is not None:
+            _drain(lane[1])
+
+        if self.consumer is not None:
+            self.consumer.seek(partition, offset)
+
+            if partition in self.consumer.paused():
+                self.consumer.resume(partition)
+
+    async def _on_partitions_revoked(self, revoked: set[TopicPartition]) -> None:
+        for partition in revoked:
+            if (lane := self._lanes.pop(partition, None)) is not None:
+                send_stream, receive_stream = lane
+                _drain(receive_stream)
+                send_stream.close()
+
+        await self._revoke_partitions(revoked)
+
+
+class DeferredCommitSubscriber(DeferredCommitMixin["ConsumerRecord"], DefaultSubscriber):
+    """Subscriber committing processed records offsets by batches.
+
+    Acknowledged records offsets are not committed one by one, but collected
+    and committed by timer or processed records number.
+    """
+
+    async def start(self) -> None:
+        await super().start()
+
+        self.parser._setup(_TrackedConsumer(self))
+        self.start_commit_task()
+
+    def _make_listener(
+        self,
+        consumer: "AIOKafkaConsumer",
+    ) -> Optional["ConsumerRebalanceListener"]:
+        return make_logging_listener(
+            consumer=consumer,
+            logger=self._outer_config.logger.logger.logger,
+            log_extra=self.get_log_context(None),
+            listener=make_revoke_listener(
+                on_revoked=self._revoke_partitions,
+                listener=self._listener,
+            ),
+        )
+
+    async def consume_one(self, msg: "ConsumerRecord") -> None:
+        self._track_offset(msg)
+        await self.consume(msg)
+
+    def _get_offset(self, msg: "ConsumerRecord") -> tuple[TopicPartition, int]:
+        return TopicPartition(msg.topic, msg.partition), msg.offset
+
+    async def _commit(self, offsets: dict[TopicPartition, int]) -> None:
+        assert self.consumer, "You should start subscriber at first."
+        await self.consumer.commit(offsets)
+
+    def _seek(self, partition: TopicPartition, offset: int) -> None:
+        self._reset_offset(partition, offset)
+
+        if self.consumer is not None:
+            self.consumer.seek(partition, offset)
+
+
+class ConcurrentDeferredCommitSubscriber(
+    ConcurrentMixin["ConsumerRecord"],
+    DeferredCommitSubscriber,
+):
+    """Concurrent subscriber committing only contiguous processed offsets.
+
+    Records are processed concurrently regardless of their partitions, and offsets
+    are committed by batches up to the contiguous processed records of each partition.
+    """
+
+    async def start(self) -> None:
+        await super().start()
+        self.start_consume_task()
+
+    async def consume_one(self, msg: "ConsumerRecord") -> None:
+        self._track_offset(msg)
+        await self._put_msg(msg)
+
+
+class _TrackedConsumer:
+    """Consumer proxy for subscribers committing processed offsets by themselves."""
+
+    __slots__ = ("subscriber",)
+
+    def __init__(
+        self,
+        subscriber: ConcurrentPartitionsSubscriber | DeferredCommitSubscriber,
+    ) -> None:
+        self.subscriber = subscriber
+
+    async def commit(self) -> None:
+        """Processed record offset is committed by the subscriber."""
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        self.subscriber._seek(partition, offset)
+
+
+def _drain(receive_stream: "MemoryObjectReceiveStream[Any]") -> None:
+    """Drop all buffered records."""
+    with suppress(anyio.WouldBlock, anyio.EndOfStream):
+        while True:
+            receive_stream.receive_nowait()
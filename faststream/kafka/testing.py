@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from faststream.kafka.publisher.usecase import LogicPublisher
     from faststream.kafka.response import KafkaPublishCommand
     from faststream.kafka.subscriber.usecase import LogicSubscriber
+    from faststream.message import IdGenerator
 
 __all__ = ("TestKafkaBroker",)
 
@@ -141,6 +142,7 @@ class FakeProducer(AioKafkaFastProducer):
             correlation_id=cmd.correlation_id,
             reply_to=cmd.reply_to,
             serializer=self.broker.config.fd_config._serializer,
+            id_generator=self.broker.config.id_generator,
         )
 
         for handler in _find_handler(
@@ -163,6 +165,7 @@ class FakeProducer(AioKafkaFastProducer):
             headers=cmd.headers,
             correlation_id=cmd.correlation_id,
             serializer=self.broker.config.fd_config._serializer,
+            id_generator=self.broker.config.id_generator,
         )
 
         for handler in _find_handler(
@@ -202,6 +205,7 @@ class FakeProducer(AioKafkaFastProducer):
                     correlation_id=cmd.correlation_id,
                     reply_to=cmd.reply_to,
                     serializer=self.broker.config.fd_config._serializer,
+                    id_generator=self.broker.config.id_generator,
                 )
                 for message in cmd.batch_bodies
             )
@@ -227,6 +231,7 @@ class FakeProducer(AioKafkaFastProducer):
             headers=result.headers,
             correlation_id=result.correlation_id,
             serializer=self.broker.config.fd_config._serializer,
+            id_generator=self.broker.config.id_generator,
         )
 
 
@@ -241,6 +246,7 @@ def build_message(
     *,
     reply_to: str = "",
     serializer: Optional["SerializerProto"],
+    id_generator: "IdGenerator" = gen_cor_id,
 ) -> "ConsumerRecord":
     """Build a Kafka ConsumerRecord for a sendable message."""
     msg, content_type = encode_message(message, serializer=serializer)
@@ -249,7 +255,7 @@ def build_message(
 
     headers = {
         "content-type": content_type or "",
-        "correlation_id": correlation_id or gen_cor_id(),
+        "correlation_id": correlation_id or id_generator(),
         **(headers or {}),
     }
 
@@ -1,11 +1,22 @@
-from .message import AckStatus, StreamMessage
+from .message import AckStatus, BatchStreamMessage, StreamMessage
 from .source_type import SourceType
-from .utils import decode_message, encode_message, gen_cor_id
+from .utils import (
+    IdGenerator,
+    NuidGenerator,
+    UlidGenerator,
+    decode_message,
+    encode_message,
+    gen_cor_id,
+)
 
 __all__ = (
     "AckStatus",
+    "BatchStreamMessage",
+    "IdGenerator",
+    "NuidGenerator",
     "SourceType",
     "StreamMessage",
+    "UlidGenerator",
     "decode_message",
     "encode_message",
     "gen_cor_id",
@@ -6,11 +6,13 @@ from typing import (
     Optional,
     TypeVar,
 )
-from uuid import uuid4
 
 from .source_type import SourceType
+from .utils import gen_cor_id
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from faststream._internal.types import AsyncCallable
 
 # prevent circular imports
@@ -26,6 +28,25 @@ class AckStatus(str, Enum):
 class StreamMessage(Generic[MsgType]):
     """Generic class to represent a stream message."""
 
+    __slots__ = (
+        "__decoded_caches",
+        "__decoder",
+        # allocated lazily to keep custom attributes from middlewares working
+        "__dict__",
+        "_batch_headers",
+        "_correlation_id",
+        "_headers",
+        "_message_id",
+        "_path",
+        "body",
+        "committed",
+        "content_type",
+        "processed",
+        "raw_message",
+        "reply_to",
+        "source_type",
+    )
+
     def __init__(
         self,
         raw_message: "MsgType",
@@ -46,27 +67,77 @@ class StreamMessage(Generic[MsgType]):
         self.content_type = content_type
         self.source_type = source_type
 
-        self.headers = headers or {}
-        self.batch_headers = batch_headers or []
-        self.path = path or {}
-        self.correlation_id = correlation_id or str(uuid4())
-        self.message_id = message_id or self.correlation_id
+        # Collections and IDs are materialized on the first access
+        self._headers = headers
+        self._batch_headers = batch_headers
+        self._path = path
+        self._correlation_id = correlation_id
+        self._message_id = message_id
 
         self.committed: AckStatus | None = None
         self.processed = False
 
         # Setup later
         self.__decoder: AsyncCallable | None = None
-        self.__decoded_caches: dict[
-            Any,
-            Any,
-        ] = {}  # Cache values between filters and tests
+        # Cache values between filters and tests
+        self.__decoded_caches: dict[Any, Any] | None = None
+
+    @property
+    def headers(self) -> dict[str, Any]:
+        if (headers := self._headers) is None:
+            headers = self._headers = {}
+        return headers
+
+    @headers.setter
+    def headers(self, value: dict[str, Any]) -> None:
+        self._headers = value
+
+    @property
+    def batch_headers(self) -> list[dict[str, Any]]:
+        if (batch_headers := self._batch_headers) is None:
+            batch_headers = self._batch_headers = []
+        return batch_headers
+
+    @batch_headers.setter
+    def batch_headers(self, value: list[dict[str, Any]]) -> None:
+        self._batch_headers = value
+
+    @property
+    def path(self) -> dict[str, Any]:
+        if (path := self._path) is None:
+            path = self._path = {}
+        return path
+
+    @path.setter
+    def path(self, value: dict[str, Any]) -> None:
+        self._path = value
+
+    @property
+    def correlation_id(self) -> str:
+        if not (correlation_id := self._correlation_id):
+            correlation_id = self._correlation_id = gen_cor_id()
+        return correlation_id
+
+    @correlation_id.setter
+    def correlation_id(self, value: str) -> None:
+        self._correlation_id = value
+
+    @property
+    def message_id(self) -> str:
+        if not (message_id := self._message_id):
+            message_id = self._message_id = self.correlation_id
+        return message_id
+
+    @message_id.setter
+    def message_id(self, value: str) -> None:
+        self._message_id = value
 
     def set_decoder(self, decoder: "AsyncCallable") -> None:
         self.__decoder = decoder
 
     def clear_cache(self) -> None:
-        self.__decoded_caches.clear()
+        if self.__decoded_caches is not None:
+            self.__decoded_caches.clear()
 
     def __repr__(self) -> str:
         inner = ", ".join(
@@ -96,8 +167,11 @@ class StreamMessage(Generic[MsgType]):
         """
         assert self.__decoder, "You should call `set_decoder()` method first."
 
-        if (result := self.__decoded_caches.get(self.__decoder)) is None:
-            result = self.__decoded_caches[self.__decoder] = await self.__decoder(self)
+        if (caches := self.__decoded_caches) is None:
+            caches = self.__decoded_caches = {}
+
+        if (result := caches.get(self.__decoder)) is None:
+            result = caches[self.__decoder] = await self.__decoder(self)
 
         return result
 
@@ -112,3 +186,50 @@ class StreamMessage(Generic[MsgType]):
     async def reject(self) -> None:
         if self.committed is None:
             self.committed = AckStatus.REJECTED
+
+
+class BatchStreamMessage(StreamMessage[tuple[MsgType, ...]]):
+    """A message to represent a batch of single messages.
+
+    Acknowledgement is tracked per message: batch `ack`/`nack`/`reject`
+    is applied only to the messages were not committed manually yet.
+    """
+
+    __slots__ = ("messages",)
+
+    def __init__(
+        self,
+        raw_message: tuple[MsgType, ...],
+        messages: "Sequence[StreamMessage[MsgType]]",
+    ) -> None:
+        first = messages[0]
+
+        super().__init__(
+            raw_message=raw_message,
+            body=[m.body for m in messages],
+            headers=first.headers,
+            batch_headers=[m.headers for m in messages],
+            path=first.path,
+            content_type=first.content_type,
+            correlation_id=first.correlation_id,
+        )
+
+        self.messages = tuple(messages)
+
+    async def ack(self, **kwargs: Any) -> None:
+        for m in self.messages:
+            if m.committed is None:
+                await m.ack(**kwargs)
+        await super().ack()
+
+    async def nack(self, **kwargs: Any) -> None:
+        for m in self.messages:
+            if m.committed is None:
+                await m.nack(**kwargs)
+        await super().nack()
+
+    async def reject(self, **kwargs: Any) -> None:
+        for m in self.messages:
+            if m.committed is None:
+                await m.reject(**kwargs)
+        await super().reject()
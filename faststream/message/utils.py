@@ -1,11 +1,16 @@
 import json
-from collections.abc import Sequence
+import time
+from base64 import b32encode
+from collections.abc import Callable, Sequence
 from contextlib import suppress
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from random import Random
+from secrets import randbits
+from typing import TYPE_CHECKING, Any, Optional, TypeAlias, Union, cast
 from uuid import uuid4
 
 from faststream._internal._compat import json_dumps, json_loads
 from faststream._internal.constants import ContentTypes
+from faststream._internal.utils.nuid import NUID
 
 if TYPE_CHECKING:
     from fast_depends.library.serializer import SerializerProto
@@ -15,11 +20,78 @@ if TYPE_CHECKING:
     from .message import StreamMessage
 
 
+IdGenerator: TypeAlias = Callable[[], str]
+
+
 def gen_cor_id() -> str:
     """Generate random string to use as ID."""
     return str(uuid4())
 
 
+class NuidGenerator:
+    """Generate NUID-based IDs.
+
+    Uses random prefix with pseudo-random sequence, so OS entropy is read
+    only on prefix rotation.
+    """
+
+    __slots__ = ("_nuid",)
+
+    def __init__(self) -> None:
+        self._nuid = NUID()
+
+    def __call__(self) -> str:
+        return self._nuid.next().decode()
+
+
+_B32_TO_CROCKFORD = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567",
+    b"0123456789ABCDEFGHJKMNPQRSTVWXYZ",
+)
+_ULID_RANDOM_BITS = 80
+_ULID_MAX_RANDOM = (1 << _ULID_RANDOM_BITS) - 1
+
+
+def _encode_crockford(value: int) -> str:
+    """Encode 80-bit integer to 16 chars of Crockford's Base32."""
+    return b32encode(value.to_bytes(10, "big")).translate(_B32_TO_CROCKFORD).decode()
+
+
+class UlidGenerator:
+    """Generate lexicographically sortable ULID-style IDs.
+
+    IDs are monotonic within the generator: the random part is incremented
+    for the IDs generated in the same millisecond.
+    """
+
+    __slots__ = ("_last_ms", "_last_random", "_prand", "_prefix")
+
+    def __init__(self) -> None:
+        self._prand = Random(randbits(64))  # nosec B311  # noqa: S311
+        self._last_ms = -1
+        self._last_random = 0
+        self._prefix = ""
+
+    def __call__(self) -> str:
+        ms = time.time_ns() // 1_000_000
+
+        if ms > self._last_ms:
+            random_part = self._prand.getrandbits(_ULID_RANDOM_BITS)
+            self._set_timestamp(ms)
+
+        elif (random_part := self._last_random + 1) > _ULID_MAX_RANDOM:
+            random_part = self._prand.getrandbits(_ULID_RANDOM_BITS)
+            self._set_timestamp(self._last_ms + 1)
+
+        self._last_random = random_part
+        return self._prefix + _encode_crockford(random_part)
+
+    def _set_timestamp(self, ms: int) -> None:
+        self._last_ms = ms
+        # 48-bit timestamp takes the last 10 chars (50 bits)
+        self._prefix = _encode_crockford(ms)[6:]
+
+
 def decode_message(message: "StreamMessage[Any]") -> "DecodedMessage":
     """Decodes a message."""
     body: Any = getattr(message, "body", message)
@@ -1,6 +1,14 @@
-from faststream._internal.testing.app import TestApp
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
 
-try:
+from faststream._internal.lazy import lazy_attributes
+
+if find_spec("nats") is None:
+    from faststream.exceptions import INSTALL_FASTSTREAM_NATS
+
+    raise ImportError(INSTALL_FASTSTREAM_NATS)
+
+if TYPE_CHECKING:
     from nats.js.api import (
         AckPolicy,
         ConsumerConfig,
@@ -16,21 +24,14 @@ try:
         StreamSource,
     )
 
+    from faststream._internal.testing.app import TestApp
+
     from .annotations import NatsMessage
     from .broker import NatsBroker, NatsPublisher, NatsRoute, NatsRouter
     from .response import NatsPublishCommand, NatsResponse
     from .schemas import JStream, KvWatch, ObjWatch, PubAck, PullSub
     from .testing import TestNatsBroker
 
-except ImportError as e:
-    if "'nats'" not in e.msg:
-        raise
-
-    from faststream.exceptions import INSTALL_FASTSTREAM_NATS
-
-    raise ImportError(INSTALL_FASTSTREAM_NATS) from e
-
-
 __all__ = (
     "AckPolicy",
     "ConsumerConfig",
@@ -59,3 +60,35 @@ __all__ = (
     "TestApp",
     "TestNatsBroker",
 )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "TestApp": "faststream._internal.testing.app",
+        "AckPolicy": "nats.js.api",
+        "ConsumerConfig": "nats.js.api",
+        "DeliverPolicy": "nats.js.api",
+        "DiscardPolicy": "nats.js.api",
+        "ExternalStream": "nats.js.api",
+        "Placement": "nats.js.api",
+        "RePublish": "nats.js.api",
+        "ReplayPolicy": "nats.js.api",
+        "RetentionPolicy": "nats.js.api",
+        "StorageType": "nats.js.api",
+        "StreamConfig": "nats.js.api",
+        "StreamSource": "nats.js.api",
+        "NatsMessage": ".annotations",
+        "NatsBroker": ".broker",
+        "NatsPublisher": ".broker",
+        "NatsRoute": ".broker",
+        "NatsRouter": ".broker",
+        "NatsPublishCommand": ".response",
+        "NatsResponse": ".response",
+        "JStream": ".schemas",
+        "KvWatch": ".schemas",
+        "ObjWatch": ".schemas",
+        "PubAck": ".schemas",
+        "PullSub": ".schemas",
+        "TestNatsBroker": ".testing",
+    },
+)
@@ -4,6 +4,7 @@ from typing import (
     TYPE_CHECKING,
     Annotated,
     Any,
+    Literal,
     Optional,
     Union,
     cast,
@@ -32,6 +33,7 @@ from faststream.__about__ import SERVICE_NAME
 from faststream._internal.broker import BrokerUsecase
 from faststream._internal.constants import EMPTY
 from faststream._internal.di import FastDependsConfig
+from faststream.exceptions import SetupError
 from faststream.message import gen_cor_id
 from faststream.nats.configs import NatsBrokerConfig
 from faststream.nats.publisher.producer import (
@@ -48,6 +50,8 @@ from .logging import make_nats_logger_state
 from .registrator import NatsRegistrator
 
 if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Mapping
     from types import TracebackType
 
     from fast_depends.dependencies import Dependant
@@ -70,8 +74,10 @@ if TYPE_CHECKING:
     )
     from faststream._internal.broker.registrator import Registrator
     from faststream._internal.types import BrokerMiddleware, CustomCallable
+    from faststream.message import IdGenerator
     from faststream.nats.helpers import KVBucketDeclarer, OSBucketDeclarer
     from faststream.nats.message import NatsMessage
+    from faststream.nats.publisher.producer import PublishStats
     from faststream.nats.schemas import PubAck
     from faststream.security import BaseSecurity
     from faststream.specification.schema.extra import Tag, TagDict
@@ -348,6 +354,13 @@ class NatsBroker(
             float | None,
             Doc("Max duration to wait for a forced flush to occur."),
         ] = None,
+        js_max_pending: Annotated[
+            int,
+            Doc(
+                "Max number of JetStream messages published with `no_confirm=True` awaiting acknowledgement. "
+                "Further publishing waits for the free slot.",
+            ),
+        ] = 4000,
         # broker args
         graceful_timeout: Annotated[
             float | None,
@@ -355,6 +368,18 @@ class NatsBroker(
                 "Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.",
             ),
         ] = None,
+        id_generator: Annotated[
+            "IdGenerator",
+            Doc(
+                "Function to generate `correlation_id` header of published messages.",
+            ),
+        ] = gen_cor_id,
+        start_concurrency: Annotated[
+            int,
+            Doc(
+                "Maximum number of subscribers started or stopped concurrently by the broker.",
+            ),
+        ] = 1,
         decoder: Annotated[
             Optional["CustomCallable"],
             Doc("Custom decoder object."),
@@ -431,9 +456,14 @@ class NatsBroker(
         else:
             specification_url = servers
 
+        if js_max_pending < 1:
+            msg = "`js_max_pending` should be greater than 0."
+            raise SetupError(msg)
+
         js_producer = NatsJSFastProducer(
             parser=parser,
             decoder=decoder,
+            max_pending=js_max_pending,
         )
 
         producer = NatsFastProducerImpl(
@@ -495,6 +525,8 @@ class NatsBroker(
                 # subscriber args
                 broker_dependencies=dependencies,
                 graceful_timeout=graceful_timeout,
+                id_generator=id_generator,
+                start_concurrency=start_concurrency,
                 extra_context={
                     "broker": self,
                 },
@@ -523,6 +555,9 @@ class NatsBroker(
         await super().stop(exc_type, exc_val, exc_tb)
 
         if self._connection is not None:
+            # do not lose messages published without waiting for the acknowledgement
+            await self.config.js_producer.flush()
+
             await self._connection.drain()
             self._connection = None
 
@@ -609,6 +644,8 @@ class NatsBroker(
         correlation_id: str | None = None,
         stream: None = None,
         timeout: float | None = None,
+        *,
+        no_confirm: bool = False,
     ) -> None: ...
 
     @overload
@@ -621,8 +658,24 @@ class NatsBroker(
         correlation_id: str | None = None,
         stream: str | None = None,
         timeout: float | None = None,
+        *,
+        no_confirm: Literal[False] = False,
     ) -> "PubAck": ...
 
+    @overload
+    async def publish(
+        self,
+        message: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        *,
+        no_confirm: Literal[True],
+    ) -> "asyncio.Future[PubAck]": ...
+
     @override
     async def publish(
         self,
@@ -633,7 +686,9 @@ class NatsBroker(
         correlation_id: str | None = None,
         stream: str | None = None,
         timeout: float | None = None,
-    ) -> Optional["PubAck"]:
+        *,
+        no_confirm: bool = False,
+    ) -> Union["PubAck", "asyncio.Future[PubAck]", None]:
         """Publish message directly.
 
         This method allows you to publish message in not AsyncAPI-documented way. You can use it in another frameworks
@@ -660,29 +715,133 @@ class NatsBroker(
                 Can be omitted without any effect if you doesn't want PubAck frame.
             timeout:
                 Timeout to send message to NATS.
+            no_confirm:
+                Do not wait for the stream PubAck frame. The number of not acknowledged messages
+                is limited by the broker `js_max_pending` option. Use `flush` to wait for them all.
+                Has no effect for regular messages.
 
         Returns:
             `None` if you publishes a regular message.
             `faststream.nats.PubAck` if you publishes a message to stream.
+            `asyncio.Future` with `faststream.nats.PubAck` if you publishes a message to stream with no_confirm = True.
+            It raises the publishing error if the message is not acknowledged.
         """
         cmd = NatsPublishCommand(
             message=message,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self.config.id_generator(),
             subject=subject,
             headers=headers,
             reply_to=reply_to,
             stream=stream,
             timeout=timeout or 0.5,
+            no_confirm=no_confirm,
             _publish_type=PublishType.PUBLISH,
         )
 
-        result: PubAck | None
+        result: PubAck | asyncio.Future[PubAck] | None
         if stream:
             result = await super()._basic_publish(cmd, producer=self.config.js_producer)
         else:
             result = await super()._basic_publish(cmd, producer=self.config.producer)
         return result
 
+    async def flush(self) -> None:
+        """Wait for all stream messages published with `no_confirm=True` to be acknowledged."""
+        await self.config.js_producer.flush()
+
+    @property
+    def publish_stats(self) -> "Mapping[str, PublishStats]":
+        """Stream messages published with `no_confirm=True` counters by subjects."""
+        stats: Mapping[str, PublishStats] = self.config.js_producer.publish_stats
+        return stats
+
+    @overload  # type: ignore[override]
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: None = None,
+        timeout: float | None = None,
+    ) -> None: ...
+
+    @overload
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+    ) -> list["PubAck"]: ...
+
+    @override
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+    ) -> list["PubAck"] | None:
+        """Publish multiple messages by one connection write.
+
+        Regular messages are buffered and sent by a single connection flush.
+        Stream messages are sent without waiting for each other and their acks are gathered together.
+
+        Args:
+            *messages:
+                Messages bodies to send.
+            subject:
+                NATS subject to send messages.
+            headers:
+                Messages headers to store metainformation.
+                **content-type** and **correlation_id** will be set automatically by framework anyway.
+            reply_to:
+                NATS subject name to send response.
+            correlation_id:
+                Manual messages **correlation_id** setter.
+                **correlation_id** is a useful option to trace messages.
+            stream:
+                This option validates that the target subject is in presented stream.
+                Can be omitted without any effect if you doesn't want PubAck frames.
+            timeout:
+                Timeout to send each message to NATS.
+
+        Returns:
+            `None` if you publishes regular messages.
+            `faststream.nats.PubAck` list in the messages order if you publishes messages to stream.
+        """
+        cmd = NatsPublishCommand(
+            *messages,
+            correlation_id=correlation_id or self.config.id_generator(),
+            subject=subject,
+            headers=headers,
+            reply_to=reply_to,
+            stream=stream,
+            timeout=timeout or 0.5,
+            _publish_type=PublishType.PUBLISH,
+        )
+
+        result: list[PubAck] | None
+        if stream:
+            result = await super()._basic_publish_batch(
+                cmd,
+                producer=self.config.js_producer,
+            )
+        else:
+            result = await super()._basic_publish_batch(
+                cmd,
+                producer=self.config.producer,
+            )
+        return result
+
     @override
     async def request(  # type: ignore[override]
         self,
@@ -722,7 +881,7 @@ class NatsBroker(
         """
         cmd = NatsPublishCommand(
             message=message,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self.config.id_generator(),
             subject=subject,
             headers=headers,
             timeout=timeout,
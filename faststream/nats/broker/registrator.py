@@ -18,9 +18,11 @@ from faststream.nats.subscriber.factory import create_subscriber
 if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
+    from faststream._internal.endpoint.subscriber.batching import MicroBatch
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        OrderingKey,
         PublisherMiddleware,
         SubscriberMiddleware,
     )
@@ -86,6 +88,8 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordering_key: Optional["OrderingKey[Msg]"] = None,
+        micro_batch: Optional["MicroBatch"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # AsyncAPI information
@@ -130,6 +134,9 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
             decoder: Function to decode FastStream msg bytes body to python objects.
             middlewares: Subscriber middlewares to wrap incoming message processing.
             max_workers: Number of workers to process messages concurrently.
+            ordering_key: Function to get a key from the raw message to process messages with the same key in order. Requires `max_workers` > 1.
+            micro_batch: Options to collect messages to batches and consume them by a single handler call.
+                Can be used only with a NATS Core Subscriber.
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Whether to `ack` message at start of consuming or not.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
@@ -150,6 +157,8 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
             kv_watch=KvWatch.validate(kv_watch),
             obj_watch=ObjWatch.validate(obj_watch),
             max_workers=max_workers or 1,
+            ordering_key=ordering_key,
+            micro_batch=micro_batch,
             # extra args
             pending_msgs_limit=pending_msgs_limit,
             pending_bytes_limit=pending_bytes_limit,
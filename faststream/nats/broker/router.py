@@ -27,9 +27,11 @@ if TYPE_CHECKING:
 
     from faststream._internal.basic_types import SendableMessage
     from faststream._internal.broker.registrator import Registrator
+    from faststream._internal.endpoint.subscriber.batching import MicroBatch
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        OrderingKey,
         PublisherMiddleware,
         SubscriberMiddleware,
     )
@@ -263,6 +265,21 @@ class NatsRoute(SubscriberRoute):
             int,
             Doc("Number of workers to process messages concurrently."),
         ] = 1,
+        ordering_key: Annotated[
+            Optional["OrderingKey[Msg]"],
+            Doc(
+                "Function to get a key from the raw message to process messages "
+                "with the same key in order. Requires `max_workers` > 1.",
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Options to collect messages to batches "
+                "and consume them by a single handler call. "
+                "Can be used only with a NATS Core Subscriber.",
+            ),
+        ] = None,
         no_ack: Annotated[
             bool,
             Doc("Whether to disable **FastStream** auto acknowledgement logic or not."),
@@ -316,6 +333,8 @@ class NatsRoute(SubscriberRoute):
             ack_first=ack_first,
             stream=stream,
             max_workers=max_workers,
+            ordering_key=ordering_key,
+            micro_batch=micro_batch,
             queue=queue,
             dependencies=dependencies,
             parser=parser,
@@ -32,6 +32,7 @@ from faststream.__about__ import SERVICE_NAME
 from faststream._internal.constants import EMPTY
 from faststream._internal.context import ContextRepo
 from faststream._internal.fastapi.router import StreamRouter
+from faststream.message import gen_cor_id
 from faststream.middlewares import AckPolicy
 from faststream.nats.broker import NatsBroker
 
@@ -52,12 +53,15 @@ if TYPE_CHECKING:
     from starlette.types import ASGIApp, Lifespan
 
     from faststream._internal.basic_types import LoggerProto
+    from faststream._internal.endpoint.subscriber.batching import MicroBatch
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        OrderingKey,
         PublisherMiddleware,
         SubscriberMiddleware,
     )
+    from faststream.message import IdGenerator
     from faststream.nats.publisher.usecase import LogicPublisher
     from faststream.nats.schemas import JStream, KvWatch, ObjWatch, PullSub
     from faststream.nats.subscriber.usecases import (
@@ -208,6 +212,13 @@ class NatsRouter(StreamRouter["Msg"]):
             float | None,
             Doc("Max duration to wait for a forced flush to occur."),
         ] = None,
+        js_max_pending: Annotated[
+            int,
+            Doc(
+                "Max number of JetStream messages published with `no_confirm=True` awaiting acknowledgement. "
+                "Further publishing waits for the free slot.",
+            ),
+        ] = 4000,
         # broker args
         graceful_timeout: Annotated[
             float | None,
@@ -215,6 +226,18 @@ class NatsRouter(StreamRouter["Msg"]):
                 "Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.",
             ),
         ] = 15.0,
+        id_generator: Annotated[
+            "IdGenerator",
+            Doc(
+                "Function to generate `correlation_id` header of published messages.",
+            ),
+        ] = gen_cor_id,
+        start_concurrency: Annotated[
+            int,
+            Doc(
+                "Maximum number of subscribers started or stopped concurrently by the broker.",
+            ),
+        ] = 1,
         decoder: Annotated[
             Optional["CustomCallable"],
             Doc("Custom decoder object."),
@@ -523,9 +546,12 @@ class NatsRouter(StreamRouter["Msg"]):
             inbox_prefix=inbox_prefix,
             pending_size=pending_size,
             flush_timeout=flush_timeout,
+            js_max_pending=js_max_pending,
             specification=specification,
             # broker options
             graceful_timeout=graceful_timeout,
+            id_generator=id_generator,
+            start_concurrency=start_concurrency,
             decoder=decoder,
             parser=parser,
             middlewares=middlewares,
@@ -691,6 +717,21 @@ class NatsRouter(StreamRouter["Msg"]):
             int,
             Doc("Number of workers to process messages concurrently."),
         ] = 1,
+        ordering_key: Annotated[
+            Optional["OrderingKey[Msg]"],
+            Doc(
+                "Function to get a key from the raw message to process messages "
+                "with the same key in order. Requires `max_workers` > 1.",
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Options to collect messages to batches "
+                "and consume them by a single handler call. "
+                "Can be used only with a NATS Core Subscriber.",
+            ),
+        ] = None,
         no_ack: Annotated[
             bool,
             Doc("Whether to disable **FastStream** auto acknowledgement logic or not."),
@@ -871,6 +912,8 @@ class NatsRouter(StreamRouter["Msg"]):
                 decoder=decoder,
                 middlewares=middlewares,
                 max_workers=max_workers,
+                ordering_key=ordering_key,
+                micro_batch=micro_batch,
                 ack_policy=ack_policy,
                 no_ack=no_ack,
                 no_reply=no_reply,
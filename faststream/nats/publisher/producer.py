@@ -1,6 +1,9 @@
 import asyncio
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Optional
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import anyio
 import nats
@@ -8,7 +11,8 @@ from typing_extensions import override
 
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.producer import ProducerProto
-from faststream.exceptions import FeatureNotSupportedException
+from faststream._internal.utils.nuid import NUID
+from faststream.exceptions import IncorrectState
 from faststream.message import encode_message
 from faststream.nats.helpers.state import (
     ConnectedState,
@@ -19,9 +23,12 @@ from faststream.nats.parser import NatsParser
 from faststream.nats.response import NatsPublishCommand
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Mapping
+
     from fast_depends.library.serializer import SerializerProto
     from nats.aio.client import Client
     from nats.aio.msg import Msg
+    from nats.aio.subscription import Subscription
     from nats.js import JetStreamContext
 
     from faststream._internal.types import (
@@ -31,6 +38,114 @@ if TYPE_CHECKING:
     from faststream.nats.schemas import PubAck
 
 
+@dataclass
+class PublishStats:
+    """Subject JetStream messages published with `no_confirm=True` counters."""
+
+    pending: int = 0
+    acked: int = 0
+    failed: int = 0
+
+
+class PendingAcks:
+    """JetStream messages published without waiting for the acknowledgement.
+
+    Limits the number of not acknowledged messages, keeps their futures to
+    wait for them at flush and counts the publish results by subjects.
+    """
+
+    __slots__ = ("_futures", "_limiter", "stats")
+
+    def __init__(self, size: int) -> None:
+        self._limiter = asyncio.Semaphore(size)
+        self._futures: set[asyncio.Future[PubAck]] = set()
+        self.stats: defaultdict[str, PublishStats] = defaultdict(PublishStats)
+
+    async def acquire(self) -> None:
+        await self._limiter.acquire()
+
+    def publish(
+        self,
+        subject: str,
+        publish: "Awaitable[PubAck]",
+    ) -> "asyncio.Future[PubAck]":
+        future = asyncio.ensure_future(publish)
+        self._futures.add(future)
+        self.stats[subject].pending += 1
+        future.add_done_callback(partial(self._release, self.stats[subject]))
+        return future
+
+    def _release(
+        self,
+        stats: PublishStats,
+        future: "asyncio.Future[PubAck]",
+    ) -> None:
+        self._futures.discard(future)
+        self._limiter.release()
+
+        stats.pending -= 1
+        if future.cancelled() or future.exception() is not None:
+            stats.failed += 1
+        else:
+            stats.acked += 1
+
+    async def flush(self) -> None:
+        # publish errors are delivered by the futures, so just wait them
+        if self._futures:
+            await asyncio.wait(self._futures)
+
+
+class ReplyInbox:
+    """Shared wildcard inbox subscription to receive requests responses.
+
+    Every request gets its own `<inbox>.<token>` reply subject and waits for
+    the response future, so requests don't subscribe and unsubscribe an inbox
+    each. Late responses are dropped.
+    """
+
+    __slots__ = ("_lock", "_nuid", "_prefix", "_responses", "_sub")
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._nuid = NUID()
+
+        self._prefix = ""
+        self._sub: Subscription | None = None
+        self._responses: dict[str, asyncio.Future[Msg]] = {}
+
+    async def register(self, nc: "Client") -> tuple[str, "asyncio.Future[Msg]"]:
+        """Create a reply subject and a future to wait for its response."""
+        if self._sub is None:
+            async with self._lock:
+                if self._sub is None:
+                    prefix = nc.new_inbox()
+                    self._sub = await nc.subscribe(
+                        f"{prefix}.*",
+                        cb=self._on_response,
+                    )
+                    self._prefix = prefix
+
+        token = self._nuid.next().decode()
+        self._responses[token] = response = asyncio.get_running_loop().create_future()
+        return f"{self._prefix}.{token}", response
+
+    def discard(self, reply_to: str) -> None:
+        self._responses.pop(reply_to.rsplit(".", 1)[-1], None)
+
+    def close(self) -> None:
+        error = IncorrectState("Connection is closed.")
+        for response in self._responses.values():
+            if not response.done():
+                response.set_exception(error)
+        self._responses.clear()
+        self._sub = None
+
+    async def _on_response(self, msg: "Msg") -> None:
+        response = self._responses.pop(msg.subject.rsplit(".", 1)[-1], None)
+        if response is not None and not response.done():
+            response.set_result(msg)
+
+
 class NatsFastProducer(ProducerProto[NatsPublishCommand]):
     def connect(
         self,
@@ -40,15 +155,27 @@ class NatsFastProducer(ProducerProto[NatsPublishCommand]):
 
     def disconnect(self) -> None: ...
 
+    async def flush(self) -> None:
+        return None
+
+    @property
+    def publish_stats(self) -> "Mapping[str, PublishStats]":
+        return {}
+
     @abstractmethod
-    async def publish(self, cmd: "NatsPublishCommand") -> Optional["PubAck"]: ...
+    async def publish(
+        self,
+        cmd: "NatsPublishCommand",
+    ) -> Union["PubAck", "asyncio.Future[PubAck]", None]: ...
 
     @abstractmethod
     async def request(self, cmd: "NatsPublishCommand") -> "Msg": ...
 
-    async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
-        msg = "NATS doesn't support publishing in batches."
-        raise FeatureNotSupportedException(msg)
+    @abstractmethod
+    async def publish_batch(
+        self,
+        cmd: "NatsPublishCommand",
+    ) -> list["PubAck"] | None: ...
 
 
 class NatsFastProducerImpl(NatsFastProducer):
@@ -97,6 +224,24 @@ class NatsFastProducerImpl(NatsFastProducer):
             headers=headers_to_send,
         )
 
+    @override
+    async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
+        """Write all messages to the connection buffer and flush it once."""
+        connection = self.__state.connection
+        headers = cmd.headers_to_publish()
+
+        for body in cmd.batch_bodies:
+            payload, content_type = encode_message(body, self.serializer)
+
+            await connection.publish(
+                subject=cmd.destination,
+                payload=payload,
+                reply=cmd.reply_to,
+                headers={"content-type": content_type or "", **headers},
+            )
+
+        await connection.flush()
+
     @override
     async def request(self, cmd: "NatsPublishCommand") -> "Msg":
         payload, content_type = encode_message(cmd.body, self.serializer)
@@ -125,6 +270,7 @@ class NatsJSFastProducer(NatsFastProducer):
         *,
         parser: Optional["CustomCallable"],
         decoder: Optional["CustomCallable"],
+        max_pending: int = 4000,
     ) -> None:
         self.serializer: SerializerProto | None = None
 
@@ -133,6 +279,8 @@ class NatsJSFastProducer(NatsFastProducer):
         self._decoder = ParserComposition(decoder, default.decode_message)
 
         self.__state: ConnectionState[JetStreamContext] = EmptyConnectionState()
+        self._pending = PendingAcks(max_pending)
+        self._inbox = ReplyInbox()
 
     def connect(
         self,
@@ -141,12 +289,25 @@ class NatsJSFastProducer(NatsFastProducer):
     ) -> None:
         self.serializer = serializer
         self.__state = ConnectedState(connection)
+        self._inbox = ReplyInbox()
 
     def disconnect(self) -> None:
         self.__state = EmptyConnectionState()
+        self._inbox.close()
+
+    async def flush(self) -> None:
+        """Wait for all messages published with `no_confirm=True` to be acknowledged."""
+        await self._pending.flush()
+
+    @property
+    def publish_stats(self) -> "Mapping[str, PublishStats]":
+        return self._pending.stats
 
     @override
-    async def publish(self, cmd: "NatsPublishCommand") -> "PubAck":
+    async def publish(
+        self,
+        cmd: "NatsPublishCommand",
+    ) -> Union["PubAck", "asyncio.Future[PubAck]"]:
         payload, content_type = encode_message(cmd.body, self.serializer)
 
         headers_to_send = {
@@ -154,26 +315,63 @@ class NatsJSFastProducer(NatsFastProducer):
             **cmd.headers_to_publish(js=True),
         }
 
-        return await self.__state.connection.publish(
-            subject=cmd.destination,
-            payload=payload,
-            headers=headers_to_send,
-            stream=cmd.stream,
-            timeout=cmd.timeout,
+        if not cmd.no_confirm:
+            return await self.__state.connection.publish(
+                subject=cmd.destination,
+                payload=payload,
+                headers=headers_to_send,
+                stream=cmd.stream,
+                timeout=cmd.timeout,
+            )
+
+        # take the slot before the publish coroutine creation to not leak it at cancellation
+        await self._pending.acquire()
+        return self._pending.publish(
+            cmd.destination,
+            self.__state.connection.publish(
+                subject=cmd.destination,
+                payload=payload,
+                headers=headers_to_send,
+                stream=cmd.stream,
+                timeout=cmd.timeout,
+            ),
         )
 
+    @override
+    async def publish_batch(self, cmd: "NatsPublishCommand") -> list["PubAck"]:
+        """Publish all messages without waiting for each other and gather their acks.
+
+        Not acknowledged messages number is limited by `max_pending` as for
+        `no_confirm` publishing.
+        """
+        connection = self.__state.connection
+        headers = cmd.headers_to_publish(js=True)
+
+        publishes = []
+        for body in cmd.batch_bodies:
+            payload, content_type = encode_message(body, self.serializer)
+
+            await self._pending.acquire()
+            publishes.append(
+                self._pending.publish(
+                    cmd.destination,
+                    connection.publish(
+                        subject=cmd.destination,
+                        payload=payload,
+                        headers={"content-type": content_type or "", **headers},
+                        stream=cmd.stream,
+                        timeout=cmd.timeout,
+                    ),
+                ),
+            )
+
+        return list(await asyncio.gather(*publishes))
+
     @override
     async def request(self, cmd: "NatsPublishCommand") -> "Msg":
         payload, content_type = encode_message(cmd.body, self.serializer)
 
-        reply_to = self.__state.connection._nc.new_inbox()
-        future: asyncio.Future[Msg] = asyncio.Future()
-        sub = await self.__state.connection._nc.subscribe(
-            reply_to,
-            future=future,
-            max_msgs=1,
-        )
-        await sub.unsubscribe(limit=1)
+        reply_to, future = await self._inbox.register(self.__state.connection._nc)
 
         headers_to_send = {
             "content-type": content_type or "",
@@ -181,27 +379,31 @@ class NatsJSFastProducer(NatsFastProducer):
             **cmd.headers_to_publish(js=False),
         }
 
-        with anyio.fail_after(cmd.timeout):
-            await self.__state.connection.publish(
-                subject=cmd.destination,
-                payload=payload,
-                headers=headers_to_send,
-                stream=cmd.stream,
-                timeout=cmd.timeout,
-            )
+        try:
+            with anyio.fail_after(cmd.timeout):
+                await self.__state.connection.publish(
+                    subject=cmd.destination,
+                    payload=payload,
+                    headers=headers_to_send,
+                    stream=cmd.stream,
+                    timeout=cmd.timeout,
+                )
 
-            msg = await future
+                msg = await future
 
-            if (  # pragma: no cover
-                msg.headers
-                and (
-                    msg.headers.get(nats.js.api.Header.STATUS)
-                    == nats.aio.client.NO_RESPONDERS_STATUS
-                )
-            ):
-                raise nats.errors.NoRespondersError
+        finally:
+            self._inbox.discard(reply_to)
+
+        if (  # pragma: no cover
+            msg.headers
+            and (
+                msg.headers.get(nats.js.api.Header.STATUS)
+                == nats.aio.client.NO_RESPONDERS_STATUS
+            )
+        ):
+            raise nats.errors.NoRespondersError
 
-            return msg
+        return msg
 
 
 class FakeNatsFastProducer(NatsFastProducer):
@@ -211,6 +413,9 @@ class FakeNatsFastProducer(NatsFastProducer):
     def disconnect(self) -> None:
         raise NotImplementedError
 
+    async def flush(self) -> None:
+        raise NotImplementedError
+
     @override
     async def publish(self, cmd: "NatsPublishCommand") -> None:
         raise NotImplementedError
@@ -221,5 +426,4 @@ class FakeNatsFastProducer(NatsFastProducer):
 
     @override
     async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
-        msg = "NATS doesn't support publishing in batches."
-        raise FeatureNotSupportedException(msg)
+        raise NotImplementedError
@@ -1,15 +1,16 @@
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Union, cast
 
 from typing_extensions import overload, override
 
 from faststream._internal.endpoint.publisher import PublisherUsecase
-from faststream.message import gen_cor_id
 from faststream.nats.response import NatsPublishCommand
 from faststream.nats.schemas.js_stream import compile_nats_wildcard
 from faststream.response.publish_type import PublishType
 
 if TYPE_CHECKING:
+    import asyncio
+
     from faststream._internal.basic_types import SendableMessage
     from faststream._internal.endpoint.publisher import PublisherSpecification
     from faststream._internal.producer import ProducerProto
@@ -61,6 +62,8 @@ class LogicPublisher(PublisherUsecase):
         correlation_id: str | None = None,
         stream: None = None,
         timeout: float | None = None,
+        *,
+        no_confirm: bool = False,
     ) -> None: ...
 
     @overload
@@ -73,8 +76,24 @@ class LogicPublisher(PublisherUsecase):
         correlation_id: str | None = None,
         stream: str | None = None,
         timeout: float | None = None,
+        *,
+        no_confirm: Literal[False] = False,
     ) -> "PubAck": ...
 
+    @overload
+    async def publish(
+        self,
+        message: "SendableMessage",
+        subject: str = "",
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        *,
+        no_confirm: Literal[True],
+    ) -> "asyncio.Future[PubAck]": ...
+
     @override
     async def publish(
         self,
@@ -85,7 +104,9 @@ class LogicPublisher(PublisherUsecase):
         correlation_id: str | None = None,
         stream: str | None = None,
         timeout: float | None = None,
-    ) -> Optional["PubAck"]:
+        *,
+        no_confirm: bool = False,
+    ) -> Union["PubAck", "asyncio.Future[PubAck]", None]:
         """Publish message directly.
 
         Args:
@@ -107,26 +128,31 @@ class LogicPublisher(PublisherUsecase):
                 Can be omitted without any effect if you doesn't want PubAck frame.
             timeout:
                 Timeout to send message to NATS.
+            no_confirm:
+                Do not wait for the stream PubAck frame. The number of not acknowledged messages
+                is limited by the broker `js_max_pending` option. Use `flush` to wait for them all.
 
         Returns:
             `None` if you publishes a regular message.
             `faststream.nats.PubAck` if you publishes a message to stream.
+            `asyncio.Future` with `faststream.nats.PubAck` if you publishes a message to stream with no_confirm = True.
         """
         cmd = NatsPublishCommand(
             message,
             subject=subject or self.subject,
             headers=self.headers | (headers or {}),
             reply_to=reply_to or self.reply_to,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self._outer_config.id_generator(),
             stream=stream or getattr(self.stream, "name", None),
             timeout=timeout or self.timeout,
+            no_confirm=no_confirm,
             _publish_type=PublishType.PUBLISH,
         )
 
-        response: PubAck | None
+        response: PubAck | asyncio.Future[PubAck] | None
         if cmd.stream:
             response = cast(
-                "PubAck",
+                "PubAck | asyncio.Future[PubAck]",
                 await self._basic_publish(
                     cmd,
                     producer=self._outer_config.js_producer,
@@ -142,6 +168,10 @@ class LogicPublisher(PublisherUsecase):
 
         return response
 
+    async def flush(self) -> None:
+        """Wait for all stream messages published with `no_confirm=True` to be acknowledged."""
+        await self._outer_config.js_producer.flush()
+
     @override
     async def _publish(
         self,
@@ -213,7 +243,7 @@ class LogicPublisher(PublisherUsecase):
             subject=subject or self.subject,
             headers=self.headers | (headers or {}),
             timeout=timeout or self.timeout,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self._outer_config.id_generator(),
             stream=stream or getattr(self.stream, "name", None),
             _publish_type=PublishType.REQUEST,
         )
@@ -1,5 +1,7 @@
 from typing import Literal, Optional, Union, overload
 
+from faststream.exceptions import SetupError
+
 
 class PullSub:
     """A class to represent a NATS pull subscription.
@@ -9,11 +11,23 @@ class PullSub:
         timeout (:obj:`float`, optional): Wait this time for required batch size will be accumulated in stream
             in seconds (default is `5.0`).
         batch (bool): Whether to propagate consuming batch as iterable object to your handler (default is `False`).
+        max_batch_size (:obj:`int`, optional): Enables adaptive fetching: the batch size starts from `batch_size` and
+            changes up to this value by the batches processing latency. The next batch is fetched while the previous
+            one is still processing (default is `None`).
+        target_latency (float): Desired batch processing time in seconds to adapt the batch size to (default is `1.0`).
+        max_bytes (:obj:`int`, optional): Bound the adaptive batch size by the observed messages size to fetch
+            about this number of bytes per batch (default is `None`).
+        heartbeat (:obj:`float`, optional): Idle heartbeat interval in seconds for fetch requests to detect
+            the server is gone before the fetch timeout (default is `None`).
     """
 
     __slots__ = (
         "batch",
         "batch_size",
+        "heartbeat",
+        "max_batch_size",
+        "max_bytes",
+        "target_latency",
         "timeout",
     )
 
@@ -22,11 +36,37 @@ class PullSub:
         batch_size: int = 1,
         timeout: float | None = 5.0,
         batch: bool = False,
+        *,
+        max_batch_size: int | None = None,
+        target_latency: float = 1.0,
+        max_bytes: int | None = None,
+        heartbeat: float | None = None,
     ) -> None:
+        if max_batch_size is not None and max_batch_size < batch_size:
+            msg = "`max_batch_size` should be greater or equal to `batch_size`."
+            raise SetupError(msg)
+
+        if target_latency <= 0:
+            msg = "`target_latency` should be greater than 0."
+            raise SetupError(msg)
+
+        if max_bytes is not None and max_bytes <= 0:
+            msg = "`max_bytes` should be greater than 0."
+            raise SetupError(msg)
+
         self.batch_size = batch_size
         self.batch = batch
         self.timeout = timeout
 
+        self.max_batch_size = max_batch_size
+        self.target_latency = target_latency
+        self.max_bytes = max_bytes
+        self.heartbeat = heartbeat
+
+    @property
+    def adaptive(self) -> bool:
+        return self.max_batch_size is not None
+
     @overload
     @classmethod
     def validate(cls, value: Literal[True]) -> "PullSub": ...
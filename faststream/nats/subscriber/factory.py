@@ -20,6 +20,7 @@ from faststream.middlewares import AckPolicy
 from .config import NatsSubscriberConfig, NatsSubscriberSpecificationConfig
 from .specification import NatsSubscriberSpecification, NotIncludeSpecifation
 from .usecases import (
+    BatchCoreSubscriber,
     BatchPullStreamSubscriber,
     ConcurrentCoreSubscriber,
     ConcurrentPullStreamSubscriber,
@@ -33,8 +34,11 @@ from .usecases import (
 )
 
 if TYPE_CHECKING:
+    from nats.aio.msg import Msg
     from nats.js import api
 
+    from faststream._internal.endpoint.subscriber.batching import MicroBatch
+    from faststream._internal.types import OrderingKey
     from faststream.nats.configs import NatsBrokerConfig
     from faststream.nats.schemas import JStream, KvWatch, ObjWatch, PullSub
 
@@ -69,6 +73,8 @@ def create_subscriber(
     # custom args
     ack_first: bool,
     max_workers: int,
+    ordering_key: Optional["OrderingKey[Msg]"],
+    micro_batch: Optional["MicroBatch"],
     stream: Optional["JStream"],
     # Subscriber args
     ack_policy: "AckPolicy",
@@ -100,6 +106,8 @@ def create_subscriber(
         obj_watch=obj_watch,
         ack_first=ack_first,
         max_workers=max_workers,
+        ordering_key=ordering_key,
+        micro_batch=micro_batch,
         stream=stream,
     )
 
@@ -206,10 +214,19 @@ def create_subscriber(
         )
 
     if stream is None:
+        if micro_batch is not None:
+            return BatchCoreSubscriber(
+                **subscriber_options,
+                micro_batch=micro_batch,
+                max_workers=max_workers,
+                queue=queue,
+            )
+
         if max_workers > 1:
             return ConcurrentCoreSubscriber(
                 **subscriber_options,
                 max_workers=max_workers,
+                ordering_key=ordering_key,
                 queue=queue,
             )
 
@@ -224,12 +241,14 @@ def create_subscriber(
                 **subscriber_options,
                 queue=queue,
                 max_workers=max_workers,
+                ordering_key=ordering_key,
                 pull_sub=pull_sub,
             )
 
         return ConcurrentPushStreamSubscriber(
             **subscriber_options,
             max_workers=max_workers,
+            ordering_key=ordering_key,
         )
 
     if pull_sub is not None:
@@ -274,6 +293,8 @@ def _validate_input_for_misconfigure(  # noqa: PLR0915
     no_ack: bool,  # default EMPTY
     ack_first: bool,  # default EMPTY
     max_workers: int,  # default 1
+    ordering_key: Optional["OrderingKey[Msg]"],
+    micro_batch: Optional["MicroBatch"],
     stream: Optional["JStream"],
 ) -> None:
     if ack_policy is not EMPTY:
@@ -349,6 +370,14 @@ def _validate_input_for_misconfigure(  # noqa: PLR0915
         msg = "You can't use both the `kv_watch` and `obj_watch` options simultaneously."
         raise SetupError(msg)
 
+    if ordering_key is not None and (max_workers <= 1 or micro_batch is not None):
+        msg = "The `ordering_key` option can be used only with `max_workers` > 1 and without `micro_batch`."
+        raise SetupError(msg)
+
+    if micro_batch is not None and any((stream, kv_watch, obj_watch)):
+        msg = "The `micro_batch` option can be used only with a NATS Core Subscriber."
+        raise SetupError(msg)
+
     if pull_sub and not stream:
         msg = "JetStream Pull Subscriber can only be used with the `stream` option."
         raise SetupError(msg)
@@ -0,0 +1,93 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nats.aio.msg import Msg
+
+    from faststream.nats.schemas import PullSub
+
+
+class AdaptiveBatchSize:
+    """Pull subscriber fetch batch size adapting to the processing latency.
+
+    The size grows by half after full batches processed faster than the target
+    latency and halves after slow ones. With `max_bytes` the size is also bounded
+    by the observed average message size, so a batch fits the bytes limit.
+    """
+
+    __slots__ = (
+        "_avg_msg_size",
+        "max_bytes",
+        "max_size",
+        "min_size",
+        "size",
+        "target_latency",
+    )
+
+    def __init__(
+        self,
+        size: int,
+        *,
+        max_size: int,
+        target_latency: float,
+        min_size: int = 1,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.size = size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.max_bytes = max_bytes
+
+        self._avg_msg_size = 0.0
+
+    @classmethod
+    def from_pull_sub(cls, pull_sub: "PullSub") -> "AdaptiveBatchSize":
+        if pull_sub.max_batch_size is None:
+            # not adaptive subscription fetches fixed size batches
+            return cls(
+                pull_sub.batch_size,
+                min_size=pull_sub.batch_size,
+                max_size=pull_sub.batch_size,
+                target_latency=pull_sub.target_latency,
+            )
+
+        return cls(
+            pull_sub.batch_size,
+            max_size=pull_sub.max_batch_size,
+            target_latency=pull_sub.target_latency,
+            max_bytes=pull_sub.max_bytes,
+        )
+
+    def next_batch(self, in_flight: int = 0) -> int:
+        """Messages number to fetch next, `0` if there are enough messages in flight.
+
+        One more batch is allowed to be fetched while the previous one is processing.
+        """
+        size = self.size
+        if self.max_bytes and self._avg_msg_size:
+            size = min(
+                size,
+                max(self.min_size, int(self.max_bytes // self._avg_msg_size)),
+            )
+        return max(0, min(size, 2 * size - in_flight))
+
+    def update(
+        self,
+        messages: list["Msg"],
+        *,
+        requested: int,
+        latency: float,
+    ) -> None:
+        """Adapt the size to the processed batch results."""
+        if messages:
+            batch_size = sum(len(m.data) for m in messages) / len(messages)
+            if self._avg_msg_size:
+                self._avg_msg_size = 0.8 * self._avg_msg_size + 0.2 * batch_size
+            else:
+                self._avg_msg_size = batch_size
+
+        if latency > self.target_latency:
+            self.size = max(self.min_size, self.size // 2)
+
+        elif len(messages) >= requested:
+            self.size = min(self.max_size, self.size + max(1, self.size // 2))
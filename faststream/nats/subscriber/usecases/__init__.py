@@ -1,5 +1,9 @@
 from .basic import LogicSubscriber
-from .core_subscriber import ConcurrentCoreSubscriber, CoreSubscriber
+from .core_subscriber import (
+    BatchCoreSubscriber,
+    ConcurrentCoreSubscriber,
+    CoreSubscriber,
+)
 from .key_value_subscriber import KeyValueWatchSubscriber
 from .object_storage_subscriber import ObjStoreWatchSubscriber
 from .stream_pull_subscriber import (
@@ -13,6 +17,7 @@ from .stream_push_subscriber import (
 )
 
 __all__ = (
+    "BatchCoreSubscriber",
     "BatchPullStreamSubscriber",
     "ConcurrentCoreSubscriber",
     "ConcurrentPullStreamSubscriber",
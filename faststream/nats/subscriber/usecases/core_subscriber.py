@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Annotated, Any, Optional
 from nats.errors import TimeoutError
 from typing_extensions import Doc, override
 
-from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin
+from faststream._internal.endpoint.subscriber.mixins import BatchingMixin, ConcurrentMixin
 from faststream._internal.endpoint.utils import process_msg
 from faststream.middlewares import AckPolicy
 from faststream.nats.parser import NatsParser
@@ -150,3 +150,23 @@ class ConcurrentCoreSubscriber(ConcurrentMixin["Msg"], CoreSubscriber):
             cb=self._put_msg,
             **self.extra_options,
         )
+
+
+class BatchCoreSubscriber(BatchingMixin["Msg"], CoreSubscriber):
+    @override
+    async def _create_subscription(self) -> None:
+        """Create NATS subscription and start batches collecting task."""
+        if self.subscription:
+            return
+
+        self.start_consume_task()
+
+        self.subscription = await self.connection.subscribe(
+            subject=self.clear_subject,
+            queue=self.queue,
+            cb=self._put_msg,
+            **self.extra_options,
+        )
+
+    def _get_msg_size(self, msg: "Msg") -> int:
+        return len(msg.data)
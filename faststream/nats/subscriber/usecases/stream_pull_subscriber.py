@@ -1,4 +1,6 @@
-from collections.abc import AsyncIterator, Awaitable, Callable
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable, Coroutine
 from contextlib import suppress
 from typing import TYPE_CHECKING, Any, Optional, cast
 
@@ -11,6 +13,7 @@ from faststream._internal.endpoint.utils import process_msg
 from faststream.nats.parser import (
     BatchParser,
 )
+from faststream.nats.subscriber.fetch import AdaptiveBatchSize
 
 from .basic import DefaultSubscriber
 from .stream_basic import StreamSubscriber
@@ -54,6 +57,10 @@ class PullStreamSubscriber(
 
         self.pull_sub = pull_sub
 
+        # adaptive fetching state
+        self._in_flight = 0
+        self._batch_processed = asyncio.Event()
+
     @override
     async def _create_subscription(self) -> None:
         """Create NATS subscription and start consume task."""
@@ -69,17 +76,22 @@ class PullStreamSubscriber(
 
     async def _consume_pull(
         self,
-        cb: Callable[["Msg"], Awaitable["SendableMessage"]],
+        cb: Callable[["Msg"], Coroutine[Any, Any, "SendableMessage"]],
     ) -> None:
         """Endless task consuming messages using NATS Pull subscriber."""
         assert self.subscription
 
+        if self.pull_sub.adaptive:
+            await self._consume_pull_adaptive(cb)
+            return
+
         while self.running:  # pragma: no branch
             messages = []
             with suppress(TimeoutError, ConnectionClosedError):
                 messages = await self.subscription.fetch(
                     batch=self.pull_sub.batch_size,
                     timeout=self.pull_sub.timeout,
+                    heartbeat=self.pull_sub.heartbeat,
                 )
 
             if messages:
@@ -87,6 +99,66 @@ class PullStreamSubscriber(
                     for msg in messages:
                         tg.start_soon(cb, msg)
 
+    async def _consume_pull_adaptive(
+        self,
+        cb: Callable[["Msg"], Coroutine[Any, Any, "SendableMessage"]],
+    ) -> None:
+        """Fetch the next batch while the previous one is processing."""
+        assert self.subscription
+
+        batch_size = AdaptiveBatchSize.from_pull_sub(self.pull_sub)
+        self._in_flight = 0
+        self._batch_processed.clear()
+
+        async with anyio.create_task_group() as tg:
+            while self.running:  # pragma: no branch
+                if not (requested := batch_size.next_batch(self._in_flight)):
+                    self._batch_processed.clear()
+                    await self._batch_processed.wait()
+                    continue
+
+                messages = []
+                with suppress(TimeoutError, ConnectionClosedError):
+                    messages = await self.subscription.fetch(
+                        batch=requested,
+                        timeout=self.pull_sub.timeout,
+                        heartbeat=self.pull_sub.heartbeat,
+                    )
+
+                if messages:
+                    self._in_flight += len(messages)
+                    tg.start_soon(
+                        self._process_batch,
+                        cb,
+                        messages,
+                        requested,
+                        batch_size,
+                    )
+
+    async def _process_batch(
+        self,
+        cb: Callable[["Msg"], Coroutine[Any, Any, "SendableMessage"]],
+        messages: list["Msg"],
+        requested: int,
+        batch_size: AdaptiveBatchSize,
+    ) -> None:
+        started_at = time.perf_counter()
+
+        try:
+            async with anyio.create_task_group() as tg:
+                for msg in messages:
+                    tg.start_soon(cb, msg)
+
+        finally:
+            self._in_flight -= len(messages)
+            self._batch_processed.set()
+
+        batch_size.update(
+            messages,
+            requested=requested,
+            latency=time.perf_counter() - started_at,
+        )
+
 
 class ConcurrentPullStreamSubscriber(ConcurrentMixin["Msg"], PullStreamSubscriber):
     @override
@@ -221,12 +293,23 @@ class BatchPullStreamSubscriber(
         """Endless task consuming messages using NATS Pull subscriber."""
         assert self.subscription, "You should call `create_subscription` at first."
 
+        batch_size = AdaptiveBatchSize.from_pull_sub(self.pull_sub)
+
         while self.running:  # pragma: no branch
+            requested = batch_size.next_batch()
+
             with suppress(TimeoutError, ConnectionClosedError):
                 messages = await self.subscription.fetch(
-                    batch=self.pull_sub.batch_size,
+                    batch=requested,
                     timeout=self.pull_sub.timeout,
+                    heartbeat=self.pull_sub.heartbeat,
                 )
 
                 if messages:
+                    started_at = time.perf_counter()
                     await self.consume(messages)
+                    batch_size.update(
+                        messages,
+                        requested=requested,
+                        latency=time.perf_counter() - started_at,
+                    )
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
 
     from faststream._internal.basic_types import SendableMessage
     from faststream._internal.configs.broker import ConfigComposition
+    from faststream.message import IdGenerator
     from faststream.nats.configs import NatsBrokerConfig
     from faststream.nats.publisher.usecase import LogicPublisher
     from faststream.nats.response import NatsPublishCommand
@@ -112,6 +113,7 @@ class FakeProducer(NatsFastProducer):
             correlation_id=cmd.correlation_id,
             reply_to=cmd.reply_to,
             serializer=self.broker.config.fd_config._serializer,
+            id_generator=self.broker.config.id_generator,
         )
 
         for handler in _find_handler(
@@ -128,6 +130,33 @@ class FakeProducer(NatsFastProducer):
 
             await self._execute_handler(msg, cmd.destination, handler)
 
+    @override
+    async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
+        incoming = [
+            build_message(
+                message=body,
+                subject=cmd.destination,
+                headers=cmd.headers,
+                correlation_id=cmd.correlation_id,
+                reply_to=cmd.reply_to,
+                serializer=self.broker.config.fd_config._serializer,
+                id_generator=self.broker.config.id_generator,
+            )
+            for body in cmd.batch_bodies
+        ]
+
+        for handler in _find_handler(
+            cast("list[LogicSubscriber[Any]]", self.broker.subscribers),
+            cmd.destination,
+            cmd.stream,
+        ):
+            if (pull := getattr(handler, "pull_sub", None)) and pull.batch:
+                await self._execute_handler(incoming, cmd.destination, handler)
+
+            else:
+                for msg in incoming:
+                    await self._execute_handler(msg, cmd.destination, handler)
+
     @override
     async def request(self, cmd: "NatsPublishCommand") -> "PatchedMessage":
         incoming = build_message(
@@ -136,6 +165,7 @@ class FakeProducer(NatsFastProducer):
             headers=cmd.headers,
             correlation_id=cmd.correlation_id,
             serializer=self.broker.config.fd_config._serializer,
+            id_generator=self.broker.config.id_generator,
         )
 
         for handler in _find_handler(
@@ -169,6 +199,7 @@ class FakeProducer(NatsFastProducer):
             headers=result.headers,
             correlation_id=result.correlation_id,
             serializer=self.broker.config.fd_config._serializer,
+            id_generator=self.broker.config.id_generator,
         )
 
 
@@ -218,6 +249,7 @@ def build_message(
     correlation_id: str | None = None,
     headers: dict[str, str] | None = None,
     serializer: Optional["SerializerProto"] = None,
+    id_generator: "IdGenerator" = gen_cor_id,
 ) -> "PatchedMessage":
     msg, content_type = encode_message(message, serializer=serializer)
     return PatchedMessage(
@@ -227,7 +259,7 @@ def build_message(
         data=msg,
         headers={
             "content-type": content_type or "",
-            "correlation_id": correlation_id or gen_cor_id(),
+            "correlation_id": correlation_id or id_generator(),
             **(headers or {}),
         },
     )
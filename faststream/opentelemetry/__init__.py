@@ -1,7 +1,12 @@
-from faststream.opentelemetry.annotations import CurrentBaggage, CurrentSpan
-from faststream.opentelemetry.baggage import Baggage
-from faststream.opentelemetry.middleware import TelemetryMiddleware
-from faststream.opentelemetry.provider import TelemetrySettingsProvider
+from typing import TYPE_CHECKING
+
+from faststream._internal.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from faststream.opentelemetry.annotations import CurrentBaggage, CurrentSpan
+    from faststream.opentelemetry.baggage import Baggage
+    from faststream.opentelemetry.middleware import TelemetryMiddleware
+    from faststream.opentelemetry.provider import TelemetrySettingsProvider
 
 __all__ = (
     "Baggage",
@@ -10,3 +15,14 @@ __all__ = (
     "TelemetryMiddleware",
     "TelemetrySettingsProvider",
 )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "CurrentBaggage": "faststream.opentelemetry.annotations",
+        "CurrentSpan": "faststream.opentelemetry.annotations",
+        "Baggage": "faststream.opentelemetry.baggage",
+        "TelemetryMiddleware": "faststream.opentelemetry.middleware",
+        "TelemetrySettingsProvider": "faststream.opentelemetry.provider",
+    },
+)
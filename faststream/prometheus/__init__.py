@@ -1,9 +1,23 @@
-from faststream.prometheus.middleware import PrometheusMiddleware
-from faststream.prometheus.provider import MetricsSettingsProvider
-from faststream.prometheus.types import ConsumeAttrs
+from typing import TYPE_CHECKING
+
+from faststream._internal.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from faststream.prometheus.middleware import PrometheusMiddleware
+    from faststream.prometheus.provider import MetricsSettingsProvider
+    from faststream.prometheus.types import ConsumeAttrs
 
 __all__ = (
     "ConsumeAttrs",
     "MetricsSettingsProvider",
     "PrometheusMiddleware",
 )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "PrometheusMiddleware": "faststream.prometheus.middleware",
+        "MetricsSettingsProvider": "faststream.prometheus.provider",
+        "ConsumeAttrs": "faststream.prometheus.types",
+    },
+)
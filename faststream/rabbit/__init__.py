@@ -1,6 +1,16 @@
-from faststream._internal.testing.app import TestApp
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+from faststream._internal.lazy import lazy_attributes
+
+if find_spec("aio_pika") is None:
+    from faststream.exceptions import INSTALL_FASTSTREAM_RABBIT
+
+    raise ImportError(INSTALL_FASTSTREAM_RABBIT)
+
+if TYPE_CHECKING:
+    from faststream._internal.testing.app import TestApp
 
-try:
     from .annotations import RabbitMessage
     from .broker import RabbitBroker, RabbitPublisher, RabbitRoute, RabbitRouter
     from .response import RabbitPublishCommand, RabbitResponse
@@ -11,18 +21,12 @@ try:
         RabbitExchange,
         RabbitQueue,
     )
+    from .subscriber.acks import DeferredAck
     from .testing import TestRabbitBroker
 
-except ImportError as e:
-    if "'aio_pika'" not in e.msg:
-        raise
-
-    from faststream.exceptions import INSTALL_FASTSTREAM_RABBIT
-
-    raise ImportError(INSTALL_FASTSTREAM_RABBIT) from e
-
 __all__ = (
     "Channel",
+    "DeferredAck",
     "ExchangeType",
     "QueueType",
     "RabbitBroker",
@@ -37,3 +41,24 @@ __all__ = (
     "TestApp",
     "TestRabbitBroker",
 )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "TestApp": "faststream._internal.testing.app",
+        "RabbitMessage": ".annotations",
+        "RabbitBroker": ".broker",
+        "RabbitPublisher": ".broker",
+        "RabbitRoute": ".broker",
+        "RabbitRouter": ".broker",
+        "RabbitPublishCommand": ".response",
+        "RabbitResponse": ".response",
+        "Channel": ".schemas",
+        "ExchangeType": ".schemas",
+        "QueueType": ".schemas",
+        "RabbitExchange": ".schemas",
+        "RabbitQueue": ".schemas",
+        "DeferredAck": ".subscriber.acks",
+        "TestRabbitBroker": ".testing",
+    },
+)
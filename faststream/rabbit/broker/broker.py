@@ -3,9 +3,11 @@ from collections.abc import Iterable, Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
+    Literal,
     Optional,
     Union,
     cast,
+    overload,
 )
 from urllib.parse import urlparse
 
@@ -40,6 +42,7 @@ from .logging import make_rabbit_logger_state
 from .registrator import RabbitRegistrator
 
 if TYPE_CHECKING:
+    import asyncio
     from types import TracebackType
 
     import aiormq
@@ -59,8 +62,10 @@ if TYPE_CHECKING:
         BrokerMiddleware,
         CustomCallable,
     )
+    from faststream.message import IdGenerator
     from faststream.rabbit.helpers import RabbitDeclarer
     from faststream.rabbit.message import RabbitMessage
+    from faststream.rabbit.publisher.producer import AioPikaFastProducer
     from faststream.rabbit.types import AioPikaSendableMessage
     from faststream.rabbit.utils import RabbitClientProperties
     from faststream.security import BaseSecurity
@@ -89,6 +94,8 @@ class RabbitBroker(
         app_id: str | None = SERVICE_NAME,
         # broker base args
         graceful_timeout: float | None = None,
+        id_generator: "IdGenerator" = gen_cor_id,
+        start_concurrency: int = 1,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         dependencies: Iterable["Dependant"] = (),
@@ -123,6 +130,8 @@ class RabbitBroker(
             default_channel: Default channel settings to use.
             app_id: Application name to mark outgoing messages by.
             graceful_timeout: Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            id_generator: Function to generate `correlation_id` property of outgoing messages.
+            start_concurrency: Maximum number of subscribers started or stopped concurrently by the broker.
             decoder: Custom decoder object.
             parser: Custom parser object.
             dependencies: Dependencies to apply to all broker subscribers.
@@ -161,13 +170,18 @@ class RabbitBroker(
         if protocol is None:
             protocol = built_asyncapi_url.scheme
 
+        default_channel = default_channel or Channel()
+
         cm = ChannelManagerImpl(default_channel)
         declarer = RabbitDeclarerImpl(cm)
+        cm.on_rebuild(declarer.forget_channel)
 
         producer = AioPikaFastProducerImpl(
             declarer=declarer,
             decoder=decoder,
             parser=parser,
+            max_unconfirmed=default_channel.max_unconfirmed,
+            id_generator=id_generator,
         )
 
         super().__init__(
@@ -200,6 +214,8 @@ class RabbitBroker(
                 # subscriber args
                 broker_dependencies=dependencies,
                 graceful_timeout=graceful_timeout,
+                id_generator=id_generator,
+                start_concurrency=start_concurrency,
                 extra_context={
                     "broker": self,
                 },
@@ -238,6 +254,10 @@ class RabbitBroker(
         await super().stop(exc_type, exc_val, exc_tb)
 
         if self._channel is not None:
+            # do not lose messages published without waiting for the confirmation
+            producer = cast("AioPikaFastProducer", self.config.producer)
+            await producer.flush()
+
             if not self._channel.is_closed:
                 await self._channel.close()
 
@@ -270,6 +290,93 @@ class RabbitBroker(
         await self.declare_queue(RABBIT_REPLY)
         await super().start()
 
+    @overload
+    async def publish(
+        self,
+        message: "AioPikaSendableMessage" = None,
+        queue: Union["RabbitQueue", str] = "",
+        exchange: Union["RabbitExchange", str, None] = None,
+        *,
+        routing_key: str = "",
+        # publish options
+        mandatory: bool = True,
+        immediate: bool = False,
+        timeout: "TimeoutType" = None,
+        persist: bool = False,
+        reply_to: str | None = None,
+        correlation_id: str | None = None,
+        # message options
+        headers: Optional["HeadersType"] = None,
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+        expiration: Optional["DateType"] = None,
+        message_id: str | None = None,
+        timestamp: Optional["DateType"] = None,
+        message_type: str | None = None,
+        user_id: str | None = None,
+        priority: int | None = None,
+        no_confirm: Literal[True],
+    ) -> "asyncio.Future[aiormq.abc.ConfirmationFrameType | None]": ...
+
+    @overload
+    async def publish(
+        self,
+        message: "AioPikaSendableMessage" = None,
+        queue: Union["RabbitQueue", str] = "",
+        exchange: Union["RabbitExchange", str, None] = None,
+        *,
+        routing_key: str = "",
+        # publish options
+        mandatory: bool = True,
+        immediate: bool = False,
+        timeout: "TimeoutType" = None,
+        persist: bool = False,
+        reply_to: str | None = None,
+        correlation_id: str | None = None,
+        # message options
+        headers: Optional["HeadersType"] = None,
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+        expiration: Optional["DateType"] = None,
+        message_id: str | None = None,
+        timestamp: Optional["DateType"] = None,
+        message_type: str | None = None,
+        user_id: str | None = None,
+        priority: int | None = None,
+        no_confirm: Literal[False] = False,
+    ) -> Optional["aiormq.abc.ConfirmationFrameType"]: ...
+
+    @overload
+    async def publish(
+        self,
+        message: "AioPikaSendableMessage" = None,
+        queue: Union["RabbitQueue", str] = "",
+        exchange: Union["RabbitExchange", str, None] = None,
+        *,
+        routing_key: str = "",
+        # publish options
+        mandatory: bool = True,
+        immediate: bool = False,
+        timeout: "TimeoutType" = None,
+        persist: bool = False,
+        reply_to: str | None = None,
+        correlation_id: str | None = None,
+        # message options
+        headers: Optional["HeadersType"] = None,
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+        expiration: Optional["DateType"] = None,
+        message_id: str | None = None,
+        timestamp: Optional["DateType"] = None,
+        message_type: str | None = None,
+        user_id: str | None = None,
+        priority: int | None = None,
+        no_confirm: bool = False,
+    ) -> Union[
+        Optional["aiormq.abc.ConfirmationFrameType"],
+        "asyncio.Future[aiormq.abc.ConfirmationFrameType | None]",
+    ]: ...
+
     @override
     async def publish(
         self,
@@ -295,7 +402,11 @@ class RabbitBroker(
         message_type: str | None = None,
         user_id: str | None = None,
         priority: int | None = None,
-    ) -> Optional["aiormq.abc.ConfirmationFrameType"]:
+        no_confirm: bool = False,
+    ) -> Union[
+        Optional["aiormq.abc.ConfirmationFrameType"],
+        "asyncio.Future[aiormq.abc.ConfirmationFrameType | None]",
+    ]:
         """Publish message directly.
 
         This method allows you to publish message in not AsyncAPI-documented way. You can use it in another frameworks
@@ -342,15 +453,20 @@ class RabbitBroker(
                 Publisher connection User ID, validated if set.
             priority:
                 The message priority (0 by default).
+            no_confirm:
+                Do not wait for RabbitMQ publish confirmation. The number of unconfirmed messages
+                is limited by the channel `max_unconfirmed` option. Use `flush` to wait for them all.
 
         Returns:
             An optional `aiormq.abc.ConfirmationFrameType` representing the confirmation frame if RabbitMQ is configured to send confirmations.
+            `asyncio.Future` with the confirmation frame if no_confirm = True. It raises `aio_pika.exceptions.DeliveryError`
+            if the message is nacked or returned (with the channel `on_return_raises` option).
         """
         cmd = RabbitPublishCommand(
             message,
             routing_key=routing_key or RabbitQueue.validate(queue).routing(),
             exchange=RabbitExchange.validate(exchange),
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self.config.id_generator(),
             app_id=self.config.app_id,
             mandatory=mandatory,
             immediate=immediate,
@@ -366,15 +482,120 @@ class RabbitBroker(
             user_id=user_id,
             timeout=timeout,
             priority=priority,
+            no_confirm=no_confirm,
             _publish_type=PublishType.PUBLISH,
         )
 
-        result: aiormq.abc.ConfirmationFrameType | None = await super()._basic_publish(
-            cmd,
-            producer=self._producer,
+        result: (
+            aiormq.abc.ConfirmationFrameType
+            | asyncio.Future[aiormq.abc.ConfirmationFrameType | None]
+            | None
+        ) = await super()._basic_publish(cmd, producer=self._producer)
+        return result
+
+    @override
+    async def publish_batch(
+        self,
+        *messages: "AioPikaSendableMessage",
+        queue: Union["RabbitQueue", str] = "",
+        exchange: Union["RabbitExchange", str, None] = None,
+        routing_key: str = "",
+        # publish options
+        mandatory: bool = True,
+        immediate: bool = False,
+        timeout: "TimeoutType" = None,
+        persist: bool = False,
+        reply_to: str | None = None,
+        correlation_id: str | None = None,
+        # message options
+        headers: Optional["HeadersType"] = None,
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+        expiration: Optional["DateType"] = None,
+        timestamp: Optional["DateType"] = None,
+        message_type: str | None = None,
+        user_id: str | None = None,
+        priority: int | None = None,
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"]]:
+        """Publish multiple messages to one channel and wait for all confirmations together.
+
+        Messages are sent one by one without waiting for the previous message confirmation.
+        The number of unconfirmed messages is limited by the channel `max_unconfirmed` option.
+
+        Args:
+            *messages:
+                Messages bodies to send.
+            queue:
+                Message routing key to publish with.
+            exchange:
+                Target exchange to publish messages to.
+            routing_key:
+                Message routing key to publish with. Overrides `queue` option if presented.
+            mandatory:
+                Client waits for confirmation that the message is placed to some queue. RabbitMQ returns message to client if there is no suitable queue.
+            immediate:
+                Client expects that there is consumer ready to take the message to work. RabbitMQ returns message to client if there is no suitable consumer.
+            timeout:
+                Send confirmation time from RabbitMQ.
+            persist:
+                Restore the messages on RabbitMQ reboot.
+            reply_to:
+                Reply message routing key to send with (always sending to default exchange).
+            correlation_id:
+                Manual messages **correlation_id** setter. **correlation_id** is a useful option to trace messages.
+            headers:
+                Messages headers to store metainformation.
+            content_type:
+                Messages **content-type** header. Used by application, not core RabbitMQ. Will be set automatically if not specified.
+            content_encoding:
+                Messages body content encoding, e.g. **gzip**.
+            expiration:
+                Messages expiration (lifetime) in seconds (or datetime or timedelta).
+            timestamp:
+                Messages publish timestamp. Generated automatically if not presented.
+            message_type:
+                Application-specific message type, e.g. **orders.created**.
+            user_id:
+                Publisher connection User ID, validated if set.
+            priority:
+                The messages priority (0 by default).
+
+        Returns:
+            Confirmation frames in the messages order. It raises `aio_pika.exceptions.DeliveryError`
+            if any message is nacked or returned (with the channel `on_return_raises` option).
+        """
+        cmd = RabbitPublishCommand(
+            *messages,
+            routing_key=routing_key or RabbitQueue.validate(queue).routing(),
+            exchange=RabbitExchange.validate(exchange),
+            correlation_id=correlation_id or self.config.id_generator(),
+            app_id=self.config.app_id,
+            mandatory=mandatory,
+            immediate=immediate,
+            persist=persist,
+            reply_to=reply_to,
+            headers=headers,
+            content_type=content_type,
+            content_encoding=content_encoding,
+            expiration=expiration,
+            message_type=message_type,
+            timestamp=timestamp,
+            user_id=user_id,
+            timeout=timeout,
+            priority=priority,
+            _publish_type=PublishType.PUBLISH,
         )
+
+        result: list[
+            aiormq.abc.ConfirmationFrameType | None
+        ] = await super()._basic_publish_batch(cmd, producer=self._producer)
         return result
 
+    async def flush(self) -> None:
+        """Wait for all messages published with `no_confirm=True` to be confirmed."""
+        producer = cast("AioPikaFastProducer", self.config.producer)
+        await producer.flush()
+
     @override
     async def request(  # type: ignore[override]
         self,
@@ -431,7 +652,7 @@ class RabbitBroker(
             message,
             routing_key=routing_key or RabbitQueue.validate(queue).routing(),
             exchange=RabbitExchange.validate(exchange),
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self.config.id_generator(),
             app_id=self.config.app_id,
             mandatory=mandatory,
             immediate=immediate,
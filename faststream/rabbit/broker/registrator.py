@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from aio_pika.abc import DateType, HeadersType, TimeoutType
     from fast_depends.dependencies import Dependant
 
+    from faststream._internal.endpoint.subscriber.batching import MicroBatch
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -30,6 +31,7 @@ if TYPE_CHECKING:
     )
     from faststream.rabbit.publisher import RabbitPublisher
     from faststream.rabbit.subscriber import RabbitSubscriber
+    from faststream.rabbit.subscriber.acks import DeferredAck
 
 
 class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
@@ -43,6 +45,8 @@ class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
         *,
         channel: Optional["Channel"] = None,
         consume_args: dict[str, Any] | None = None,
+        micro_batch: Optional["MicroBatch"] = None,
+        deferred_ack: Optional["DeferredAck"] = None,
         no_ack: Annotated[
             bool,
             deprecated(
@@ -75,6 +79,8 @@ class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
             exchange (Union[str, RabbitExchange, None], optional): RabbitMQ exchange to bind queue to. Uses default exchange if not presented. **FastStream** declares exchange object automatically by default.
             channel (Optional[Channel], optional): Channel to use for consuming messages.
             consume_args (dict[str, Any] | None, optional): Extra consumer arguments to use in `queue.consume(...)` method.
+            micro_batch (Optional[MicroBatch], optional): Options to collect messages to batches and consume them by a single handler call.
+            deferred_ack (Optional[DeferredAck], optional): Options to send acknowledgements by batches with a single multiple `basic.ack` frame instead of a frame per message.
             no_ack (bool, optional): Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy (AckPolicy, optional): Acknowledgement policy for message processing.
             dependencies (Iterable[Dependant], optional): Dependencies list (`[Dependant(),]`) to apply to the subscriber.
@@ -94,6 +100,8 @@ class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
             exchange=RabbitExchange.validate(exchange),
             consume_args=consume_args,
             channel=channel,
+            micro_batch=micro_batch,
+            deferred_ack=deferred_ack,
             # subscriber args
             ack_policy=ack_policy,
             no_ack=no_ack,
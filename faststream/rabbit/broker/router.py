@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
     from faststream._internal.broker.registrator import Registrator
+    from faststream._internal.endpoint.subscriber.batching import MicroBatch
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -30,6 +31,7 @@ if TYPE_CHECKING:
         RabbitExchange,
         RabbitQueue,
     )
+    from faststream.rabbit.subscriber.acks import DeferredAck
     from faststream.rabbit.types import AioPikaSendableMessage
 
 
@@ -217,6 +219,20 @@ class RabbitRoute(SubscriberRoute):
             dict[str, Any] | None,
             Doc("Extra consumer arguments to use in `queue.consume(...)` method."),
         ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Options to collect messages to batches "
+                "and consume them by a single handler call.",
+            ),
+        ] = None,
+        deferred_ack: Annotated[
+            Optional["DeferredAck"],
+            Doc(
+                "Options to send acknowledgements by batches with a single multiple "
+                "`basic.ack` frame instead of a frame per message.",
+            ),
+        ] = None,
         # broker arguments
         dependencies: Annotated[
             Iterable["Dependant"],
@@ -276,6 +292,8 @@ class RabbitRoute(SubscriberRoute):
             queue=queue,
             exchange=exchange,
             consume_args=consume_args,
+            micro_batch=micro_batch,
+            deferred_ack=deferred_ack,
             dependencies=dependencies,
             parser=parser,
             decoder=decoder,
@@ -27,7 +27,10 @@ class RabbitBrokerConfig(BrokerConfig):
 
     def connect(self, connection: "RobustConnection") -> None:
         self.channel_manager.connect(connection)
-        self.producer.connect(serializer=self.fd_config._serializer)
+        self.producer.connect(
+            serializer=self.fd_config._serializer,
+            logger=self.logger,
+        )
 
     def disconnect(self) -> None:
         self.channel_manager.disconnect()
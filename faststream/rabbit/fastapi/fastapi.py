@@ -21,6 +21,7 @@ from faststream.__about__ import SERVICE_NAME
 from faststream._internal.constants import EMPTY
 from faststream._internal.context import ContextRepo
 from faststream._internal.fastapi.router import StreamRouter
+from faststream.message import gen_cor_id
 from faststream.middlewares import AckPolicy
 from faststream.rabbit.broker.broker import RabbitBroker as RB
 from faststream.rabbit.schemas import RabbitExchange, RabbitQueue
@@ -37,15 +38,18 @@ if TYPE_CHECKING:
     from yarl import URL
 
     from faststream._internal.basic_types import LoggerProto
+    from faststream._internal.endpoint.subscriber.batching import MicroBatch
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
         PublisherMiddleware,
         SubscriberMiddleware,
     )
+    from faststream.message import IdGenerator
     from faststream.rabbit.publisher import RabbitPublisher
     from faststream.rabbit.schemas import Channel
     from faststream.rabbit.subscriber import RabbitSubscriber
+    from faststream.rabbit.subscriber.acks import DeferredAck
     from faststream.security import BaseSecurity
     from faststream.specification.base import SpecificationFactory
     from faststream.specification.schema.extra import Tag, TagDict
@@ -112,6 +116,18 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
                 "Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.",
             ),
         ] = 15.0,
+        id_generator: Annotated[
+            "IdGenerator",
+            Doc(
+                "Function to generate `correlation_id` property of outgoing messages.",
+            ),
+        ] = gen_cor_id,
+        start_concurrency: Annotated[
+            int,
+            Doc(
+                "Maximum number of subscribers started or stopped concurrently by the broker.",
+            ),
+        ] = 1,
         decoder: Annotated[
             Optional["CustomCallable"],
             Doc("Custom decoder object."),
@@ -402,6 +418,8 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
             reconnect_interval=reconnect_interval,
             app_id=app_id,
             graceful_timeout=graceful_timeout,
+            id_generator=id_generator,
+            start_concurrency=start_concurrency,
             decoder=decoder,
             parser=parser,
             default_channel=default_channel,
@@ -462,6 +480,20 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
             dict[str, Any] | None,
             Doc("Extra consumer arguments to use in `queue.consume(...)` method."),
         ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Options to collect messages to batches "
+                "and consume them by a single handler call.",
+            ),
+        ] = None,
+        deferred_ack: Annotated[
+            Optional["DeferredAck"],
+            Doc(
+                "Options to send acknowledgements by batches with a single multiple "
+                "`basic.ack` frame instead of a frame per message.",
+            ),
+        ] = None,
         # broker arguments
         dependencies: Annotated[
             Iterable["params.Depends"],
@@ -647,6 +679,8 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
                 exchange=exchange,
                 consume_args=consume_args,
                 channel=channel,
+                micro_batch=micro_batch,
+                deferred_ack=deferred_ack,
                 dependencies=dependencies,
                 parser=parser,
                 decoder=decoder,
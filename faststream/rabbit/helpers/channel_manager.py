@@ -1,3 +1,5 @@
+import asyncio
+from contextlib import suppress
 from typing import TYPE_CHECKING, Optional, Protocol, cast
 
 from faststream.rabbit.schemas import Channel
@@ -5,14 +7,26 @@ from faststream.rabbit.schemas import Channel
 from .state import ConnectedState, ConnectionState, EmptyConnectionState
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import aio_pika
 
 
 class ChannelManager(Protocol):
+    @property
+    def default_channel(self) -> "Channel": ...
+
     def connect(self, connection: "aio_pika.RobustConnection") -> None: ...
 
     def disconnect(self) -> None: ...
 
+    def on_rebuild(
+        self,
+        callback: "Callable[[aio_pika.RobustChannel], None]",
+    ) -> None:
+        """Register a callback called with a closed channel replaced by a new one."""
+        ...
+
     async def get_channel(
         self,
         channel: Optional["Channel"] = None,
@@ -22,12 +36,22 @@ class ChannelManager(Protocol):
 
 
 class FakeChannelManager(ChannelManager):
+    @property
+    def default_channel(self) -> "Channel":
+        raise NotImplementedError
+
     def connect(self, connection: "aio_pika.RobustConnection") -> None:
         raise NotImplementedError
 
     def disconnect(self) -> None:
         raise NotImplementedError
 
+    def on_rebuild(
+        self,
+        callback: "Callable[[aio_pika.RobustChannel], None]",
+    ) -> None:
+        raise NotImplementedError
+
     async def get_channel(
         self,
         channel: Optional["Channel"] = None,
@@ -35,8 +59,29 @@ class FakeChannelManager(ChannelManager):
         raise NotImplementedError
 
 
+class _ChannelPool:
+    """Channels opened with the same settings and handed out in turns."""
+
+    __slots__ = ("_next", "channels", "lock")
+
+    def __init__(self) -> None:
+        self.channels: list[aio_pika.RobustChannel] = []
+        self.lock = asyncio.Lock()
+        self._next = 0
+
+    def next(self) -> tuple[int, "aio_pika.RobustChannel"]:
+        index = self._next
+        self._next = (index + 1) % len(self.channels)
+        return index, self.channels[index]
+
+
 class ChannelManagerImpl(ChannelManager):
-    __slots__ = ("__channels", "__connection", "__default_channel")
+    __slots__ = (
+        "__channels",
+        "__connection",
+        "__default_channel",
+        "__rebuild_callbacks",
+    )
 
     def __init__(
         self,
@@ -46,7 +91,12 @@ class ChannelManagerImpl(ChannelManager):
 
         self.__default_channel = default_channel or Channel()
 
-        self.__channels: dict[Channel, aio_pika.RobustChannel] = {}
+        self.__channels: dict[Channel, _ChannelPool] = {}
+        self.__rebuild_callbacks: list[Callable[[aio_pika.RobustChannel], None]] = []
+
+    @property
+    def default_channel(self) -> "Channel":
+        return self.__default_channel
 
     def connect(self, connection: "aio_pika.RobustConnection") -> None:
         self.__connection = ConnectedState(connection)
@@ -55,6 +105,12 @@ class ChannelManagerImpl(ChannelManager):
         self.__connection = EmptyConnectionState()
         self.__channels.clear()
 
+    def on_rebuild(
+        self,
+        callback: "Callable[[aio_pika.RobustChannel], None]",
+    ) -> None:
+        self.__rebuild_callbacks.append(callback)
+
     async def get_channel(
         self,
         channel: Optional["Channel"] = None,
@@ -62,20 +118,47 @@ class ChannelManagerImpl(ChannelManager):
         if channel is None:
             channel = self.__default_channel
 
-        if (ch := self.__channels.get(channel)) is None:
-            self.__channels[channel] = ch = cast(
-                "aio_pika.RobustChannel",
-                await self.__connection.connection.channel(
-                    channel_number=channel.channel_number,
-                    publisher_confirms=channel.publisher_confirms,
-                    on_return_raises=channel.on_return_raises,
-                ),
-            )
+        if (pool := self.__channels.get(channel)) is None:
+            pool = self.__channels[channel] = _ChannelPool()
+
+        if len(pool.channels) < channel.pool_size:
+            async with pool.lock:
+                while len(pool.channels) < channel.pool_size:
+                    pool.channels.append(await self.__open_channel(channel))
 
-            if channel.prefetch_count:
-                await ch.set_qos(
-                    prefetch_count=channel.prefetch_count,
-                    global_=channel.global_qos,
-                )
+        index, ch = pool.next()
+
+        # robust connection restores its channels itself after reconnect,
+        # so rebuild only channels closed over an alive connection
+        if ch.is_closed and not self.__connection.connection.is_closed:
+            async with pool.lock:
+                if (ch := pool.channels[index]).is_closed:
+                    # stop the old channel restoring to not leak it
+                    with suppress(Exception):
+                        await ch.close()
+
+                    # objects bound to the closed channel should not be used anymore
+                    for callback in self.__rebuild_callbacks:
+                        callback(ch)
+
+                    pool.channels[index] = ch = await self.__open_channel(channel)
+
+        return ch
+
+    async def __open_channel(self, channel: "Channel") -> "aio_pika.RobustChannel":
+        ch = cast(
+            "aio_pika.RobustChannel",
+            await self.__connection.connection.channel(
+                channel_number=channel.channel_number,
+                publisher_confirms=channel.publisher_confirms,
+                on_return_raises=channel.on_return_raises,
+            ),
+        )
+
+        if channel.prefetch_count:
+            await ch.set_qos(
+                prefetch_count=channel.prefetch_count,
+                global_=channel.global_qos,
+            )
 
         return ch
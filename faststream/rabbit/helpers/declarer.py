@@ -69,6 +69,8 @@ class RabbitDeclarerImpl(RabbitDeclarer):
         self.__channel_manager = channel_manager
         self._queues: dict[RabbitQueue, aio_pika.RobustQueue] = {}
         self._exchanges: dict[RabbitExchange, aio_pika.RobustExchange] = {}
+        # channels the exchanges were declared by to reuse them by other pooled channels
+        self._exchanges_channels: dict[RabbitExchange, aio_pika.RobustChannel] = {}
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(queues={list(self._queues.keys())}, exchanges={list(self._exchanges.keys())})"
@@ -76,6 +78,18 @@ class RabbitDeclarerImpl(RabbitDeclarer):
     def disconnect(self) -> None:
         self._queues.clear()
         self._exchanges.clear()
+        self._exchanges_channels.clear()
+
+    def forget_channel(self, channel: "aio_pika.RobustChannel") -> None:
+        """Drop queues and exchanges bound to the closed channel to declare them again."""
+        for queue, q in tuple(self._queues.items()):
+            if q.channel is channel:
+                del self._queues[queue]
+
+        for exchange, ch in tuple(self._exchanges_channels.items()):
+            if ch is channel:
+                del self._exchanges_channels[exchange]
+                self._exchanges.pop(exchange, None)
 
     async def declare_queue(
         self,
@@ -136,6 +150,7 @@ class RabbitDeclarerImpl(RabbitDeclarer):
                     internal=False,  # deprecated RMQ option
                 ),
             )
+            self._exchanges_channels[exchange] = channel_obj
 
             if exchange.bind_to is not None:
                 parent = await self.declare_exchange(exchange.bind_to)
@@ -147,4 +162,11 @@ class RabbitDeclarerImpl(RabbitDeclarer):
                     robust=exchange.robust,
                 )
 
+        elif self._exchanges_channels[exchange] is not channel_obj:
+            # exchange is already declared, so just use it by another pooled channel
+            return cast(
+                "aio_pika.RobustExchange",
+                await channel_obj.get_exchange(exchange.name, ensure=False),
+            )
+
         return exch
@@ -1,8 +1,18 @@
+from typing import Any, Optional, Protocol
+
 from aio_pika import IncomingMessage
 
 from faststream.message import StreamMessage
 
 
+class MessageAcker(Protocol):
+    """A protocol for subscribers sending messages acknowledgements by themselves."""
+
+    async def ack(self, message: IncomingMessage) -> None: ...
+
+    def settle(self, message: IncomingMessage, *, multiple: bool) -> None: ...
+
+
 class RabbitMessage(StreamMessage[IncomingMessage]):
     """A message class for working with RabbitMQ messages.
 
@@ -10,6 +20,18 @@ class RabbitMessage(StreamMessage[IncomingMessage]):
     or nack-ing RabbitMQ messages.
     """
 
+    __slots__ = ("acker",)
+
+    def __init__(
+        self,
+        *args: Any,
+        acker: Optional["MessageAcker"] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.acker = acker
+
     async def ack(
         self,
         multiple: bool = False,
@@ -19,7 +41,15 @@ class RabbitMessage(StreamMessage[IncomingMessage]):
         await super().ack()
         if pika_message.locked:
             return
+
+        if self.acker is not None and not multiple:
+            # acknowledgement is sent by the subscriber later
+            await self.acker.ack(pika_message)
+            return
+
         await pika_message.ack(multiple=multiple)
+        if self.acker is not None:
+            self.acker.settle(pika_message, multiple=multiple)
 
     async def nack(
         self,
@@ -32,6 +62,8 @@ class RabbitMessage(StreamMessage[IncomingMessage]):
         if pika_message.locked:
             return
         await pika_message.nack(multiple=multiple, requeue=requeue)
+        if self.acker is not None:
+            self.acker.settle(pika_message, multiple=multiple)
 
     async def reject(
         self,
@@ -43,3 +75,5 @@ class RabbitMessage(StreamMessage[IncomingMessage]):
         if pika_message.locked:
             return
         await pika_message.reject(requeue=requeue)
+        if self.acker is not None:
+            self.acker.settle(pika_message, multiple=False)
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from fast_depends.library.serializer import SerializerProto
 
     from faststream._internal.basic_types import DecodedMessage
+    from faststream.rabbit.message import MessageAcker
     from faststream.rabbit.types import AioPikaSendableMessage
 
 
@@ -28,6 +29,10 @@ class AioPikaParser:
 
     def __init__(self, pattern: Optional["Pattern[str]"] = None) -> None:
         self.pattern = pattern
+        self._acker: MessageAcker | None = None
+
+    def _setup(self, acker: "MessageAcker") -> None:
+        self._acker = acker
 
     async def parse_message(
         self,
@@ -46,10 +51,11 @@ class AioPikaParser:
             headers=message.headers,
             reply_to=message.reply_to or "",
             content_type=message.content_type,
-            message_id=message.message_id or gen_cor_id(),
-            correlation_id=message.correlation_id or gen_cor_id(),
+            message_id=message.message_id,
+            correlation_id=message.correlation_id,
             path=path,
             raw_message=message,
+            acker=self._acker,
         )
 
     async def decode_message(
@@ -1,8 +1,10 @@
+import asyncio
+import logging
 from abc import abstractmethod
 from typing import (
     TYPE_CHECKING,
     Optional,
-    Protocol,
+    Union,
     cast,
 )
 
@@ -11,92 +13,224 @@ from typing_extensions import Unpack, override
 
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.producer import ProducerProto
-from faststream.exceptions import FeatureNotSupportedException, IncorrectState
+from faststream.exceptions import IncorrectState
+from faststream.message import gen_cor_id
 from faststream.rabbit.parser import AioPikaParser
 from faststream.rabbit.response import RabbitPublishCommand
 from faststream.rabbit.schemas import RABBIT_REPLY, RabbitExchange
 
 if TYPE_CHECKING:
-    from types import TracebackType
+    from collections.abc import Awaitable
 
     import aiormq
-    from aio_pika import IncomingMessage, RobustQueue
-    from aio_pika.abc import AbstractIncomingMessage, TimeoutType
-    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+    from aio_pika import IncomingMessage, RobustExchange, RobustQueue
+    from aio_pika.abc import (
+        AbstractChannel,
+        AbstractIncomingMessage,
+        TimeoutType,
+    )
     from fast_depends.library.serializer import SerializerProto
 
+    from faststream._internal.logger import LoggerState
     from faststream._internal.types import (
         AsyncCallable,
         CustomCallable,
     )
+    from faststream.message import IdGenerator
     from faststream.rabbit.helpers import RabbitDeclarer
     from faststream.rabbit.types import AioPikaSendableMessage
 
     from .options import MessageOptions
 
 
-class LockState(Protocol):
-    @property
-    def lock(self) -> "anyio.Lock": ...
+ConfirmationType = Optional["aiormq.abc.ConfirmationFrameType"]
+
+
+class ReplyDispatcher:
+    """Route direct reply-to responses to the waiting requests by correlation id.
+
+    The reply queue is consumed once for all requests, so any number of
+    requests can wait for their responses concurrently. Responses without
+    the request `correlation_id` are dropped with a warning.
+    """
+
+    __slots__ = ("_consume_lock", "_logger", "_queue", "_responses")
 
+    def __init__(self, logger: Optional["LoggerState"] = None) -> None:
+        self._logger = logger
+        self._consume_lock = anyio.Lock()
+        self._queue: RobustQueue | None = None
+        self._responses: dict[str, asyncio.Future[IncomingMessage]] = {}
 
-class LockUnset:
+    async def register(
+        self,
+        correlation_id: str,
+        queue: "RobustQueue",
+    ) -> "asyncio.Future[IncomingMessage]":
+        """Create a future to wait for the request response."""
+        if correlation_id in self._responses:
+            msg = f"Request with `{correlation_id}` correlation_id is already waiting for the response."
+            raise IncorrectState(msg)
+
+        async with self._consume_lock:
+            if self._queue is not queue:
+                await queue.consume(
+                    callback=self._on_response,
+                    no_ack=True,
+                )
+                self._queue = queue
+
+        self._responses[correlation_id] = response = (
+            asyncio.get_running_loop().create_future()
+        )
+        return response
+
+    def discard(self, correlation_id: str) -> None:
+        self._responses.pop(correlation_id, None)
+
+    def close(self) -> None:
+        error = IncorrectState("Connection is closed.")
+        for response in self._responses.values():
+            if not response.done():
+                response.set_exception(error)
+        self._responses.clear()
+
+    async def _on_response(self, message: "AbstractIncomingMessage") -> None:
+        response = self._responses.pop(message.correlation_id or "", None)
+
+        if response is None:
+            # late responses or responses without the request `correlation_id`
+            if self._logger is not None:
+                self._logger.log(
+                    f"Reply with `{message.correlation_id}` correlation_id "
+                    "matches no waiting request and is dropped",
+                    logging.WARNING,
+                )
+
+        elif not response.done():
+            response.set_result(cast("IncomingMessage", message))
+
+
+class ReplyDispatcherUnset:
     __slots__ = ()
 
-    @property
-    def lock(self) -> "anyio.Lock":
+    async def register(
+        self,
+        correlation_id: str,
+        queue: "RobustQueue",
+    ) -> "asyncio.Future[IncomingMessage]":
         msg = "You should call `producer.connect()` method at first."
         raise IncorrectState(msg)
 
+    def discard(self, correlation_id: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class ConfirmationWindow:
+    """Messages published to a channel without waiting for the confirmation.
 
-class RealLock:
-    __slots__ = ("lock",)
+    Limits the number of unconfirmed messages to not overflow the channel and
+    keeps their futures to wait for them at flush.
+    """
 
-    def __init__(self) -> None:
-        self.lock = anyio.Lock()
+    __slots__ = ("_futures", "_limiter")
+
+    def __init__(self, size: int) -> None:
+        self._limiter = asyncio.Semaphore(size)
+        self._futures: set[asyncio.Future[ConfirmationType]] = set()
+
+    def publish(
+        self,
+        publish: "Awaitable[ConfirmationType]",
+    ) -> "asyncio.Future[ConfirmationType]":
+        future = asyncio.ensure_future(publish)
+        self._futures.add(future)
+        future.add_done_callback(self._release)
+        return future
+
+    async def acquire(self) -> None:
+        await self._limiter.acquire()
+
+    def _release(self, future: "asyncio.Future[ConfirmationType]") -> None:
+        self._futures.discard(future)
+        self._limiter.release()
+
+        # mark the error retrieved to not log it if the caller ignores the future
+        if not future.cancelled():
+            future.exception()
+
+    async def flush(self) -> None:
+        # publish errors are delivered by the futures, so just wait them
+        if self._futures:
+            await asyncio.wait(self._futures)
 
 
 class AioPikaFastProducer(ProducerProto[RabbitPublishCommand]):
-    def connect(self, serializer: Optional["SerializerProto"] = None) -> None: ...
+    def connect(
+        self,
+        serializer: Optional["SerializerProto"] = None,
+        logger: Optional["LoggerState"] = None,
+    ) -> None: ...
 
     def disconnect(self) -> None: ...
 
+    async def flush(self) -> None:
+        return None
+
     @abstractmethod
     async def publish(
         self,
         cmd: "RabbitPublishCommand",
-    ) -> Optional["aiormq.abc.ConfirmationFrameType"]: ...
+    ) -> Union["ConfirmationType", "asyncio.Future[ConfirmationType]"]: ...
 
     @abstractmethod
     async def request(self, cmd: "RabbitPublishCommand") -> "IncomingMessage": ...
 
-    @override
-    async def publish_batch(self, cmd: "RabbitPublishCommand") -> None:
-        msg = "RabbitMQ doesn't support publishing in batches."
-        raise FeatureNotSupportedException(msg)
+    @abstractmethod
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list["ConfirmationType"]: ...
 
 
 class FakeAioPikaFastProducer(AioPikaFastProducer):
     def __bool__(self) -> bool:
         return False
 
-    def connect(self, serializer: Optional["SerializerProto"] = None) -> None:
+    def connect(
+        self,
+        serializer: Optional["SerializerProto"] = None,
+        logger: Optional["LoggerState"] = None,
+    ) -> None:
         raise NotImplementedError
 
     def disconnect(self) -> None:
         raise NotImplementedError
 
+    async def flush(self) -> None:
+        raise NotImplementedError
+
     @override
     async def publish(
         self,
         cmd: "RabbitPublishCommand",
-    ) -> Optional["aiormq.abc.ConfirmationFrameType"]:
+    ) -> Union["ConfirmationType", "asyncio.Future[ConfirmationType]"]:
         raise NotImplementedError
 
     @override
     async def request(self, cmd: "RabbitPublishCommand") -> "IncomingMessage":
         raise NotImplementedError
 
+    @override
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list["ConfirmationType"]:
+        raise NotImplementedError
+
 
 class AioPikaFastProducerImpl(AioPikaFastProducer):
     """A class for fast producing messages using aio-pika."""
@@ -110,32 +244,49 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
         declarer: "RabbitDeclarer",
         parser: Optional["CustomCallable"],
         decoder: Optional["CustomCallable"],
+        max_unconfirmed: int = 1024,
+        id_generator: "IdGenerator" = gen_cor_id,
     ) -> None:
         self.declarer = declarer
+        self.id_generator = id_generator
 
-        self.__lock: LockState = LockUnset()
+        self.__replies: ReplyDispatcher | ReplyDispatcherUnset = ReplyDispatcherUnset()
         self.serializer: SerializerProto | None = None
 
+        self._max_unconfirmed = max_unconfirmed
+        self._windows: dict[AbstractChannel, ConfirmationWindow] = {}
+
         default_parser = AioPikaParser()
         self._parser = ParserComposition(parser, default_parser.parse_message)
         self._decoder = ParserComposition(decoder, default_parser.decode_message)
 
-    def connect(self, serializer: Optional["SerializerProto"] = None) -> None:
-        """Lock initialization.
+    def connect(
+        self,
+        serializer: Optional["SerializerProto"] = None,
+        logger: Optional["LoggerState"] = None,
+    ) -> None:
+        """Replies dispatcher initialization.
 
         Should be called in async context due `anyio.Lock` object can't be created outside event loop.
         """
         self.serializer = serializer
-        self.__lock = RealLock()
+        self.__replies = ReplyDispatcher(logger)
 
     def disconnect(self) -> None:
-        self.__lock = LockUnset()
+        self.__replies.close()
+        self.__replies = ReplyDispatcherUnset()
+        self._windows.clear()
+
+    async def flush(self) -> None:
+        """Wait for all messages published with `no_confirm=True` to be confirmed."""
+        for window in tuple(self._windows.values()):
+            await window.flush()
 
     @override
     async def publish(
         self,
         cmd: "RabbitPublishCommand",
-    ) -> Optional["aiormq.abc.ConfirmationFrameType"]:
+    ) -> Union["ConfirmationType", "asyncio.Future[ConfirmationType]"]:
         return await self._publish(
             message=cmd.body,
             exchange=cmd.exchange,
@@ -143,16 +294,59 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
             reply_to=cmd.reply_to,
             headers=cmd.headers,
             correlation_id=cmd.correlation_id,
+            no_confirm=cmd.no_confirm,
             **cmd.publish_options,
             **cmd.message_options,
         )
 
+    @override
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list["ConfirmationType"]:
+        """Publish all messages to one channel and wait for their confirmations together."""
+        message_options = cmd.message_options
+
+        exchange_obj = await self.declarer.declare_exchange(
+            exchange=cmd.exchange,
+            declare=False,
+        )
+        window = self._get_window(exchange_obj.channel)
+
+        futures = []
+        for body in cmd.batch_bodies:
+            message = AioPikaParser.encode_message(
+                message=body,
+                serializer=self.serializer,
+                reply_to=cmd.reply_to,
+                headers=cmd.headers,
+                correlation_id=cmd.correlation_id,
+                **message_options,
+            )
+
+            await window.acquire()
+            futures.append(
+                window.publish(
+                    exchange_obj.publish(
+                        message=message,
+                        routing_key=cmd.destination,
+                        mandatory=cmd.publish_options["mandatory"],
+                        immediate=cmd.publish_options["immediate"],
+                        timeout=cmd.timeout,
+                    ),
+                ),
+            )
+
+        return list(await asyncio.gather(*futures))
+
     @override
     async def request(self, cmd: "RabbitPublishCommand") -> "IncomingMessage":
-        async with _RPCCallback(
-            self.__lock.lock,
-            await self.declarer.declare_queue(RABBIT_REPLY),
-        ) as response_queue:
+        correlation_id = cmd.correlation_id or self.id_generator()
+
+        reply_queue = await self.declarer.declare_queue(RABBIT_REPLY)
+        response = await self.__replies.register(correlation_id, reply_queue)
+
+        try:
             with anyio.fail_after(cmd.timeout):
                 await self._publish(
                     message=cmd.body,
@@ -160,11 +354,16 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
                     routing_key=cmd.destination,
                     reply_to=RABBIT_REPLY.name,
                     headers=cmd.headers,
-                    correlation_id=cmd.correlation_id,
+                    correlation_id=correlation_id,
+                    # direct reply-to requires publishing by the consuming channel
+                    channel=reply_queue.channel,
                     **cmd.publish_options,
                     **cmd.message_options,
                 )
-                return await response_queue.receive()
+                return await response
+
+        finally:
+            self.__replies.discard(correlation_id)
 
     async def _publish(
         self,
@@ -175,8 +374,10 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
         mandatory: bool = True,
         immediate: bool = False,
         timeout: "TimeoutType" = None,
+        no_confirm: bool = False,
+        channel: Optional["AbstractChannel"] = None,
         **message_options: Unpack["MessageOptions"],
-    ) -> Optional["aiormq.abc.ConfirmationFrameType"]:
+    ) -> Union["ConfirmationType", "asyncio.Future[ConfirmationType]"]:
         message = AioPikaParser.encode_message(
             message=message, serializer=self.serializer, **message_options
         )
@@ -186,47 +387,41 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
             declare=False,
         )
 
-        return await exchange_obj.publish(
-            message=message,
-            routing_key=routing_key,
-            mandatory=mandatory,
-            immediate=immediate,
-            timeout=timeout,
-        )
-
-
-class _RPCCallback:
-    """A class provides an RPC lock."""
-
-    def __init__(self, lock: "anyio.Lock", callback_queue: "RobustQueue") -> None:
-        self.lock = lock
-        self.queue = callback_queue
-
-    async def __aenter__(self) -> "MemoryObjectReceiveStream[IncomingMessage]":
-        send_response_stream: MemoryObjectSendStream[AbstractIncomingMessage]
-        receive_response_stream: MemoryObjectReceiveStream[AbstractIncomingMessage]
-
-        (
-            send_response_stream,
-            receive_response_stream,
-        ) = anyio.create_memory_object_stream(max_buffer_size=1)
-        await self.lock.acquire()
-
-        self.consumer_tag = await self.queue.consume(
-            callback=send_response_stream.send,
-            no_ack=True,
-        )
-
-        return cast(
-            "MemoryObjectReceiveStream[IncomingMessage]",
-            receive_response_stream,
+        if channel is not None and exchange_obj.channel is not channel:
+            # pooled channels share the declared exchange
+            exchange_obj = cast(
+                "RobustExchange",
+                await channel.get_exchange(exchange.name, ensure=False)
+                if exchange.name
+                else channel.default_exchange,
+            )
+
+        if not no_confirm:
+            return await exchange_obj.publish(
+                message=message,
+                routing_key=routing_key,
+                mandatory=mandatory,
+                immediate=immediate,
+                timeout=timeout,
+            )
+
+        window = self._get_window(exchange_obj.channel)
+
+        # take the slot before the publish coroutine creation to not leak it at cancellation
+        await window.acquire()
+        return window.publish(
+            exchange_obj.publish(
+                message=message,
+                routing_key=routing_key,
+                mandatory=mandatory,
+                immediate=immediate,
+                timeout=timeout,
+            ),
         )
 
-    async def __aexit__(
-        self,
-        exc_type: type[BaseException] | None = None,
-        exc_val: BaseException | None = None,
-        exc_tb: Optional["TracebackType"] = None,
-    ) -> None:
-        self.lock.release()
-        await self.queue.cancel(self.consumer_tag)
+    def _get_window(self, channel: "AbstractChannel") -> ConfirmationWindow:
+        if (window := self._windows.get(channel)) is None:
+            window = self._windows[channel] = ConfirmationWindow(
+                self._max_unconfirmed,
+            )
+        return window
@@ -1,11 +1,10 @@
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union, overload
 
 from typing_extensions import Unpack, override
 
 from faststream._internal.endpoint.publisher import PublisherUsecase
 from faststream._internal.utils.data import filter_by_dict
-from faststream.message import gen_cor_id
 from faststream.rabbit.response import RabbitPublishCommand
 from faststream.rabbit.schemas import RabbitExchange, RabbitQueue
 from faststream.response.publish_type import PublishType
@@ -13,6 +12,8 @@ from faststream.response.publish_type import PublishType
 from .options import BasicMessageOptions, PublishKwargs, PublishOptions
 
 if TYPE_CHECKING:
+    import asyncio
+
     import aiormq
 
     from faststream._internal.endpoint.publisher import PublisherSpecification
@@ -84,6 +85,45 @@ class RabbitPublisher(PublisherUsecase):
             await self._outer_config.declarer.declare_exchange(self.exchange)
         return await super().start()
 
+    @overload
+    async def publish(
+        self,
+        message: "AioPikaSendableMessage",
+        queue: Union["RabbitQueue", str, None] = None,
+        exchange: Union["RabbitExchange", str, None] = None,
+        *,
+        routing_key: str = "",
+        no_confirm: Literal[True],
+        **publish_kwargs: "Unpack[PublishKwargs]",
+    ) -> "asyncio.Future[aiormq.abc.ConfirmationFrameType | None]": ...
+
+    @overload
+    async def publish(
+        self,
+        message: "AioPikaSendableMessage",
+        queue: Union["RabbitQueue", str, None] = None,
+        exchange: Union["RabbitExchange", str, None] = None,
+        *,
+        routing_key: str = "",
+        no_confirm: Literal[False] = False,
+        **publish_kwargs: "Unpack[PublishKwargs]",
+    ) -> Optional["aiormq.abc.ConfirmationFrameType"]: ...
+
+    @overload
+    async def publish(
+        self,
+        message: "AioPikaSendableMessage",
+        queue: Union["RabbitQueue", str, None] = None,
+        exchange: Union["RabbitExchange", str, None] = None,
+        *,
+        routing_key: str = "",
+        no_confirm: bool = False,
+        **publish_kwargs: "Unpack[PublishKwargs]",
+    ) -> Union[
+        Optional["aiormq.abc.ConfirmationFrameType"],
+        "asyncio.Future[aiormq.abc.ConfirmationFrameType | None]",
+    ]: ...
+
     @override
     async def publish(
         self,
@@ -92,14 +132,36 @@ class RabbitPublisher(PublisherUsecase):
         exchange: Union["RabbitExchange", str, None] = None,
         *,
         routing_key: str = "",
+        no_confirm: bool = False,
         **publish_kwargs: "Unpack[PublishKwargs]",
-    ) -> Optional["aiormq.abc.ConfirmationFrameType"]:
+    ) -> Union[
+        Optional["aiormq.abc.ConfirmationFrameType"],
+        "asyncio.Future[aiormq.abc.ConfirmationFrameType | None]",
+    ]:
+        """Publish a message.
+
+        Args:
+            message: Message body to send.
+            queue: Message routing key to publish with.
+            exchange: Target exchange to publish message to.
+            routing_key: Message routing key to publish with. Overrides `queue` option if presented.
+            no_confirm: Do not wait for RabbitMQ publish confirmation. Use `flush` to wait for
+                all unconfirmed messages.
+            **publish_kwargs: Message and publish options to override the publisher ones.
+
+        Returns:
+            An optional confirmation frame if RabbitMQ is configured to send confirmations.
+            `asyncio.Future` with the confirmation frame if no_confirm = True.
+        """
         if "headers" in publish_kwargs:
             headers = self.headers | (publish_kwargs.pop("headers") or {})
         else:
             headers = self.headers
 
-        correlation_id = publish_kwargs.pop("correlation_id", gen_cor_id())
+        correlation_id = (
+            publish_kwargs.pop("correlation_id", None)
+            or self._outer_config.id_generator()
+        )
 
         cmd = RabbitPublishCommand(
             message,
@@ -107,17 +169,26 @@ class RabbitPublisher(PublisherUsecase):
             exchange=RabbitExchange.validate(exchange or self.exchange),
             headers=headers,
             correlation_id=correlation_id,
+            no_confirm=no_confirm,
             _publish_type=PublishType.PUBLISH,
             **(self.publish_options | self.message_options | publish_kwargs),  # type: ignore[operator]
         )
 
-        frame: aiormq.abc.ConfirmationFrameType | None = await self._basic_publish(
+        frame: (
+            aiormq.abc.ConfirmationFrameType
+            | asyncio.Future[aiormq.abc.ConfirmationFrameType | None]
+            | None
+        ) = await self._basic_publish(
             cmd,
             producer=self._outer_config.producer,
             _extra_middlewares=(),
         )
         return frame
 
+    async def flush(self) -> None:
+        """Wait for all messages published with `no_confirm=True` to be confirmed."""
+        await self._outer_config.producer.flush()
+
     @override
     async def _publish(
         self,
@@ -158,7 +229,10 @@ class RabbitPublisher(PublisherUsecase):
         else:
             headers = self.headers
 
-        correlation_id = publish_kwargs.pop("correlation_id", gen_cor_id())
+        correlation_id = (
+            publish_kwargs.pop("correlation_id", None)
+            or self._outer_config.id_generator()
+        )
 
         cmd = RabbitPublishCommand(
             message,
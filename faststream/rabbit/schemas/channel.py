@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from faststream.exceptions import SetupError
+
 
 @dataclass
 class Channel:
@@ -28,5 +30,30 @@ class Channel:
     """raise an :class:`aio_pika.exceptions.DeliveryError`
     when mandatory message will be returned"""
 
+    max_unconfirmed: int = 1024
+    """Limit the number of messages published with `no_confirm=True` and
+    waiting for the confirmation on the channel. Publishing waits for a free
+    slot when the limit is reached. The limit is applied to each channel of
+    the pool separately."""
+
+    pool_size: int = 1
+    """Number of AMQP channels opened with these settings. Publishers and
+    subscribers get channels from the pool in turns to not funnel all frames
+    through a single channel, so the publishing order is not kept between
+    successive publishes."""
+
+    def __post_init__(self) -> None:
+        if self.max_unconfirmed < 1:
+            msg = "`max_unconfirmed` should be greater than 0."
+            raise SetupError(msg)
+
+        if self.pool_size < 1:
+            msg = "`pool_size` should be greater than 0."
+            raise SetupError(msg)
+
+        if self.pool_size > 1 and self.channel_number is not None:
+            msg = "`channel_number` can't be used with `pool_size` greater than 1."
+            raise SetupError(msg)
+
     def __hash__(self) -> int:
         return id(self)
@@ -0,0 +1,126 @@
+from collections import deque
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+from faststream.exceptions import SetupError
+
+ChannelT = TypeVar("ChannelT", bound=Hashable)
+
+
+class DeferredAck:
+    """A class to represent RabbitMQ subscriber deferred acknowledgement options.
+
+    Acknowledged messages are confirmed by a single `basic.ack` frame with the
+    `multiple` flag for the highest contiguous acknowledged delivery tag instead
+    of a frame per message. Nacked and rejected messages are still sent at once.
+    Acknowledgements are sent by any of the following limits and at subscriber stop.
+
+    Args:
+        max_messages (int): Acknowledged messages number to send acknowledgements (default is `100`).
+        interval_ms (int): Maximum time between acknowledgements sending in milliseconds (default is `100`).
+    """
+
+    __slots__ = (
+        "interval_ms",
+        "max_messages",
+    )
+
+    def __init__(
+        self,
+        max_messages: int = 100,
+        interval_ms: int = 100,
+    ) -> None:
+        if max_messages < 1:
+            msg = "`max_messages` should be greater than 0."
+            raise SetupError(msg)
+
+        if interval_ms <= 0:
+            msg = "`interval_ms` should be greater than 0."
+            raise SetupError(msg)
+
+        self.max_messages = max_messages
+        self.interval_ms = interval_ms
+
+
+class _ChannelTags:
+    __slots__ = ("acked", "pending", "settled")
+
+    def __init__(self) -> None:
+        # delivery tags in the receiving order
+        self.pending: deque[int] = deque()
+        self.acked: set[int] = set()
+        self.settled: set[int] = set()
+
+
+class DeliveryTagsTracker(Generic[ChannelT]):
+    """Track acknowledged delivery tags to acknowledge them by the highest one.
+
+    Tags are registered in the order they are received and can be acknowledged
+    in any order. A multiple acknowledgement tag is the last acknowledged one of
+    the channel contiguous settled prefix, so a message is confirmed only after
+    all previous channel messages are acknowledged or already nacked/rejected.
+    """
+
+    __slots__ = ("_channels",)
+
+    def __init__(self) -> None:
+        self._channels: dict[ChannelT, _ChannelTags] = {}
+
+    def add(self, channel: ChannelT, tag: int) -> None:
+        """Register received delivery tag."""
+        if (state := self._channels.get(channel)) is None:
+            state = self._channels[channel] = _ChannelTags()
+        state.pending.append(tag)
+
+    def ack(self, channel: ChannelT, tag: int) -> bool:
+        """Mark delivery tag as acknowledged. Returns `False` for untracked tags."""
+        state = self._channels.get(channel)
+
+        if state is None or not state.pending or tag < state.pending[0]:
+            return False
+
+        state.acked.add(tag)
+        return True
+
+    def settle(self, channel: ChannelT, tag: int, *, multiple: bool = False) -> None:
+        """Mark delivery tag as already sent to the broker by nack, reject or ack."""
+        if (state := self._channels.get(channel)) is None:
+            return
+
+        if not multiple:
+            if state.pending and tag >= state.pending[0]:
+                state.settled.add(tag)
+            return
+
+        # all previous channel deliveries are settled by the broker too
+        while state.pending and state.pending[0] <= tag:
+            state.pending.popleft()
+
+        state.acked = {t for t in state.acked if t > tag}
+        state.settled = {t for t in state.settled if t > tag}
+
+    def ackable(self) -> dict[ChannelT, int]:
+        """Pop channels multiple acknowledgement tags."""
+        tags: dict[ChannelT, int] = {}
+
+        for channel, state in self._channels.items():
+            pending, acked, settled = state.pending, state.acked, state.settled
+
+            while pending:
+                if (tag := pending[0]) in acked:
+                    acked.discard(tag)
+                    tags[channel] = tag
+
+                elif tag in settled:
+                    settled.discard(tag)
+
+                else:
+                    break
+
+                pending.popleft()
+
+        return tags
+
+    def remove(self, channel: ChannelT) -> None:
+        """Stop tracking closed channel."""
+        self._channels.pop(channel, None)
@@ -4,19 +4,22 @@ from typing import TYPE_CHECKING, Any, Optional
 from faststream._internal.constants import EMPTY
 from faststream._internal.endpoint.subscriber.call_item import CallsCollection
 from faststream.exceptions import SetupError
+from faststream.middlewares import AckPolicy
 
 from .config import (
     RabbitSubscriberConfig,
     RabbitSubscriberSpecificationConfig,
 )
 from .specification import RabbitSubscriberSpecification
-from .usecase import RabbitSubscriber
+from .usecase import BatchRabbitSubscriber, DeferredAckSubscriber, RabbitSubscriber
 
 if TYPE_CHECKING:
-    from faststream.middlewares import AckPolicy
+    from faststream._internal.endpoint.subscriber.batching import MicroBatch
     from faststream.rabbit.configs import RabbitBrokerConfig
     from faststream.rabbit.schemas import Channel, RabbitExchange, RabbitQueue
 
+    from .acks import DeferredAck
+
 
 def create_subscriber(
     *,
@@ -24,6 +27,8 @@ def create_subscriber(
     exchange: "RabbitExchange",
     consume_args: dict[str, Any] | None,
     channel: Optional["Channel"],
+    micro_batch: Optional["MicroBatch"],
+    deferred_ack: Optional["DeferredAck"],
     # Subscriber args
     no_reply: bool,
     ack_policy: "AckPolicy",
@@ -35,7 +40,12 @@ def create_subscriber(
     description_: str | None,
     include_in_schema: bool,
 ) -> RabbitSubscriber:
-    _validate_input_for_misconfigure(ack_policy=ack_policy, no_ack=no_ack)
+    _validate_input_for_misconfigure(
+        ack_policy=ack_policy,
+        no_ack=no_ack,
+        micro_batch=micro_batch,
+        deferred_ack=deferred_ack,
+    )
 
     subscriber_config = RabbitSubscriberConfig(
         no_reply=no_reply,
@@ -63,6 +73,23 @@ def create_subscriber(
         calls=calls,
     )
 
+    if micro_batch is not None:
+        return BatchRabbitSubscriber(
+            config=subscriber_config,
+            specification=specification,
+            calls=calls,
+            micro_batch=micro_batch,
+            max_workers=1,
+        )
+
+    if deferred_ack is not None:
+        return DeferredAckSubscriber(
+            config=subscriber_config,
+            specification=specification,
+            calls=calls,
+            deferred_ack=deferred_ack,
+        )
+
     return RabbitSubscriber(
         config=subscriber_config,
         specification=specification,
@@ -74,7 +101,18 @@ def _validate_input_for_misconfigure(
     *,
     ack_policy: "AckPolicy",
     no_ack: bool,
+    micro_batch: Optional["MicroBatch"],
+    deferred_ack: Optional["DeferredAck"],
 ) -> None:
+    if deferred_ack is not None:
+        if micro_batch is not None:
+            msg = "You can't use `deferred_ack` and `micro_batch` options simultaneously."
+            raise SetupError(msg)
+
+        if ack_policy is AckPolicy.ACK_FIRST or (no_ack is not EMPTY and no_ack):
+            msg = "The `deferred_ack` option can't be used with `AckPolicy.ACK_FIRST`."
+            raise SetupError(msg)
+
     if no_ack is not EMPTY:
         warnings.warn(
             "`no_ack` option was deprecated in prior to `ack_policy=AckPolicy.ACK_FIRST`. Scheduled to remove in 0.7.0",
@@ -1,19 +1,25 @@
 import asyncio
 import contextlib
+import logging
 from collections.abc import AsyncIterator, Sequence
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 import anyio
 from typing_extensions import override
 
 from faststream._internal.endpoint.subscriber import SubscriberUsecase
+from faststream._internal.endpoint.subscriber.mixins import BatchingMixin, TasksMixin
 from faststream._internal.endpoint.utils import process_msg
 from faststream.rabbit.parser import AioPikaParser
 from faststream.rabbit.publisher.fake import RabbitFakePublisher
 from faststream.rabbit.schemas import RabbitExchange
 from faststream.rabbit.schemas.constants import REPLY_TO_QUEUE_EXCHANGE_DELIMITER
 
+from .acks import DeliveryTagsTracker
+
 if TYPE_CHECKING:
+    import aiormq
     from aio_pika import IncomingMessage, RobustQueue
 
     from faststream._internal.endpoint.publisher import PublisherProto
@@ -26,6 +32,7 @@ if TYPE_CHECKING:
     from faststream.rabbit.message import RabbitMessage
     from faststream.rabbit.schemas import RabbitQueue
 
+    from .acks import DeferredAck
     from .config import RabbitSubscriberConfig
 
 
@@ -40,9 +47,9 @@ class RabbitSubscriber(SubscriberUsecase["IncomingMessage"]):
         specification: "SubscriberSpecification[Any, Any]",
         calls: "CallsCollection[IncomingMessage]",
     ) -> None:
-        parser = AioPikaParser(pattern=config.queue.path_regex)
-        config.decoder = parser.decode_message
-        config.parser = parser.parse_message
+        self.parser = AioPikaParser(pattern=config.queue.path_regex)
+        config.decoder = self.parser.decode_message
+        config.parser = self.parser.parse_message
         super().__init__(
             config,
             specification=specification,
@@ -54,7 +61,7 @@ class RabbitSubscriber(SubscriberUsecase["IncomingMessage"]):
 
         self.consume_args = config.consume_args or {}
 
-        self.__no_ack = config.ack_first
+        self._no_ack = config.ack_first
 
         self._consumer_tag: str | None = None
         self._queue_obj: RobustQueue | None = None
@@ -100,15 +107,19 @@ class RabbitSubscriber(SubscriberUsecase["IncomingMessage"]):
             )
 
         if self.calls:
-            self._consumer_tag = await self._queue_obj.consume(
-                # NOTE: aio-pika expects AbstractIncomingMessage, not IncomingMessage
-                self.consume,  # type: ignore[arg-type]
-                no_ack=self.__no_ack,
-                arguments=self.consume_args,
-            )
+            await self._create_consumer(self._queue_obj)
 
         self._post_start()
 
+    async def _create_consumer(self, queue: "RobustQueue") -> None:
+        """Start consuming messages from the declared queue."""
+        self._consumer_tag = await queue.consume(
+            # NOTE: aio-pika expects AbstractIncomingMessage, not IncomingMessage
+            self.consume,  # type: ignore[arg-type]
+            no_ack=self._no_ack,
+            arguments=self.consume_args,
+        )
+
     async def stop(self) -> None:
         await super().stop()
 
@@ -228,3 +239,174 @@ class RabbitSubscriber(SubscriberUsecase["IncomingMessage"]):
             queue=self.queue,
             exchange=self.exchange,
         )
+
+
+class BatchRabbitSubscriber(BatchingMixin["IncomingMessage"], RabbitSubscriber):
+    """A class to consume RabbitMQ messages by batches.
+
+    Use queue `prefetch_count` not less than the batch size to let it be filled
+    before `max_latency` deadline.
+    """
+
+    @override
+    async def _create_consumer(self, queue: "RobustQueue") -> None:
+        self.start_consume_task()
+
+        self._consumer_tag = await queue.consume(
+            # NOTE: aio-pika expects AbstractIncomingMessage, not IncomingMessage
+            self._put_msg,  # type: ignore[arg-type]
+            no_ack=self._no_ack,
+            arguments=self.consume_args,
+        )
+
+    def _get_msg_size(self, msg: "IncomingMessage") -> int:
+        return len(msg.body)
+
+    @override
+    async def _return_msgs(self, msgs: list["IncomingMessage"]) -> None:
+        # not acknowledged messages are kept by the open channel otherwise
+        if self._no_ack:
+            return
+
+        for msg in msgs:
+            try:
+                await msg.nack(requeue=True)
+            except Exception as e:  # noqa: PERF203
+                self._log(logging.ERROR, "Message requeue failed", exc_info=e)
+
+
+class DeferredAckSubscriber(TasksMixin, RabbitSubscriber):
+    """A class to consume RabbitMQ messages sending acknowledgements by batches.
+
+    Subscriber consumes messages by its own channel, because multiple
+    acknowledgement confirms all previous channel deliveries.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        deferred_ack: "DeferredAck",
+        **kwargs: Any,
+    ) -> None:
+        self.ack_max_messages = deferred_ack.max_messages
+        self.ack_interval = deferred_ack.interval_ms / 1000
+
+        self._tags: DeliveryTagsTracker[aiormq.abc.AbstractChannel] = (
+            DeliveryTagsTracker()
+        )
+        self._acked = 0
+
+        # created at start to be bound to the running event loop
+        self._ack_event: anyio.Event | None = None
+        self._ack_lock: anyio.Lock | None = None
+
+        super().__init__(*args, **kwargs)
+
+        self.parser._setup(_DeferredAcker(self))
+        self._channel_settings = self.channel
+
+    @override
+    async def start(self) -> None:
+        self._tags = DeliveryTagsTracker()
+        self._acked = 0
+
+        self._ack_event = anyio.Event()
+        self._ack_lock = anyio.Lock()
+
+        if self.channel is self._channel_settings:
+            self.channel = replace(
+                self.channel or self._outer_config.channel_manager.default_channel,
+                channel_number=None,
+                pool_size=1,
+            )
+
+        await super().start()
+
+        self.add_task(self._serve_acks())
+
+    @override
+    async def _create_consumer(self, queue: "RobustQueue") -> None:
+        channel = await self._outer_config.channel_manager.get_channel(self.channel)
+
+        if queue.channel is not channel:
+            # queue object is cached by another subscriber channel
+            self._queue_obj = queue = cast(
+                "RobustQueue",
+                await channel.declare_queue(queue.name, passive=True),
+            )
+
+        await super()._create_consumer(queue)
+
+    async def stop(self) -> None:
+        # wait for processing messages to acknowledge them before channel closing
+        await SubscriberUsecase.stop(self)
+        await self._send_acks()
+        await super().stop()
+
+    async def consume(self, msg: "IncomingMessage") -> Any:
+        # skipped messages are redelivered after the channel closing
+        if not self.running:
+            return None
+
+        self._tags.add(msg.channel, cast("int", msg.delivery_tag))
+        return await super().consume(msg)
+
+    async def _ack(self, message: "IncomingMessage") -> None:
+        if not self._tags.ack(message.channel, cast("int", message.delivery_tag)):
+            await message.ack()
+            return
+
+        # lock the message to not process it twice
+        message.lock()
+
+        self._acked += 1
+        if self._acked >= self.ack_max_messages and self._ack_event is not None:
+            self._ack_event.set()
+
+    async def _serve_acks(self) -> None:
+        """Endless task sending acknowledgements by timer or messages number."""
+        while True:
+            assert self._ack_event
+            with anyio.move_on_after(self.ack_interval):
+                await self._ack_event.wait()
+
+            self._ack_event = anyio.Event()
+            await self._send_acks()
+
+    async def _send_acks(self) -> None:
+        if self._ack_lock is None:  # subscriber was not started
+            return
+
+        async with self._ack_lock:
+            self._acked = 0
+
+            for channel, tag in self._tags.ackable().items():
+                await self._send_ack(channel, tag)
+
+    async def _send_ack(self, channel: "aiormq.abc.AbstractChannel", tag: int) -> None:
+        try:
+            await channel.basic_ack(delivery_tag=tag, multiple=True)
+
+        except Exception as e:
+            # not acknowledged messages are redelivered after channel closing
+            self._tags.remove(channel)
+            self._log(logging.ERROR, "Messages acknowledgement failed", exc_info=e)
+
+
+class _DeferredAcker:
+    """Messages acker for subscribers sending acknowledgements by themselves."""
+
+    __slots__ = ("subscriber",)
+
+    def __init__(self, subscriber: DeferredAckSubscriber) -> None:
+        self.subscriber = subscriber
+
+    async def ack(self, message: "IncomingMessage") -> None:
+        await self.subscriber._ack(message)
+
+    def settle(self, message: "IncomingMessage", *, multiple: bool) -> None:
+        self.subscriber._tags.settle(
+            message.channel,
+            cast("int", message.delivery_tag),
+            multiple=multiple,
+        )
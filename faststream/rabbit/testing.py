@@ -17,7 +17,7 @@ from faststream.exceptions import SubscriberNotFound
 from faststream.message import gen_cor_id
 from faststream.rabbit.broker.broker import RabbitBroker
 from faststream.rabbit.parser import AioPikaParser
-from faststream.rabbit.publisher.producer import AioPikaFastProducer
+from faststream.rabbit.publisher.producer import AioPikaFastProducer, ConfirmationType
 from faststream.rabbit.schemas import (
     ExchangeType,
     RabbitExchange,
@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from aio_pika.abc import DateType, HeadersType
     from fast_depends.library.serializer import SerializerProto
 
+    from faststream.message import IdGenerator
     from faststream.rabbit.publisher import RabbitPublisher
     from faststream.rabbit.response import RabbitPublishCommand
     from faststream.rabbit.subscriber import RabbitSubscriber
@@ -137,6 +138,7 @@ def build_message(
     user_id: str | None = None,
     app_id: str | None = None,
     serializer: Optional["SerializerProto"] = None,
+    id_generator: "IdGenerator" = gen_cor_id,
 ) -> PatchedMessage:
     """Build a patched RabbitMQ message for testing."""
     que = RabbitQueue.validate(queue)
@@ -144,7 +146,7 @@ def build_message(
 
     routing = routing_key or que.routing()
 
-    correlation_id = correlation_id or gen_cor_id()
+    correlation_id = correlation_id or id_generator()
     msg = AioPikaParser.encode_message(
         message=message,
         persist=persist,
@@ -212,14 +214,32 @@ class FakeProducer(AioPikaFastProducer):
         cmd: "RabbitPublishCommand",
     ) -> None:
         """Publish a message to a RabbitMQ queue or exchange."""
+        await self._publish(cmd.body, cmd)
+
+    @override
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list["ConfirmationType"]:
+        """Publish messages to a RabbitMQ queue or exchange one by one."""
+        for message in cmd.batch_bodies:
+            await self._publish(message, cmd)
+        return [None] * len(cmd.batch_bodies)
+
+    async def _publish(
+        self,
+        message: "AioPikaSendableMessage",
+        cmd: "RabbitPublishCommand",
+    ) -> None:
         incoming = build_message(
-            message=cmd.body,
+            message=message,
             exchange=cmd.exchange,
             routing_key=cmd.destination,
             correlation_id=cmd.correlation_id,
             headers=cmd.headers,
             reply_to=cmd.reply_to,
             serializer=self.broker.config.fd_config._serializer,
+            id_generator=self.broker.config.id_generator,
             **cmd.message_options,
         )
 
@@ -250,6 +270,7 @@ class FakeProducer(AioPikaFastProducer):
             routing_key=cmd.destination,
             correlation_id=cmd.correlation_id,
             headers=cmd.headers,
+            id_generator=self.broker.config.id_generator,
             **cmd.message_options,
         )
 
@@ -277,6 +298,7 @@ class FakeProducer(AioPikaFastProducer):
             message=result.body,
             headers=result.headers,
             correlation_id=result.correlation_id,
+            id_generator=self.broker.config.id_generator,
         )
 
 
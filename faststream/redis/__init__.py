@@ -1,6 +1,16 @@
-from faststream._internal.testing.app import TestApp
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+from faststream._internal.lazy import lazy_attributes
+
+if find_spec("redis") is None:
+    from faststream.exceptions import INSTALL_FASTSTREAM_REDIS
+
+    raise ImportError(INSTALL_FASTSTREAM_REDIS)
+
+if TYPE_CHECKING:
+    from faststream._internal.testing.app import TestApp
 
-try:
     from .annotations import (
         Pipeline,
         Redis,
@@ -15,14 +25,6 @@ try:
     from .schemas import ListSub, PubSub, StreamSub
     from .testing import TestRedisBroker
 
-except ImportError as e:
-    if "'redis'" not in e.msg:
-        raise
-
-    from faststream.exceptions import INSTALL_FASTSTREAM_REDIS
-
-    raise ImportError(INSTALL_FASTSTREAM_REDIS) from e
-
 __all__ = (
     "BinaryMessageFormatV1",
     "JSONMessageFormat",
@@ -45,3 +47,28 @@ __all__ = (
     "TestApp",
     "TestRedisBroker",
 )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "TestApp": "faststream._internal.testing.app",
+        "Pipeline": ".annotations",
+        "Redis": ".annotations",
+        "RedisChannelMessage": ".annotations",
+        "RedisListMessage": ".annotations",
+        "RedisMessage": ".annotations",
+        "RedisStreamMessage": ".annotations",
+        "RedisBroker": ".broker",
+        "RedisPublisher": ".broker",
+        "RedisRoute": ".broker",
+        "RedisRouter": ".broker",
+        "BinaryMessageFormatV1": ".parser",
+        "JSONMessageFormat": ".parser",
+        "RedisPublishCommand": ".response",
+        "RedisResponse": ".response",
+        "ListSub": ".schemas",
+        "PubSub": ".schemas",
+        "StreamSub": ".schemas",
+        "TestRedisBroker": ".testing",
+    },
+)
@@ -54,6 +54,7 @@ if TYPE_CHECKING:
     from faststream._internal.basic_types import LoggerProto, SendableMessage
     from faststream._internal.broker.registrator import Registrator
     from faststream._internal.types import BrokerMiddleware, CustomCallable
+    from faststream.message import IdGenerator
     from faststream.redis.message import RedisChannelMessage
     from faststream.security import BaseSecurity
     from faststream.specification.schema.extra import Tag, TagDict
@@ -111,12 +112,31 @@ class RedisBroker(
         parser_class: type["BaseParser"] = DefaultParser,
         encoder_class: type["Encoder"] = Encoder,
         # broker args
+        autopipeline: Annotated[
+            bool,
+            Doc(
+                "Send messages published concurrently by a single non-transactional pipeline. "
+                "Publishing with an explicit `pipeline` is not affected.",
+            ),
+        ] = False,
         graceful_timeout: Annotated[
             float | None,
             Doc(
                 "Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.",
             ),
         ] = 15.0,
+        id_generator: Annotated[
+            "IdGenerator",
+            Doc(
+                "Function to generate `correlation_id` of published messages.",
+            ),
+        ] = gen_cor_id,
+        start_concurrency: Annotated[
+            int,
+            Doc(
+                "Maximum number of subscribers started or stopped concurrently by the broker.",
+            ),
+        ] = 1,
         decoder: Annotated[
             Optional["CustomCallable"],
             Doc("Custom decoder object."),
@@ -237,6 +257,7 @@ class RedisBroker(
                     decoder=decoder,
                     message_format=self.message_format,
                     serializer=serializer,
+                    autopipeline=autopipeline,
                 ),
                 message_format=self.message_format,
                 # both args
@@ -254,6 +275,8 @@ class RedisBroker(
                 # subscriber args
                 broker_dependencies=dependencies,
                 graceful_timeout=graceful_timeout,
+                id_generator=id_generator,
+                start_concurrency=start_concurrency,
                 extra_context={
                     "broker": self,
                 },
@@ -376,7 +399,7 @@ class RedisBroker(
         """
         cmd = RedisPublishCommand(
             message,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self.config.id_generator(),
             channel=channel,
             list=list,
             stream=stream,
@@ -409,7 +432,7 @@ class RedisBroker(
     ) -> "RedisChannelMessage":
         cmd = RedisPublishCommand(
             message,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self.config.id_generator(),
             channel=channel,
             list=list,
             stream=stream,
@@ -453,7 +476,7 @@ class RedisBroker(
             list=list,
             reply_to=reply_to,
             headers=headers,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self.config.id_generator(),
             pipeline=pipeline,
             _publish_type=PublishType.PUBLISH,
             message_format=self.message_format,
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        OrderingKey,
         PublisherMiddleware,
         SubscriberMiddleware,
     )
@@ -79,6 +80,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: None = None,
+        ordering_key: Optional["OrderingKey[Any]"] = None,
     ) -> "ChannelSubscriber": ...
 
     @overload
@@ -114,6 +116,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: int = ...,
+        ordering_key: Optional["OrderingKey[Any]"] = None,
     ) -> "ChannelConcurrentSubscriber": ...
 
     @overload
@@ -149,6 +152,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: None = None,
+        ordering_key: Optional["OrderingKey[Any]"] = None,
     ) -> "ListSubscriber": ...
 
     @overload
@@ -184,6 +188,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: None = None,
+        ordering_key: Optional["OrderingKey[Any]"] = None,
     ) -> Union["ListSubscriber", "ListBatchSubscriber"]: ...
 
     @overload
@@ -219,6 +224,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: int = ...,
+        ordering_key: Optional["OrderingKey[Any]"] = None,
     ) -> "ListConcurrentSubscriber": ...
 
     @overload
@@ -254,6 +260,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: None = None,
+        ordering_key: Optional["OrderingKey[Any]"] = None,
     ) -> "StreamSubscriber": ...
 
     @overload
@@ -289,6 +296,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: None = None,
+        ordering_key: Optional["OrderingKey[Any]"] = None,
     ) -> Union["StreamSubscriber", "StreamBatchSubscriber"]: ...
 
     @overload
@@ -324,6 +332,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: int = ...,
+        ordering_key: Optional["OrderingKey[Any]"] = None,
     ) -> "StreamConcurrentSubscriber": ...
 
     @overload
@@ -359,6 +368,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: int | None = None,
+        ordering_key: Optional["OrderingKey[Any]"] = None,
     ) -> "LogicSubscriber": ...
 
     @override
@@ -394,6 +404,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: int | None = None,
+        ordering_key: Optional["OrderingKey[Any]"] = None,
     ) -> "LogicSubscriber":
         """Subscribe a handler to a RabbitMQ queue.
 
@@ -410,6 +421,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
             message_format: Which format to use when parsing messages.
             max_workers: Number of workers to process messages concurrently.
+            ordering_key: Function to get a key from the raw message to process messages with the same key in order. Requires `max_workers` > 1.
             title: AsyncAPI subscriber object title.
             description: AsyncAPI subscriber object description. Uses decorated docstring as default.
             include_in_schema: Whether to include operation in AsyncAPI schema or not.
@@ -423,6 +435,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             stream=stream,
             # subscriber args
             max_workers=max_workers or 1,
+            ordering_key=ordering_key,
             no_ack=no_ack,
             no_reply=no_reply,
             ack_policy=ack_policy,
@@ -23,6 +23,7 @@ if TYPE_CHECKING:
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        OrderingKey,
         PublisherMiddleware,
         SubscriberMiddleware,
     )
@@ -192,6 +193,13 @@ class RedisRoute(SubscriberRoute):
             int,
             Doc("Number of workers to process messages concurrently."),
         ] = 1,
+        ordering_key: Annotated[
+            Optional["OrderingKey[Any]"],
+            Doc(
+                "Function to get a key from the raw message to process messages "
+                "with the same key in order. Requires `max_workers` > 1.",
+            ),
+        ] = None,
     ) -> None:
         super().__init__(
             call,
@@ -201,6 +209,7 @@ class RedisRoute(SubscriberRoute):
             stream=stream,
             dependencies=dependencies,
             max_workers=max_workers,
+            ordering_key=ordering_key,
             parser=parser,
             decoder=decoder,
             middlewares=middlewares,
@@ -25,6 +25,7 @@ from faststream.__about__ import SERVICE_NAME
 from faststream._internal.constants import EMPTY
 from faststream._internal.context import ContextRepo
 from faststream._internal.fastapi.router import StreamRouter
+from faststream.message import gen_cor_id
 from faststream.middlewares import AckPolicy
 from faststream.redis.broker.broker import RedisBroker as RB
 from faststream.redis.message import UnifyRedisDict
@@ -43,9 +44,11 @@ if TYPE_CHECKING:
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        OrderingKey,
         PublisherMiddleware,
         SubscriberMiddleware,
     )
+    from faststream.message import IdGenerator
     from faststream.redis.publisher.factory import PublisherType
     from faststream.redis.subscriber.factory import SubscriberType
     from faststream.security import BaseSecurity
@@ -82,12 +85,31 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
         parser_class: type["BaseParser"] = DefaultParser,
         encoder_class: type["Encoder"] = Encoder,
         # broker base args
+        autopipeline: Annotated[
+            bool,
+            Doc(
+                "Send messages published concurrently by a single non-transactional pipeline. "
+                "Publishing with an explicit `pipeline` is not affected.",
+            ),
+        ] = False,
         graceful_timeout: Annotated[
             float | None,
             Doc(
                 "Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.",
             ),
         ] = 15.0,
+        id_generator: Annotated[
+            "IdGenerator",
+            Doc(
+                "Function to generate `correlation_id` of published messages.",
+            ),
+        ] = gen_cor_id,
+        start_concurrency: Annotated[
+            int,
+            Doc(
+                "Maximum number of subscribers started or stopped concurrently by the broker.",
+            ),
+        ] = 1,
         decoder: Annotated[
             Optional["CustomCallable"],
             Doc("Custom decoder object."),
@@ -384,7 +406,10 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
             parser_class=parser_class,
             connection_class=connection_class,
             encoder_class=encoder_class,
+            autopipeline=autopipeline,
             graceful_timeout=graceful_timeout,
+            id_generator=id_generator,
+            start_concurrency=start_concurrency,
             decoder=decoder,
             parser=parser,
             middlewares=middlewares,
@@ -621,12 +646,20 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
             int,
             Doc("Number of workers to process messages concurrently."),
         ] = 1,
+        ordering_key: Annotated[
+            Optional["OrderingKey[Any]"],
+            Doc(
+                "Function to get a key from the raw message to process messages "
+                "with the same key in order. Requires `max_workers` > 1.",
+            ),
+        ] = None,
     ) -> "SubscriberType":
         return cast(
             "SubscriberType",
             super().subscriber(
                 channel=channel,
                 max_workers=max_workers,
+                ordering_key=ordering_key,
                 list=list,
                 stream=stream,
                 dependencies=dependencies,
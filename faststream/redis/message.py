@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from redis.asyncio import Redis
 
     from faststream._internal.basic_types import DecodedMessage
+    from faststream.redis.subscriber.acks import StreamAcker
 
 
 BaseMessage: TypeAlias = Union[
@@ -41,7 +42,7 @@ class UnifyRedisDict(TypedDict):
 
 
 class RedisMessage(BrokerStreamMessage[UnifyRedisDict]):
-    pass
+    __slots__ = ()
 
 
 class PubSubMessage(TypedDict):
@@ -54,7 +55,7 @@ class PubSubMessage(TypedDict):
 
 
 class RedisChannelMessage(BrokerStreamMessage[PubSubMessage]):
-    pass
+    __slots__ = ()
 
 
 class _ListMessage(TypedDict):
@@ -80,10 +81,14 @@ class BatchListMessage(_ListMessage):
 class RedisListMessage(BrokerStreamMessage[DefaultListMessage]):
     """StreamMessage for single List message."""
 
+    __slots__ = ()
+
 
 class RedisBatchListMessage(BrokerStreamMessage[BatchListMessage]):
     """StreamMessage for single List message."""
 
+    __slots__ = ()
+
     decoded_body: list["DecodedMessage"]
 
 
@@ -110,16 +115,22 @@ _StreamMsgType = TypeVar("_StreamMsgType", bound=_StreamMessage)
 
 
 class _RedisStreamMessageMixin(BrokerStreamMessage[_StreamMsgType]):
+    __slots__ = ()
+
     @override
     async def ack(
         self,
         redis: Optional["Redis[bytes]"] = None,
         group: str | None = None,
+        acker: Optional["StreamAcker"] = None,
     ) -> None:
         if not self.committed and group is not None and redis is not None:
             ids = self.raw_message["message_ids"]
             channel = self.raw_message["channel"]
-            await redis.xack(channel, group, *ids)  # type: ignore[no-untyped-call]
+            if acker is not None:
+                acker.add(channel, ids)
+            else:
+                await redis.xack(channel, group, *ids)  # type: ignore[no-untyped-call]
         await super().ack()
 
     @override
@@ -127,6 +138,7 @@ class _RedisStreamMessageMixin(BrokerStreamMessage[_StreamMsgType]):
         self,
         redis: Optional["Redis[bytes]"] = None,
         group: str | None = None,
+        acker: Optional["StreamAcker"] = None,
     ) -> None:
         await super().nack()
 
@@ -135,6 +147,7 @@ class _RedisStreamMessageMixin(BrokerStreamMessage[_StreamMsgType]):
         self,
         redis: Optional["Redis[bytes]"] = None,
         group: str | None = None,
+        acker: Optional["StreamAcker"] = None,
     ) -> None:
         await super().reject()
 
@@ -146,8 +159,10 @@ class _RedisStreamMessageMixin(BrokerStreamMessage[_StreamMsgType]):
 
 
 class RedisStreamMessage(_RedisStreamMessageMixin[DefaultStreamMessage]):
-    pass
+    __slots__ = ()
 
 
 class RedisBatchStreamMessage(_RedisStreamMessageMixin[BatchStreamMessage]):
+    __slots__ = ()
+
     decoded_body: list["DecodedMessage"]
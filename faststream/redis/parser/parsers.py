@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, Optional, Protocol
 from faststream._internal._compat import dump_json, json_loads
 from faststream._internal.basic_types import DecodedMessage
 from faststream._internal.constants import EMPTY, ContentTypes
-from faststream.message import decode_message, gen_cor_id
+from faststream.message import decode_message
 from faststream.redis.message import (
     RedisBatchListMessage,
     RedisBatchStreamMessage,
@@ -50,8 +50,6 @@ class SimpleParser:
     ) -> "StreamMessage[Mapping[str, Any]]":
         data, headers, batch_headers = self._parse_data(message)
 
-        id_ = gen_cor_id()
-
         return self.msg_class(
             raw_message=message,
             body=data,
@@ -60,8 +58,8 @@ class SimpleParser:
             batch_headers=batch_headers,
             reply_to=headers.get("reply_to", ""),
             content_type=headers.get("content-type"),
-            message_id=headers.get("message_id", id_),
-            correlation_id=headers.get("correlation_id", id_),
+            message_id=headers.get("message_id"),
+            correlation_id=headers.get("correlation_id"),
         )
 
     def _parse_data(
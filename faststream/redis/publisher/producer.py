@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Any, Optional, cast
+import asyncio
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, Optional, TypeAlias, Union, cast
 
 import anyio
 from typing_extensions import override
@@ -6,17 +8,183 @@ from typing_extensions import override
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.producer import ProducerProto
 from faststream._internal.utils.nuid import NUID
+from faststream.exceptions import IncorrectState
 from faststream.redis.message import DATA_KEY
 from faststream.redis.parser import RedisPubSubParser, SimpleParserConfig
 from faststream.redis.response import DestinationType, RedisPublishCommand
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from fast_depends.library.serializer import SerializerProto
+    from redis.asyncio.client import Pipeline, Redis
 
     from faststream._internal.types import CustomCallable
     from faststream.redis.configs import ConnectionState
     from faststream.redis.parser import MessageFormat
 
+    PipelineCommand: TypeAlias = Callable[[Pipeline[bytes]], Any]
+
+
+class AutoPipeline:
+    """Collect commands issued concurrently to send them by a single pipeline.
+
+    Commands are buffered until the next event loop iteration and executed
+    by a non-transactional pipeline. Each caller gets its own command result.
+    """
+
+    __slots__ = ("_commands", "_connection", "_flush_task", "max_size")
+
+    def __init__(
+        self,
+        connection: "ConnectionState",
+        max_size: int = 1000,
+    ) -> None:
+        self._connection = connection
+        self.max_size = max_size
+
+        self._commands: list[tuple[PipelineCommand, asyncio.Future[Any]]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def execute(self, command: "PipelineCommand") -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._commands.append((command, future))
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+
+        return await future
+
+    async def _flush(self) -> None:
+        # let concurrent publishers add their commands
+        await asyncio.sleep(0)
+
+        commands, self._commands = self._commands, []
+        self._flush_task = None
+
+        await asyncio.gather(
+            *(
+                self._send(commands[i : i + self.max_size])
+                for i in range(0, len(commands), self.max_size)
+            ),
+        )
+
+    async def _send(
+        self,
+        commands: list[tuple["PipelineCommand", asyncio.Future[Any]]],
+    ) -> None:
+        try:
+            async with self._connection.client.pipeline(transaction=False) as pipe:
+                for command, _ in commands:
+                    command(pipe)
+                results = await pipe.execute(raise_on_error=False)
+
+        except asyncio.CancelledError:
+            for _, future in commands:
+                future.cancel()
+            raise
+
+        except Exception as e:
+            for _, future in commands:
+                if not future.done():
+                    future.set_exception(e)
+
+        else:
+            for (_, future), result in zip(commands, results, strict=False):
+                if future.done():  # caller is cancelled
+                    continue
+
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+
+class ReplyListener:
+    """Shared subscription to receive RPC responses.
+
+    Reply channels share the process prefix and are listened to by a single
+    pattern subscription, so responses are routed to the waiting requests
+    without a subscription per request. Late responses are dropped.
+    """
+
+    __slots__ = (
+        "_connection",
+        "_nuid",
+        "_ready",
+        "_responses",
+        "_task",
+        "prefix",
+    )
+
+    def __init__(self, connection: "ConnectionState") -> None:
+        self._connection = connection
+
+        self._nuid = NUID()
+        self.prefix = f"faststream-rpc.{self._nuid.next().decode()}."
+
+        self._responses: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._ready: asyncio.Future[None] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def register(self) -> tuple[str, "asyncio.Future[dict[str, Any]]"]:
+        """Create a reply channel and a future to wait for its response."""
+        if self._task is None or self._ready is None:
+            self._ready = asyncio.get_running_loop().create_future()
+            self._task = asyncio.create_task(self._listen(self._ready))
+
+        # wait for the subscription to not miss the response
+        await asyncio.shield(self._ready)
+
+        reply_to = f"{self.prefix}{self._nuid.next().decode()}"
+        self._responses[reply_to] = response = asyncio.get_running_loop().create_future()
+        return reply_to, response
+
+    def discard(self, reply_to: str) -> None:
+        self._responses.pop(reply_to, None)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+
+    async def _listen(self, ready: "asyncio.Future[None]") -> None:
+        error: Exception = IncorrectState("RPC responses subscription is closed.")
+
+        psub = self._connection.client.pubsub()
+        try:
+            await psub.psubscribe(f"{self.prefix}*")
+
+            async for message in psub.listen():
+                if message["type"] == "psubscribe":
+                    if not ready.done():
+                        ready.set_result(None)
+
+                elif message["type"] == "pmessage":
+                    channel = message["channel"]
+                    if isinstance(channel, bytes):
+                        channel = channel.decode()
+
+                    response = self._responses.pop(channel, None)
+                    if response is not None and not response.done():
+                        response.set_result(message)
+
+        except Exception as e:
+            error = e
+
+        finally:
+            self._task = self._ready = None
+
+            futures: list[asyncio.Future[Any]] = [ready, *self._responses.values()]
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            self._responses.clear()
+
+            with suppress(Exception):
+                await psub.aclose()  # type: ignore[attr-defined]
+
 
 class RedisFastProducer(ProducerProto[RedisPublishCommand]):
     """A class to represent a Redis producer."""
@@ -31,8 +199,11 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
         decoder: Optional["CustomCallable"],
         message_format: type["MessageFormat"],
         serializer: Optional["SerializerProto"],
+        autopipeline: bool = False,
     ) -> None:
         self._connection = connection
+        self._pipeline = AutoPipeline(connection) if autopipeline else None
+        self._replies = ReplyListener(connection)
 
         default = RedisPubSubParser(SimpleParserConfig(message_format))
         self._parser = ParserComposition(
@@ -59,41 +230,24 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
 
     @override
     async def request(self, cmd: "RedisPublishCommand") -> "Any":
-        nuid = NUID()
-        reply_to = str(nuid.next(), "utf-8")
-        psub = self._connection.client.pubsub()
-        await psub.subscribe(reply_to)
+        with anyio.fail_after(cmd.timeout):
+            reply_to, response = await self._replies.register()
 
-        msg = cmd.message_format.encode(
-            message=cmd.body,
-            reply_to=reply_to,
-            headers=cmd.headers,
-            correlation_id=cmd.correlation_id or "",
-            serializer=self.serializer,
-        )
+            try:
+                msg = cmd.message_format.encode(
+                    message=cmd.body,
+                    reply_to=reply_to,
+                    headers=cmd.headers,
+                    correlation_id=cmd.correlation_id or "",
+                    serializer=self.serializer,
+                )
 
-        await self.__publish(msg, cmd)
+                await self.__publish(msg, cmd)
 
-        with anyio.fail_after(cmd.timeout) as scope:
-            # skip subscribe message
-            await psub.get_message(
-                ignore_subscribe_messages=True,
-                timeout=cmd.timeout or 0.0,
-            )
-
-            # get real response
-            response_msg = await psub.get_message(
-                ignore_subscribe_messages=True,
-                timeout=cmd.timeout or 0.0,
-            )
-
-        await psub.unsubscribe()
-        await psub.aclose()  # type: ignore[attr-defined]
-
-        if scope.cancel_called:
-            raise TimeoutError
+                return await response
 
-        return response_msg
+            finally:
+                self._replies.discard(reply_to)
 
     @override
     async def publish_batch(self, cmd: "RedisPublishCommand") -> int:
@@ -108,6 +262,14 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
             for msg in cmd.batch_bodies
         ]
 
+        if cmd.pipeline is None and self._pipeline is not None:
+            return cast(
+                "int",
+                await self._pipeline.execute(
+                    lambda pipe: pipe.rpush(cmd.destination, *batch),
+                ),
+            )
+
         connection = cmd.pipeline or self._connection.client
         return await connection.rpush(cmd.destination, *batch)
 
@@ -116,22 +278,34 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
         msg: bytes,
         cmd: "RedisPublishCommand",
     ) -> int | bytes:
+        if cmd.pipeline is None and self._pipeline is not None:
+            return cast(
+                "int | bytes",
+                await self._pipeline.execute(
+                    lambda pipe: self.__command(pipe, msg, cmd),
+                ),
+            )
+
         connection = cmd.pipeline or self._connection.client
+        return cast("int | bytes", await self.__command(connection, msg, cmd))
 
+    @staticmethod
+    def __command(
+        connection: Union["Redis[bytes]", "Pipeline[bytes]"],
+        msg: bytes,
+        cmd: "RedisPublishCommand",
+    ) -> Any:
         if cmd.destination_type is DestinationType.Channel:
-            return await connection.publish(cmd.destination, msg)
+            return connection.publish(cmd.destination, msg)
 
         if cmd.destination_type is DestinationType.List:
-            return await connection.rpush(cmd.destination, msg)
+            return connection.rpush(cmd.destination, msg)
 
         if cmd.destination_type is DestinationType.Stream:
-            return cast(
-                "bytes",
-                await connection.xadd(
-                    name=cmd.destination,
-                    fields={DATA_KEY: msg},
-                    maxlen=cmd.maxlen,
-                ),
+            return connection.xadd(
+                name=cmd.destination,
+                fields={DATA_KEY: msg},
+                maxlen=cmd.maxlen,
             )
 
         error_msg = "unreachable"
@@ -139,3 +313,6 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
 
     def connect(self, serializer: Optional["SerializerProto"] = None) -> None:
         self.serializer = serializer
+
+    async def disconnect(self) -> None:
+        await self._replies.close()
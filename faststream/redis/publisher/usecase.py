@@ -8,7 +8,6 @@ from faststream._internal.endpoint.publisher import (
     PublisherSpecification,
     PublisherUsecase,
 )
-from faststream.message import gen_cor_id
 from faststream.redis.response import RedisPublishCommand
 from faststream.response.publish_type import PublishType
 
@@ -101,7 +100,7 @@ class ChannelPublisher(LogicPublisher):
             channel=channel or self.channel.name,
             reply_to=reply_to or self.reply_to,
             headers=self.headers | (headers or {}),
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self._outer_config.id_generator(),
             pipeline=pipeline,
             _publish_type=PublishType.PUBLISH,
             message_format=self.config.message_format,
@@ -148,7 +147,7 @@ class ChannelPublisher(LogicPublisher):
             message,
             channel=channel or self.channel.name,
             headers=self.headers | (headers or {}),
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self._outer_config.id_generator(),
             timeout=timeout,
             _publish_type=PublishType.REQUEST,
             message_format=self.config.message_format,
@@ -201,7 +200,7 @@ class ListPublisher(LogicPublisher):
             list=list or self.list.name,
             reply_to=reply_to or self.reply_to,
             headers=self.headers | (headers or {}),
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self._outer_config.id_generator(),
             pipeline=pipeline,
             _publish_type=PublishType.PUBLISH,
             message_format=self.config.message_format,
@@ -249,7 +248,7 @@ class ListPublisher(LogicPublisher):
             message,
             list=list or self.list.name,
             headers=self.headers | (headers or {}),
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self._outer_config.id_generator(),
             timeout=timeout,
             _publish_type=PublishType.REQUEST,
             message_format=self.config.message_format,
@@ -278,7 +277,7 @@ class ListBatchPublisher(ListPublisher):
             list=list or self.list.name,
             reply_to=reply_to or self.reply_to,
             headers=self.headers | (headers or {}),
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self._outer_config.id_generator(),
             pipeline=pipeline,
             _publish_type=PublishType.PUBLISH,
             message_format=self.config.message_format,
@@ -355,7 +354,7 @@ class StreamPublisher(LogicPublisher):
             stream=stream or self.stream.name,
             reply_to=reply_to or self.reply_to,
             headers=self.headers | (headers or {}),
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self._outer_config.id_generator(),
             maxlen=maxlen or self.stream.maxlen,
             pipeline=pipeline,
             _publish_type=PublishType.PUBLISH,
@@ -406,7 +405,7 @@ class StreamPublisher(LogicPublisher):
             message,
             stream=stream or self.stream.name,
             headers=self.headers | (headers or {}),
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id or self._outer_config.id_generator(),
             maxlen=maxlen or self.stream.maxlen,
             timeout=timeout,
             _publish_type=PublishType.REQUEST,
@@ -6,15 +6,27 @@ from faststream.exceptions import SetupError
 
 
 class StreamSub(NameRequired):
-    """A class to represent a Redis Stream subscriber."""
+    """A class to represent a Redis Stream subscriber.
+
+    Args:
+        min_idle_time (:obj:`int`, optional): Consumer group pending entries idle for this time in milliseconds
+            are claimed by the consumer with `XAUTOCLAIM` to be processed again, so messages of crashed consumers
+            are not stuck in the group pending entries list (default is `None`).
+        ack_batch_size (:obj:`int`, optional): Send consumer group acknowledgements by batches of this size with
+            a single `XACK` per stream instead of a command per message (default is `None`).
+        ack_interval (int): Maximum time between batched acknowledgements sending in milliseconds (default is `100`).
+    """
 
     __slots__ = (
+        "ack_batch_size",
+        "ack_interval",
         "batch",
         "consumer",
         "group",
         "last_id",
         "max_records",
         "maxlen",
+        "min_idle_time",
         "name",
         "no_ack",
         "polling_interval",
@@ -31,11 +43,31 @@ class StreamSub(NameRequired):
         last_id: str | None = None,
         maxlen: int | None = None,
         max_records: int | None = None,
+        *,
+        min_idle_time: int | None = None,
+        ack_batch_size: int | None = None,
+        ack_interval: int = 100,
     ) -> None:
         if (group and not consumer) or (not group and consumer):
             msg = "You should specify `group` and `consumer` both"
             raise SetupError(msg)
 
+        if not group and (min_idle_time is not None or ack_batch_size is not None):
+            msg = "`min_idle_time` and `ack_batch_size` can be used with consumer group only"
+            raise SetupError(msg)
+
+        if min_idle_time is not None and min_idle_time <= 0:
+            msg = "`min_idle_time` should be greater than 0."
+            raise SetupError(msg)
+
+        if ack_batch_size is not None and ack_batch_size < 1:
+            msg = "`ack_batch_size` should be greater than 0."
+            raise SetupError(msg)
+
+        if ack_interval <= 0:
+            msg = "`ack_interval` should be greater than 0."
+            raise SetupError(msg)
+
         if group and consumer:
             if last_id != ">":
                 if polling_interval:
@@ -72,6 +104,9 @@ class StreamSub(NameRequired):
         self.last_id = last_id
         self.maxlen = maxlen
         self.max_records = max_records
+        self.min_idle_time = min_idle_time
+        self.ack_batch_size = ack_batch_size
+        self.ack_interval = ack_interval
 
     def add_prefix(self, prefix: str) -> "StreamSub":
         new_stream = deepcopy(self)
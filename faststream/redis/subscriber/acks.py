@@ -0,0 +1,76 @@
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import anyio
+
+if TYPE_CHECKING:
+    from redis.asyncio.client import Redis
+
+
+class StreamAcker:
+    """Collect stream messages acknowledgements to send them by batches.
+
+    Acknowledged ids are sent by a single `XACK` per stream through one
+    non-transactional pipeline instead of a command per message.
+    """
+
+    __slots__ = (
+        "_client",
+        "_count",
+        "_event",
+        "_ids",
+        "group",
+        "max_messages",
+    )
+
+    def __init__(
+        self,
+        client: "Redis[bytes]",
+        group: str,
+        max_messages: int,
+    ) -> None:
+        self._client = client
+        self.group = group
+        self.max_messages = max_messages
+
+        self._ids: dict[str, list[bytes]] = {}
+        self._count = 0
+        self._event = anyio.Event()
+
+    def add(self, channel: str, ids: Sequence[bytes]) -> None:
+        """Register acknowledged message ids."""
+        self._ids.setdefault(channel, []).extend(ids)
+
+        self._count += len(ids)
+        if self._count >= self.max_messages:
+            self._event.set()
+
+    async def wait(self, timeout: float) -> None:
+        """Wait for `max_messages` acknowledgements or the timeout."""
+        with anyio.move_on_after(timeout):
+            await self._event.wait()
+        self._event = anyio.Event()
+
+    async def flush(self) -> None:
+        """Send all registered acknowledgements.
+
+        Acknowledgements are kept in the acker if the pipeline fails.
+        """
+        if not self._ids:
+            return
+
+        acks, self._ids = self._ids, {}
+        self._count = 0
+
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for channel, ids in acks.items():
+                    pipe.xack(channel, self.group, *ids)
+                await pipe.execute()
+
+        except BaseException:
+            # keep failed acknowledgements to send them with the next flush
+            for channel, ids in acks.items():
+                self._ids.setdefault(channel, [])[:0] = ids
+                self._count += len(ids)
+            raise
@@ -1,5 +1,5 @@
 import warnings
-from typing import TYPE_CHECKING, Any, TypeAlias, Union
+from typing import TYPE_CHECKING, Any, Optional, TypeAlias, Union
 
 from faststream._internal.constants import EMPTY
 from faststream._internal.endpoint.subscriber.call_item import CallsCollection
@@ -29,6 +29,7 @@ from .usecases import (
 )
 
 if TYPE_CHECKING:
+    from faststream._internal.types import OrderingKey
     from faststream.redis.configs import RedisBrokerConfig
 
 SubscriberType: TypeAlias = LogicSubscriber
@@ -50,6 +51,7 @@ def create_subscriber(
     description_: str | None = None,
     include_in_schema: bool = True,
     max_workers: int = 1,
+    ordering_key: Optional["OrderingKey[Any]"] = None,
 ) -> SubscriberType:
     _validate_input_for_misconfigure(
         channel=channel,
@@ -58,6 +60,7 @@ def create_subscriber(
         ack_policy=ack_policy,
         no_ack=no_ack,
         max_workers=max_workers,
+        ordering_key=ordering_key,
         message_format=message_format,
     )
 
@@ -96,6 +99,7 @@ def create_subscriber(
                 specification,
                 calls,
                 max_workers=max_workers,
+                ordering_key=ordering_key,
             )
 
         return ChannelSubscriber(subscriber_config, specification, calls)
@@ -118,6 +122,7 @@ def create_subscriber(
                 specification,
                 calls,
                 max_workers=max_workers,
+                ordering_key=ordering_key,
             )
 
         return StreamSubscriber(subscriber_config, specification, calls)
@@ -140,6 +145,7 @@ def create_subscriber(
                 specification,
                 calls,
                 max_workers=max_workers,
+                ordering_key=ordering_key,
             )
 
         return ListSubscriber(subscriber_config, specification, calls)
@@ -155,6 +161,7 @@ def _validate_input_for_misconfigure(
     ack_policy: AckPolicy,
     no_ack: bool,
     max_workers: int,
+    ordering_key: Optional["OrderingKey[Any]"],
     message_format: type["MessageFormat"] | None,
 ) -> None:
     validate_options(channel=channel, list=list, stream=stream)
@@ -178,6 +185,10 @@ def _validate_input_for_misconfigure(
             msg = "You can't use deprecated `no_ack` and `ack_policy` simultaneously. Please, use `ack_policy` only."
             raise SetupError(msg)
 
+    if ordering_key is not None and max_workers <= 1:
+        msg = "The `ordering_key` option can be used only with `max_workers` > 1."
+        raise SetupError(msg)
+
     if stream and no_ack and max_workers > 1:
         msg = "Max workers not work with manual no_ack mode."
         raise SetupError(msg)
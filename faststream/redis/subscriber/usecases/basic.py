@@ -24,6 +24,7 @@ if TYPE_CHECKING:
     from faststream._internal.endpoint.subscriber.call_item import (
         CallsCollection,
     )
+    from faststream._internal.types import OrderingKey
     from faststream.message import StreamMessage as BrokerStreamMessage
     from faststream.redis.configs import RedisBrokerConfig
     from faststream.redis.subscriber.config import RedisSubscriberConfig
@@ -142,8 +143,15 @@ class ConcurrentSubscriber(
         specification: "SubscriberSpecification[Any, Any]",
         calls: "CallsCollection[Any]",
         max_workers: int,
+        ordering_key: Optional["OrderingKey[BrokerStreamMessage[Any]]"] = None,
     ) -> None:
-        super().__init__(config, specification, calls, max_workers=max_workers)
+        super().__init__(
+            config,
+            specification,
+            calls,
+            max_workers=max_workers,
+            ordering_key=ordering_key,
+        )
 
     async def start(self) -> None:
         await super().start()
@@ -1,4 +1,6 @@
+import logging
 import math
+import time
 from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Optional, TypeAlias
 
@@ -16,6 +18,7 @@ from faststream.redis.parser import (
     RedisBatchStreamParser,
     RedisStreamParser,
 )
+from faststream.redis.subscriber.acks import StreamAcker
 
 from .basic import LogicSubscriber
 
@@ -47,6 +50,7 @@ class _StreamHandlerMixin(LogicSubscriber):
         assert config.stream_sub
         self._stream_sub = config.stream_sub
         self.last_id = config.stream_sub.last_id
+        self._acker: StreamAcker | None = None
 
     @property
     def stream_sub(self) -> "StreamSub":
@@ -74,13 +78,21 @@ class _StreamHandlerMixin(LogicSubscriber):
 
         client = self._client
 
+        stream = self.stream_sub
+
+        if stream.group and stream.ack_batch_size is not None:
+            self._acker = StreamAcker(
+                client,
+                group=stream.group,
+                max_messages=stream.ack_batch_size,
+            )
+
         self.extra_watcher_options.update(
             redis=client,
-            group=self.stream_sub.group,
+            group=stream.group,
+            acker=self._acker,
         )
 
-        stream = self.stream_sub
-
         read: Callable[
             [str],
             Awaitable[
@@ -113,26 +125,48 @@ class _StreamHandlerMixin(LogicSubscriber):
                 if "already exists" not in str(e):
                     raise
 
-            def read(
+            group, consumer = stream.group, stream.consumer
+            claim_id = "0-0"
+            next_claim = 0.0
+
+            async def read(
                 _: str,
-            ) -> Awaitable[
+            ) -> tuple[
                 tuple[
+                    TopicName,
                     tuple[
-                        TopicName,
                         tuple[
-                            tuple[
-                                Offset,
-                                dict[bytes, bytes],
-                            ],
-                            ...,
+                            Offset,
+                            dict[bytes, bytes],
                         ],
+                        ...,
                     ],
-                    ...,
                 ],
+                ...,
             ]:
-                return client.xreadgroup(
-                    groupname=stream.group,
-                    consumername=stream.consumer,
+                nonlocal claim_id, next_claim
+
+                if stream.min_idle_time is not None and time.monotonic() >= next_claim:
+                    claim_id, claimed, *_ = await client.xautoclaim(
+                        name=stream.name,
+                        groupname=group,
+                        consumername=consumer,
+                        min_idle_time=stream.min_idle_time,
+                        start_id=claim_id,
+                        count=stream.max_records,
+                    )
+
+                    if claim_id in {b"0-0", "0-0"}:
+                        # whole pending entries list is scanned, wait for new idle entries
+                        next_claim = time.monotonic() + stream.min_idle_time / 1000
+
+                    # entries deleted from the stream have no data
+                    if claimed := tuple(m for m in claimed if m[0] is not None):
+                        return ((stream.name.encode(), claimed),)
+
+                return await client.xreadgroup(  # type: ignore[no-any-return]
+                    groupname=group,
+                    consumername=consumer,
                     streams={stream.name: stream.last_id},
                     count=stream.max_records,
                     block=stream.polling_interval,
@@ -166,6 +200,37 @@ class _StreamHandlerMixin(LogicSubscriber):
 
         await super().start(read)
 
+        if self._acker is not None:
+            self.add_task(self._serve_acks(self._acker))
+
+    @override
+    async def stop(self) -> None:
+        await super().stop()
+
+        if self._acker is not None:
+            # send acknowledgements of messages processed before the stop
+            await self._send_acks(self._acker)
+            self._acker = None
+
+    async def _serve_acks(self, acker: "StreamAcker") -> None:
+        """Endless task sending acknowledgements by timer or messages number."""
+        interval = self.stream_sub.ack_interval / 1000
+        while True:
+            await acker.wait(interval)
+            await self._send_acks(acker)
+
+    async def _send_acks(self, acker: "StreamAcker") -> None:
+        try:
+            await acker.flush()
+
+        except Exception as e:
+            # failed acknowledgements are kept by the acker to retry them
+            self._log(
+                log_level=logging.ERROR,
+                message="Messages acknowledgement failed",
+                exc_info=e,
+            )
+
     @override
     async def get_one(
         self,
@@ -17,7 +17,6 @@ from typing_extensions import TypedDict, override
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.testing.broker import TestBroker, change_producer
 from faststream.exceptions import SetupError, SubscriberNotFound
-from faststream.message import gen_cor_id
 from faststream.redis.broker.broker import RedisBroker
 from faststream.redis.message import (
     BatchListMessage,
@@ -131,7 +130,7 @@ class FakeProducer(RedisFastProducer):
         body = build_message(
             message=cmd.body,
             reply_to=cmd.reply_to,
-            correlation_id=cmd.correlation_id or gen_cor_id(),
+            correlation_id=cmd.correlation_id or self.broker.config.id_generator(),
             headers=cmd.headers,
             serializer=self.broker.config.fd_config._serializer,
             message_format=cmd.message_format,
@@ -158,7 +157,7 @@ class FakeProducer(RedisFastProducer):
     async def request(self, cmd: "RedisPublishCommand") -> "PubSubMessage":
         body = build_message(
             message=cmd.body,
-            correlation_id=cmd.correlation_id or gen_cor_id(),
+            correlation_id=cmd.correlation_id or self.broker.config.id_generator(),
             headers=cmd.headers,
             message_format=cmd.message_format,
         )
@@ -181,12 +180,16 @@ class FakeProducer(RedisFastProducer):
 
         raise SubscriberNotFound
 
+    @override
+    async def disconnect(self) -> None:
+        pass
+
     @override
     async def publish_batch(self, cmd: "RedisPublishCommand") -> int:
         data_to_send = [
             build_message(
                 m,
-                correlation_id=cmd.correlation_id or gen_cor_id(),
+                correlation_id=cmd.correlation_id or self.broker.config.id_generator(),
                 headers=cmd.headers,
                 message_format=cmd.message_format,
             )
@@ -7,6 +7,7 @@ from pydantic import BaseModel
 
 from faststream import Context, Depends
 from faststream.exceptions import StopConsume
+from faststream.filters import HeaderEquals, JsonFieldEquals
 
 from .basic import BaseTestcaseConfig
 
@@ -197,6 +198,48 @@ class BrokerConsumeTestcase(BaseTestcaseConfig):
         mock.handler.assert_called_once_with({"msg": "hello"})
         mock.handler2.assert_called_once_with("hello")
 
+    async def test_consume_with_declarative_filters(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        consume_broker = self.get_broker()
+
+        event = asyncio.Event()
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        sub = consume_broker.subscriber(*args, **kwargs)
+
+        @sub(filter=HeaderEquals("type", "first"))
+        async def handler(m) -> None:
+            mock.handler(m)
+
+        @sub(filter=JsonFieldEquals("type", "second"))
+        async def handler2(m) -> None:
+            mock.handler2(m)
+
+        @sub
+        async def default_handler(m) -> None:
+            mock.default(m)
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+            assert sub.calls._index is not None
+
+            await br.publish("1", queue, headers={"type": "first"})
+            await br.publish({"type": "second"}, queue)
+            await br.publish("3", queue, headers={"type": "third"})
+
+            with anyio.move_on_after(self.timeout):
+                await event.wait()
+
+        assert event.is_set()
+        mock.handler.assert_called_once_with("1")
+        mock.handler2.assert_called_once_with({"type": "second"})
+        mock.default.assert_called_once_with("3")
+
     async def test_consume_validate_false(
         self,
         queue: str,
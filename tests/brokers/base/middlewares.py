@@ -252,6 +252,40 @@ class MiddlewaresOrderTestcase(BaseTestcaseConfig):
         call_order = [c.args[0] for c in mock.call_args_list]
         assert call_order == ["outer", "middle", "inner"], call_order
 
+    async def test_middlewares_frozen_at_start(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        class LateMiddleware(BaseMiddleware):
+            async def consume_scope(self, call_next, msg):
+                mock.late()
+                return await call_next(msg)
+
+        broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        sub = broker.subscriber(*args, **kwargs)
+
+        @sub
+        async def handler(msg):
+            mock(msg)
+
+        async with self.patch_broker(broker) as br:
+            pipeline = sub._pipeline
+            assert pipeline is not None
+
+            # should be applied only after subscriber restart
+            br.add_middleware(LateMiddleware)
+            await br.publish("hi", queue)
+            await handler.wait_call(self.timeout)
+
+            assert sub._pipeline is pipeline
+
+        mock.assert_called_once_with("hi")
+        assert not mock.late.called
+
 
 @pytest.mark.asyncio()
 class LocalMiddlewareTestcase(BaseTestcaseConfig):
@@ -6,6 +6,8 @@ from unittest.mock import Mock
 import anyio
 import pytest
 
+from faststream import Context
+
 from .consume import BrokerConsumeTestcase
 from .publish import BrokerPublishTestcase
 
@@ -50,6 +52,26 @@ class BrokerTestclientTestcase(BrokerPublishTestcase, BrokerConsumeTestcase):
             await br.publish("hello", queue)
             m.mock.assert_called_once_with("hello")
 
+    @pytest.mark.asyncio()
+    async def test_id_generator(self, queue: str) -> None:
+        test_broker = self.get_broker(
+            apply_types=True,
+            id_generator=lambda: "custom-id",
+        )
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @test_broker.subscriber(*args, **kwargs)
+        async def m(msg, message=Context()) -> None:
+            assert message.correlation_id == "custom-id"
+
+        async with self.patch_broker(test_broker) as br:
+            await br.start()
+            await br.publish("hello", queue)
+            await m.wait_call(self.timeout)
+
+            m.mock.assert_called_once_with("hello")
+
     @pytest.mark.asyncio()
     async def test_publisher_mock(self, queue: str) -> None:
         test_broker = self.get_broker()
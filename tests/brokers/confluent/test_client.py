@@ -0,0 +1,151 @@
+import asyncio
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from confluent_kafka import KafkaError, KafkaException
+
+from faststream.confluent.helpers.client import AsyncConfluentProducer, BatchBuilder
+
+
+class FakeProducer:
+    """Collects produced messages delivery callbacks to call them by tests."""
+
+    def __init__(self, fail_on: int | None = None) -> None:
+        self.fail_on = fail_on
+        self.produced: list[dict[str, Any]] = []
+
+    def produce(self, topic: str, **kwargs: Any) -> None:
+        if len(self.produced) == self.fail_on:
+            raise BufferError
+
+        self.produced.append(kwargs)
+
+    def poll(self, timeout: float) -> int:
+        return 0
+
+    def deliver(self, index: int, err: Any = None) -> None:
+        self.produced[index]["on_delivery"](err, MagicMock(error=lambda: None))
+
+
+def build_producer(producer: FakeProducer) -> AsyncConfluentProducer:
+    client = object.__new__(AsyncConfluentProducer)
+    client.producer = producer  # type: ignore[assignment]
+    client.logger_state = MagicMock()
+    return client
+
+
+def build_batch(size: int) -> BatchBuilder:
+    batch = BatchBuilder()
+    for i in range(size):
+        batch.append(value=str(i).encode())
+    return batch
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_send_batch_confirmed_by_all_deliveries() -> None:
+    producer = FakeProducer()
+    client = build_producer(producer)
+
+    task = asyncio.create_task(client.send_batch(build_batch(10), "test", partition=1))
+    await asyncio.sleep(0)
+
+    assert [m["value"] for m in producer.produced] == [str(i).encode() for i in range(10)]
+    assert all(m["partition"] == 1 for m in producer.produced)
+
+    # delivery reports are served by the librdkafka threads
+    threads = [threading.Thread(target=producer.deliver, args=(i,)) for i in range(9)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    producer.deliver(9)
+    await asyncio.wait_for(task, timeout=1)
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_send_batch_delivery_error() -> None:
+    producer = FakeProducer()
+    client = build_producer(producer)
+
+    task = asyncio.create_task(client.send_batch(build_batch(3), "test", partition=None))
+    await asyncio.sleep(0)
+
+    assert all("partition" not in m for m in producer.produced)
+
+    error = KafkaError(KafkaError._MSG_TIMED_OUT)
+    producer.deliver(0)
+    producer.deliver(1, error)
+    producer.deliver(2)
+
+    with pytest.raises(KafkaException) as exc:
+        await asyncio.wait_for(task, timeout=1)
+
+    assert exc.value.args[0] == error
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_send_batch_message_error() -> None:
+    producer = FakeProducer()
+    client = build_producer(producer)
+
+    task = asyncio.create_task(client.send_batch(build_batch(1), "test", partition=None))
+    await asyncio.sleep(0)
+
+    error = KafkaError(KafkaError._MSG_TIMED_OUT)
+    producer.produced[0]["on_delivery"](None, MagicMock(error=lambda: error))
+
+    with pytest.raises(KafkaException):
+        await asyncio.wait_for(task, timeout=1)
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_send_batch_buffer_error() -> None:
+    producer = FakeProducer(fail_on=2)
+    client = build_producer(producer)
+
+    with pytest.raises(BufferError):
+        await client.send_batch(build_batch(5), "test", partition=None)
+
+    assert len(producer.produced) == 2
+
+    # already produced messages delivery is ignored
+    producer.deliver(0)
+    producer.deliver(1, KafkaError(KafkaError._MSG_TIMED_OUT))
+    await asyncio.sleep(0)
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_send_batch_no_confirm_logs_error() -> None:
+    producer = FakeProducer()
+    client = build_producer(producer)
+
+    await client.send_batch(build_batch(2), "test", partition=None, no_confirm=True)
+
+    producer.deliver(0)
+    producer.deliver(1, KafkaError(KafkaError._MSG_TIMED_OUT))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    client.logger_state.log.assert_called_once()
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_send_empty_batch() -> None:
+    producer = FakeProducer()
+    client = build_producer(producer)
+
+    await client.send_batch(BatchBuilder(), "test", partition=None)
+
+    assert not producer.produced
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from faststream import AckPolicy
+from faststream.confluent import DeferredCommit
 from faststream.confluent.annotations import KafkaMessage
 from faststream.confluent.helpers.client import AsyncConfluentConsumer
 from faststream.exceptions import AckMessage
@@ -382,3 +383,102 @@ class TestConsume(ConfluentTestcaseConfig, BrokerRealConsumeTestcase):
         )
 
         assert mock.call_count == 2, mock.call_count
+
+    @pytest.mark.asyncio()
+    @pytest.mark.slow()
+    @pytest.mark.flaky(reruns=3, reruns_delay=1)
+    async def test_concurrent_consume_deferred_commit(self, queue: str) -> None:
+        event = asyncio.Event()
+
+        processed: list[int] = []
+
+        consume_broker = self.get_broker(apply_types=True)
+
+        args, kwargs = self.get_subscriber_params(
+            queue,
+            group_id="test",
+            max_workers=3,
+            ack_policy=AckPolicy.ACK,
+            deferred_commit=DeferredCommit(interval_ms=50),
+        )
+
+        @consume_broker.subscriber(*args, **kwargs)
+        async def handler(msg: int) -> None:
+            # the first message is the slowest one
+            if msg == 0:
+                await asyncio.sleep(0.5)
+
+            processed.append(msg)
+            if len(processed) == 3:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with patch.object(
+                AsyncConfluentConsumer,
+                "commit_offsets",
+                spy_decorator(AsyncConfluentConsumer.commit_offsets),
+            ) as m:
+                for i in range(3):
+                    await br.publish(i, queue)
+
+                await asyncio.wait(
+                    (asyncio.create_task(event.wait()),),
+                    timeout=self.timeout,
+                )
+                await asyncio.sleep(0.2)
+
+        assert event.is_set()
+        assert processed == [1, 2, 0]
+
+        # offsets are committed only after the first message processed
+        m.mock.assert_called_once()
+        assert [p.offset for p in m.mock.call_args.args[1]] == [3]
+
+    @pytest.mark.asyncio()
+    @pytest.mark.slow()
+    @pytest.mark.flaky(reruns=3, reruns_delay=1)
+    async def test_consume_deferred_commit(self, queue: str) -> None:
+        event = asyncio.Event()
+
+        processed: list[int] = []
+
+        consume_broker = self.get_broker(apply_types=True)
+
+        args, kwargs = self.get_subscriber_params(
+            queue,
+            group_id="test",
+            ack_policy=AckPolicy.ACK,
+            deferred_commit=DeferredCommit(max_messages=5, interval_ms=10_000),
+        )
+
+        @consume_broker.subscriber(*args, **kwargs)
+        async def handler(msg: int) -> None:
+            processed.append(msg)
+            if len(processed) == 5:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with patch.object(
+                AsyncConfluentConsumer,
+                "commit_offsets",
+                spy_decorator(AsyncConfluentConsumer.commit_offsets),
+            ) as m:
+                for i in range(5):
+                    await br.publish(i, queue)
+
+                await asyncio.wait(
+                    (asyncio.create_task(event.wait()),),
+                    timeout=self.timeout,
+                )
+                await asyncio.sleep(0.2)
+
+        assert event.is_set()
+        assert processed == [0, 1, 2, 3, 4]
+
+        # acknowledged messages are committed by a single call
+        m.mock.assert_called_once()
+        assert [p.offset for p in m.mock.call_args.args[1]] == [5]
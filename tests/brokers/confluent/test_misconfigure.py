@@ -1,9 +1,13 @@
 import pytest
 
 from faststream import AckPolicy
-from faststream.confluent import KafkaBroker, TopicPartition
+from faststream.confluent import DeferredCommit, KafkaBroker, TopicPartition
 from faststream.confluent.broker.router import KafkaRouter
-from faststream.confluent.subscriber.usecase import ConcurrentDefaultSubscriber
+from faststream.confluent.subscriber.usecase import (
+    ConcurrentDefaultSubscriber,
+    ConcurrentDeferredCommitSubscriber,
+    DeferredCommitSubscriber,
+)
 from faststream.exceptions import SetupError
 from faststream.nats import NatsRouter
 
@@ -31,6 +35,36 @@ def test_max_workers_with_ack_policy(queue: str) -> None:
         broker.subscriber(queue, max_workers=3, ack_policy=AckPolicy.REJECT_ON_ERROR)
 
 
+@pytest.mark.confluent()
+def test_deferred_commit(queue: str) -> None:
+    broker = KafkaBroker()
+
+    sub = broker.subscriber(
+        queue,
+        group_id="test",
+        max_workers=3,
+        ack_policy=AckPolicy.ACK,
+        deferred_commit=DeferredCommit(),
+    )
+    assert isinstance(sub, ConcurrentDeferredCommitSubscriber)
+
+    with pytest.raises(SetupError):
+        broker.subscriber(
+            queue,
+            max_workers=3,
+            ack_policy=AckPolicy.ACK_FIRST,
+            deferred_commit=DeferredCommit(),
+        )
+
+    sub = broker.subscriber(
+        queue,
+        group_id="test",
+        ack_policy=AckPolicy.ACK,
+        deferred_commit=DeferredCommit(),
+    )
+    assert isinstance(sub, DeferredCommitSubscriber)
+
+
 @pytest.mark.confluent()
 def test_deprecated_options(queue: str) -> None:
     broker = KafkaBroker()
@@ -9,7 +9,7 @@ from aiokafka.admin import AIOKafkaAdminClient, NewTopic
 
 from faststream import AckPolicy
 from faststream.exceptions import AckMessage
-from faststream.kafka import KafkaBroker, KafkaMessage, TopicPartition
+from faststream.kafka import DeferredCommit, KafkaBroker, KafkaMessage, TopicPartition
 from faststream.kafka.helpers.rebalance_listener import _LoggingListener
 from tests.brokers.base.consume import BrokerRealConsumeTestcase
 from tests.tools import spy_decorator
@@ -448,6 +448,43 @@ class TestConsume(KafkaTestcaseConfig, BrokerRealConsumeTestcase):
         assert event2.is_set()
         assert mock.call_count == 2, mock.call_count
 
+    @pytest.mark.asyncio()
+    @pytest.mark.slow()
+    async def test_concurrent_consume_ordered_by_key(self, queue: str) -> None:
+        event = asyncio.Event()
+
+        processed: list[tuple[bytes, int]] = []
+
+        consume_broker = self.get_broker(apply_types=True)
+
+        args, kwargs = self.get_subscriber_params(
+            queue,
+            max_workers=3,
+            ordering_key=lambda msg: msg.key,
+        )
+
+        @consume_broker.subscriber(*args, **kwargs)
+        async def handler(msg: int, message: KafkaMessage) -> None:
+            # first messages are the slowest ones
+            await asyncio.sleep(0.1 / (msg + 1))
+            processed.append((message.raw_message.key, msg))
+            if len(processed) == 9:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            for i in range(9):
+                await br.publish(i, queue, key=f"{i % 3}".encode())
+
+            await asyncio.wait((asyncio.create_task(event.wait()),), timeout=3)
+
+        assert event.is_set()
+        for key in (b"0", b"1", b"2"):
+            assert [msg for k, msg in processed if k == key] == sorted(
+                msg for k, msg in processed if k == key
+            )
+
     @pytest.mark.asyncio()
     @pytest.mark.slow()
     @pytest.mark.flaky(reruns=3, reruns_delay=1)
@@ -551,6 +588,158 @@ class TestConsume(KafkaTestcaseConfig, BrokerRealConsumeTestcase):
                 )
                 assert mock.mock.call_count == 2
 
+    @pytest.mark.asyncio()
+    @pytest.mark.slow()
+    @pytest.mark.flaky(reruns=3, reruns_delay=1)
+    async def test_concurrent_consume_single_consumer(self, queue: str) -> None:
+        await create_topic(queue, 2)
+
+        consume_broker = self.get_broker(apply_types=True)
+
+        event = asyncio.Event()
+        processed: list[tuple[int, str]] = []
+
+        @consume_broker.subscriber(
+            queue,
+            max_workers=2,
+            ack_policy=AckPolicy.ACK,
+            single_consumer=True,
+            deferred_commit=DeferredCommit(interval_ms=50),
+            group_id="service_1",
+            auto_offset_reset="earliest",
+        )
+        async def handler(msg: str, message: KafkaMessage) -> None:
+            # the first partition records are the slowest ones
+            if message.raw_message.partition == 0:
+                await asyncio.sleep(0.3)
+
+            processed.append((message.raw_message.partition, msg))
+            if len(processed) == 4:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as broker:
+            await broker.start()
+
+            with patch.object(
+                AIOKafkaConsumer,
+                "commit",
+                spy_decorator(AIOKafkaConsumer.commit),
+            ) as mock:
+                for i in range(2):
+                    await broker.publish(f"p0-{i}", queue, partition=0)
+                    await broker.publish(f"p1-{i}", queue, partition=1)
+
+                await asyncio.wait((asyncio.create_task(event.wait()),), timeout=10)
+                await asyncio.sleep(0.5)
+
+        assert event.is_set()
+
+        # partitions are processed concurrently, records of a partition - in order
+        assert processed[:2] == [(1, "p1-0"), (1, "p1-1")]
+        assert processed[2:] == [(0, "p0-0"), (0, "p0-1")]
+
+        # processed offsets are committed by a few calls instead of per record ones
+        committed: dict[TopicPartition, int] = {}
+        for call in mock.mock.call_args_list:
+            committed.update(call.args[1])
+
+        assert mock.mock.call_count < 4
+        assert committed == {
+            TopicPartition(queue, 0): 2,
+            TopicPartition(queue, 1): 2,
+        }
+
+    @pytest.mark.asyncio()
+    @pytest.mark.slow()
+    @pytest.mark.flaky(reruns=3, reruns_delay=1)
+    async def test_concurrent_consume_deferred_commit(self, queue: str) -> None:
+        event = asyncio.Event()
+
+        processed: list[int] = []
+
+        consume_broker = self.get_broker(apply_types=True)
+
+        @consume_broker.subscriber(
+            queue,
+            group_id="service_1",
+            max_workers=3,
+            ack_policy=AckPolicy.ACK,
+            deferred_commit=DeferredCommit(interval_ms=50),
+            auto_offset_reset="earliest",
+        )
+        async def handler(msg: int) -> None:
+            # the first message is the slowest one
+            if msg == 0:
+                await asyncio.sleep(0.5)
+
+            processed.append(msg)
+            if len(processed) == 3:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with patch.object(
+                AIOKafkaConsumer,
+                "commit",
+                spy_decorator(AIOKafkaConsumer.commit),
+            ) as mock:
+                for i in range(3):
+                    await br.publish(i, queue)
+
+                await asyncio.wait((asyncio.create_task(event.wait()),), timeout=10)
+                await asyncio.sleep(0.2)
+
+        assert event.is_set()
+        assert processed == [1, 2, 0]
+
+        # offsets are committed only after the first message processed
+        mock.mock.assert_called_once()
+        assert mock.mock.call_args.args[1] == {TopicPartition(queue, 0): 3}
+
+    @pytest.mark.asyncio()
+    @pytest.mark.slow()
+    @pytest.mark.flaky(reruns=3, reruns_delay=1)
+    async def test_consume_deferred_commit(self, queue: str) -> None:
+        event = asyncio.Event()
+
+        processed: list[int] = []
+
+        consume_broker = self.get_broker(apply_types=True)
+
+        @consume_broker.subscriber(
+            queue,
+            group_id="service_1",
+            ack_policy=AckPolicy.ACK,
+            deferred_commit=DeferredCommit(max_messages=5, interval_ms=10_000),
+            auto_offset_reset="earliest",
+        )
+        async def handler(msg: int) -> None:
+            processed.append(msg)
+            if len(processed) == 5:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with patch.object(
+                AIOKafkaConsumer,
+                "commit",
+                spy_decorator(AIOKafkaConsumer.commit),
+            ) as mock:
+                for i in range(5):
+                    await br.publish(i, queue)
+
+                await asyncio.wait((asyncio.create_task(event.wait()),), timeout=10)
+                await asyncio.sleep(0.2)
+
+        assert event.is_set()
+        assert processed == [0, 1, 2, 3, 4]
+
+        # acknowledged messages are committed by a single call
+        mock.mock.assert_called_once()
+        assert mock.mock.call_args.args[1] == {TopicPartition(queue, 0): 5}
+
 
 @pytest.mark.asyncio()
 @pytest.mark.slow()
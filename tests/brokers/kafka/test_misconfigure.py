@@ -4,10 +4,13 @@ import pytest
 
 from faststream import AckPolicy
 from faststream.exceptions import SetupError
-from faststream.kafka import KafkaBroker, KafkaRouter, TopicPartition
+from faststream.kafka import DeferredCommit, KafkaBroker, KafkaRouter, TopicPartition
 from faststream.kafka.subscriber.usecase import (
     ConcurrentBetweenPartitionsSubscriber,
     ConcurrentDefaultSubscriber,
+    ConcurrentDeferredCommitSubscriber,
+    ConcurrentPartitionsSubscriber,
+    DeferredCommitSubscriber,
 )
 from faststream.nats import NatsRouter
 from faststream.rabbit import RabbitRouter
@@ -108,6 +111,21 @@ def test_max_workers_configuration(queue: str) -> None:
     sub = broker.subscriber(queue, max_workers=3, ack_policy=AckPolicy.REJECT_ON_ERROR)
     assert isinstance(sub, ConcurrentBetweenPartitionsSubscriber)
 
+    sub = broker.subscriber(
+        "queue1",
+        "queue2",
+        max_workers=3,
+        ack_policy=AckPolicy.ACK,
+        single_consumer=True,
+    )
+    assert isinstance(sub, ConcurrentPartitionsSubscriber)
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, max_workers=3, single_consumer=True)
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, ack_policy=AckPolicy.ACK, single_consumer=True)
+
     with pytest.raises(SetupError), pytest.warns(DeprecationWarning):
         broker.subscriber(
             partitions=[TopicPartition(topic="topic", partition=1)],
@@ -116,6 +134,36 @@ def test_max_workers_configuration(queue: str) -> None:
         )
 
 
+@pytest.mark.kafka()
+def test_deferred_commit_configuration(queue: str) -> None:
+    broker = KafkaBroker()
+
+    sub = broker.subscriber(
+        "queue1",
+        "queue2",
+        max_workers=3,
+        ack_policy=AckPolicy.ACK,
+        deferred_commit=DeferredCommit(),
+    )
+    assert isinstance(sub, ConcurrentDeferredCommitSubscriber)
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, max_workers=3, deferred_commit=DeferredCommit())
+
+    sub = broker.subscriber(
+        queue,
+        ack_policy=AckPolicy.ACK,
+        deferred_commit=DeferredCommit(),
+    )
+    assert isinstance(sub, DeferredCommitSubscriber)
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, deferred_commit=DeferredCommit())
+
+    with pytest.raises(SetupError):
+        DeferredCommit(max_messages=0)
+
+
 @pytest.mark.kafka()
 def test_use_only_kafka_router() -> None:
     broker = KafkaBroker()
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from nats.aio.msg import Msg
 
-from faststream import AckPolicy
+from faststream import AckPolicy, MicroBatch
 from faststream.exceptions import AckMessage
 from faststream.nats import ConsumerConfig, JStream, PubAck, PullSub
 from faststream.nats.annotations import NatsMessage
@@ -59,6 +59,39 @@ class TestConsume(NatsTestcaseConfig, BrokerRealConsumeTestcase):
         assert event2.is_set()
         assert mock.call_count == 2, mock.call_count
 
+    async def test_core_micro_batch(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        event = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(
+            queue,
+            micro_batch=MicroBatch(max_size=3, max_latency=3.0),
+        )
+
+        @consume_broker.subscriber(*args, **kwargs)
+        def subscriber(m) -> None:
+            mock(m)
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            for i in range(3):
+                await br.publish(i, queue)
+
+            await asyncio.wait(
+                (asyncio.create_task(event.wait()),),
+                timeout=3,
+            )
+
+        assert event.is_set()
+        mock.assert_called_once_with([0, 1, 2])
+
     async def test_consume_js(
         self,
         queue: str,
@@ -150,6 +183,36 @@ class TestConsume(NatsTestcaseConfig, BrokerRealConsumeTestcase):
             assert event.is_set()
             mock.assert_called_once_with("hello")
 
+    async def test_consume_adaptive_pull(
+        self,
+        queue: str,
+        stream: JStream,
+    ) -> None:
+        consume_broker = self.get_broker()
+
+        received: list[int] = []
+        done = asyncio.Event()
+
+        @consume_broker.subscriber(
+            queue,
+            stream=stream,
+            pull_sub=PullSub(1, max_batch_size=10, heartbeat=1.0),
+        )
+        async def subscriber(m: int) -> None:
+            received.append(m)
+            if len(received) == 20:
+                done.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            for i in range(20):
+                await br.publish(i, queue, stream=stream.name)
+
+            await asyncio.wait_for(done.wait(), timeout=3)
+
+        assert sorted(received) == list(range(20))
+
     async def test_consume_batch(
         self,
         queue: str,
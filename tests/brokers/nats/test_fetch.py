@@ -0,0 +1,149 @@
+import asyncio
+from contextlib import suppress
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from faststream.exceptions import SetupError
+from faststream.nats import JStream, NatsBroker, PullSub
+from faststream.nats.subscriber.fetch import AdaptiveBatchSize
+
+
+def make_messages(count: int, size: int = 10) -> list[Any]:
+    return [MagicMock(data=b"x" * size) for _ in range(count)]
+
+
+@pytest.mark.nats()
+def test_grows_by_fast_full_batches() -> None:
+    batch_size = AdaptiveBatchSize(2, max_size=5, target_latency=1.0)
+
+    batch_size.update(make_messages(2), requested=2, latency=0.1)
+    assert batch_size.size == 3
+
+    batch_size.update(make_messages(3), requested=3, latency=0.1)
+    assert batch_size.size == 4
+
+    batch_size.update(make_messages(4), requested=4, latency=0.1)
+    assert batch_size.size == 5
+
+
+@pytest.mark.nats()
+def test_keeps_size_by_not_full_batches() -> None:
+    batch_size = AdaptiveBatchSize(4, max_size=10, target_latency=1.0)
+
+    batch_size.update(make_messages(2), requested=4, latency=0.1)
+    assert batch_size.size == 4
+
+
+@pytest.mark.nats()
+def test_shrinks_by_slow_batches() -> None:
+    batch_size = AdaptiveBatchSize(8, max_size=10, target_latency=1.0)
+
+    batch_size.update(make_messages(8), requested=8, latency=2.0)
+    assert batch_size.size == 4
+
+    for _ in range(5):
+        batch_size.update(make_messages(1), requested=1, latency=2.0)
+    assert batch_size.size == 1
+
+
+@pytest.mark.nats()
+def test_next_batch_by_in_flight() -> None:
+    batch_size = AdaptiveBatchSize(4, max_size=4, target_latency=1.0)
+
+    assert batch_size.next_batch() == 4
+    assert batch_size.next_batch(4) == 4
+    assert batch_size.next_batch(6) == 2
+    assert batch_size.next_batch(8) == 0
+
+
+@pytest.mark.nats()
+def test_next_batch_by_max_bytes() -> None:
+    batch_size = AdaptiveBatchSize(10, max_size=10, target_latency=1.0, max_bytes=50)
+
+    batch_size.update(make_messages(10, size=20), requested=20, latency=0.1)
+
+    assert batch_size.next_batch() == 2
+
+
+@pytest.mark.nats()
+def test_not_adaptive_pull_sub() -> None:
+    batch_size = AdaptiveBatchSize.from_pull_sub(PullSub(5, max_bytes=1))
+
+    batch_size.update(make_messages(5, size=100), requested=5, latency=2.0)
+
+    assert batch_size.next_batch() == 5
+
+
+@pytest.mark.nats()
+@pytest.mark.parametrize(
+    "options",
+    (
+        pytest.param({"batch_size": 10, "max_batch_size": 5}, id="max_batch_size"),
+        pytest.param({"target_latency": 0}, id="target_latency"),
+        pytest.param({"max_bytes": 0}, id="max_bytes"),
+    ),
+)
+def test_pull_sub_validation(options: dict[str, Any]) -> None:
+    with pytest.raises(SetupError):
+        PullSub(**options)
+
+
+class FakeSubscription:
+    def __init__(self) -> None:
+        self.fetched = 0
+        self.fetches = asyncio.Queue()
+
+    async def fetch(self, batch: int, **kwargs: Any) -> list[Any]:
+        await self.fetches.put(batch)
+        messages = make_messages(batch)
+        for i, m in enumerate(messages, start=self.fetched):
+            m.number = i
+        self.fetched += batch
+        return messages
+
+
+@pytest.mark.asyncio()
+@pytest.mark.nats()
+async def test_adaptive_pull_fetches_while_processing() -> None:
+    broker = NatsBroker()
+    subscriber = broker.subscriber(
+        "test",
+        stream=JStream("test"),
+        pull_sub=PullSub(2, max_batch_size=2),
+    )
+
+    subscription = FakeSubscription()
+    subscriber.subscription = subscription
+    subscriber.running = True
+
+    release = asyncio.Event()
+    processed: list[int] = []
+
+    async def cb(msg: Any) -> None:
+        if msg.number in {0, 2}:
+            # slow messages don't block the next batch fetching
+            await release.wait()
+        processed.append(msg.number)
+
+    task = asyncio.create_task(subscriber._consume_pull(cb))
+
+    try:
+        assert await asyncio.wait_for(subscription.fetches.get(), 1) == 2
+        assert await asyncio.wait_for(subscription.fetches.get(), 1) == 2
+
+        # two batches are in flight already
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(subscription.fetches.get(), 0.1)
+        assert processed == [1, 3]
+
+        release.set()
+        assert await asyncio.wait_for(subscription.fetches.get(), 1) == 2
+        assert {0, 2} <= set(processed)
+
+    finally:
+        subscriber.running = False
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
@@ -0,0 +1,78 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.exceptions import IncorrectState
+from faststream.nats.publisher.producer import ReplyInbox
+
+
+def make_client() -> MagicMock:
+    nc = MagicMock()
+    nc.new_inbox.return_value = "_INBOX.test"
+    nc.subscribe = AsyncMock()
+    return nc
+
+
+def make_message(subject: str) -> MagicMock:
+    msg = MagicMock()
+    msg.subject = subject
+    return msg
+
+
+@pytest.mark.asyncio()
+@pytest.mark.nats()
+async def test_responses_are_routed_by_token() -> None:
+    nc = make_client()
+    inbox = ReplyInbox()
+
+    (first_subject, first), (second_subject, second) = await asyncio.gather(
+        inbox.register(nc),
+        inbox.register(nc),
+    )
+
+    # single wildcard subscription for all requests
+    nc.subscribe.assert_awaited_once()
+    assert nc.subscribe.call_args.args == ("_INBOX.test.*",)
+    assert first_subject.startswith("_INBOX.test.")
+    assert first_subject != second_subject
+
+    callback = nc.subscribe.call_args.kwargs["cb"]
+
+    second_msg, first_msg = make_message(second_subject), make_message(first_subject)
+    await callback(second_msg)
+    await callback(first_msg)
+
+    assert await first is first_msg
+    assert await second is second_msg
+
+
+@pytest.mark.asyncio()
+@pytest.mark.nats()
+async def test_late_response_is_dropped() -> None:
+    nc = make_client()
+    inbox = ReplyInbox()
+
+    subject, response = await inbox.register(nc)
+    inbox.discard(subject)
+
+    await nc.subscribe.call_args.kwargs["cb"](make_message(subject))
+
+    assert not response.done()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.nats()
+async def test_close_fails_waiting_requests() -> None:
+    nc = make_client()
+    inbox = ReplyInbox()
+
+    _, response = await inbox.register(nc)
+    inbox.close()
+
+    with pytest.raises(IncorrectState):
+        await asyncio.wait_for(response, timeout=1)
+
+    # the next connection subscribes again
+    await inbox.register(nc)
+    assert nc.subscribe.await_count == 2
@@ -0,0 +1,124 @@
+import asyncio
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from nats.errors import TimeoutError as NatsTimeoutError
+
+from faststream.nats import JStream, NatsBroker
+from faststream.nats.publisher.producer import (
+    NatsJSFastProducer,
+    PendingAcks,
+    PublishStats,
+)
+from faststream.nats.response import NatsPublishCommand
+from faststream.response.publish_type import PublishType
+
+
+@pytest.mark.asyncio()
+@pytest.mark.nats()
+async def test_pending_limit() -> None:
+    pending = PendingAcks(2)
+    acks = [asyncio.Event() for _ in range(3)]
+
+    async def publish(i: int) -> int:
+        await acks[i].wait()
+        return i
+
+    futures = []
+    for i in range(2):
+        await pending.acquire()
+        futures.append(pending.publish("subject", publish(i)))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(pending.acquire(), timeout=0.01)
+
+    acks[0].set()
+    await asyncio.wait_for(pending.acquire(), timeout=1)
+    futures.append(pending.publish("subject", publish(2)))
+
+    assert pending.stats["subject"] == PublishStats(pending=2, acked=1)
+
+    acks[1].set()
+    acks[2].set()
+    await pending.flush()
+
+    assert [f.result() for f in futures] == [0, 1, 2]
+    assert pending.stats["subject"] == PublishStats(acked=3)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.nats()
+async def test_pending_errors_by_futures() -> None:
+    pending = PendingAcks(1)
+
+    async def publish() -> None:
+        raise NatsTimeoutError
+
+    await pending.acquire()
+    future = pending.publish("subject", publish())
+
+    await pending.flush()
+
+    with pytest.raises(NatsTimeoutError):
+        future.result()
+
+    assert pending.stats == {"subject": PublishStats(failed=1)}
+
+    # the slot is released after the failure
+    await asyncio.wait_for(pending.acquire(), timeout=1)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.nats()
+async def test_publish_batch_pending_limit() -> None:
+    in_flight = max_in_flight = 0
+
+    class FakeJetStream:
+        async def publish(self, payload: bytes, **kwargs: Any) -> bytes:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return payload
+
+    producer = NatsJSFastProducer(parser=None, decoder=None, max_pending=3)
+    producer.connect(FakeJetStream(), serializer=None)  # type: ignore[arg-type]
+
+    acks = await producer.publish_batch(
+        NatsPublishCommand(
+            *range(20),
+            subject="subject",
+            stream="stream",
+            _publish_type=PublishType.PUBLISH,
+        ),
+    )
+
+    assert acks == [str(i).encode() for i in range(20)]
+    assert max_in_flight == 3
+    assert producer.publish_stats["subject"] == PublishStats(acked=20)
+
+
+@pytest.mark.connected()
+@pytest.mark.asyncio()
+@pytest.mark.nats()
+async def test_publish_no_confirm() -> None:
+    subject = uuid4().hex
+    stream = JStream(subject)
+    broker = NatsBroker(js_max_pending=10)
+
+    @broker.subscriber(subject, stream=stream)
+    async def handler(m: int) -> None: ...
+
+    async with broker:
+        await broker.start()
+
+        futures = [
+            await broker.publish(i, subject, stream=stream.name, no_confirm=True)
+            for i in range(100)
+        ]
+        await broker.flush()
+
+        assert [f.result().seq for f in futures] == list(range(1, 101))
+        assert broker.publish_stats[subject] == PublishStats(acked=100)
@@ -1,7 +1,8 @@
 import pytest
 
+from faststream import MicroBatch
 from faststream.exceptions import SetupError
-from faststream.nats import NatsRouter
+from faststream.nats import JStream, NatsRouter
 from faststream.nats.broker.broker import NatsBroker
 from faststream.rabbit import RabbitRouter
 
@@ -18,3 +19,25 @@ def test_use_only_nats_router() -> None:
 
     with pytest.raises(SetupError):
         broker.include_routers(routers)
+
+
+@pytest.mark.nats()
+def test_micro_batch_only_core() -> None:
+    broker = NatsBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber("test", stream=JStream("test"), micro_batch=MicroBatch())
+
+
+@pytest.mark.nats()
+def test_ordering_key_requires_workers() -> None:
+    broker = NatsBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber("test", ordering_key=lambda msg: msg.subject)
+
+
+@pytest.mark.nats()
+def test_js_max_pending_validation() -> None:
+    with pytest.raises(SetupError):
+        NatsBroker(js_max_pending=0)
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from faststream import Context
-from faststream.nats import NatsResponse
+from faststream.nats import JStream, NatsResponse
 from tests.brokers.base.publish import BrokerPublishTestcase
 
 from .basic import NatsTestcaseConfig
@@ -75,3 +75,61 @@ class TestPublish(NatsTestcaseConfig, BrokerPublishTestcase):
             )
 
             assert await response.decode() == "Hi!", response
+
+    @pytest.mark.asyncio()
+    async def test_publish_batch(
+        self,
+        queue: str,
+    ) -> None:
+        pub_broker = self.get_broker()
+
+        msgs_queue = asyncio.Queue(maxsize=2)
+
+        @pub_broker.subscriber(queue)
+        async def handler(msg) -> None:
+            await msgs_queue.put(msg)
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            await br.publish_batch(1, "hi", subject=queue)
+
+            result, _ = await asyncio.wait(
+                (
+                    asyncio.create_task(msgs_queue.get()),
+                    asyncio.create_task(msgs_queue.get()),
+                ),
+                timeout=3,
+            )
+
+        assert {1, "hi"} == {r.result() for r in result}
+
+    @pytest.mark.asyncio()
+    async def test_js_publish_batch(
+        self,
+        queue: str,
+        stream: JStream,
+    ) -> None:
+        pub_broker = self.get_broker()
+
+        msgs_queue = asyncio.Queue(maxsize=2)
+
+        @pub_broker.subscriber(queue, stream=stream)
+        async def handler(msg) -> None:
+            await msgs_queue.put(msg)
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            acks = await br.publish_batch(1, "hi", subject=queue, stream=stream.name)
+            assert [ack.stream for ack in acks] == [stream.name, stream.name]
+
+            result, _ = await asyncio.wait(
+                (
+                    asyncio.create_task(msgs_queue.get()),
+                    asyncio.create_task(msgs_queue.get()),
+                ),
+                timeout=3,
+            )
+
+        assert {1, "hi"} == {r.result() for r in result}
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from faststream import BaseMiddleware
@@ -73,7 +75,32 @@ class NatsRequestsTestcase(RequestsTestcase):
 @pytest.mark.connected()
 @pytest.mark.nats()
 class TestRealRequests(NatsTestcaseConfig, NatsRequestsTestcase):
-    pass
+    async def test_concurrent_stream_requests(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        stream_name = f"{queue}st"
+
+        @broker.subscriber(queue, stream=stream_name)
+        async def handler(msg: int) -> int:
+            await asyncio.sleep(0.01 * (10 - msg))
+            return msg * 2
+
+        async with self.patch_broker(broker):
+            await broker.start()
+
+            responses = await asyncio.gather(
+                *(
+                    broker.request(i, queue, stream=stream_name, timeout=3)
+                    for i in range(10)
+                ),
+            )
+
+            assert [await r.decode() for r in responses] == [i * 2 for i in range(10)]
+
+            # all requests share a single inbox subscription
+            inbox = broker.config.js_producer._inbox
+            assert inbox._sub is not None
+            assert not inbox._responses
 
 
 @pytest.mark.nats()
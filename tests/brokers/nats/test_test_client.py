@@ -2,13 +2,13 @@ import asyncio
 
 import pytest
 
-from faststream import BaseMiddleware
+from faststream import BaseMiddleware, MicroBatch
 from faststream.nats import (
     ConsumerConfig,
     JStream,
     PullSub,
 )
-from faststream.nats.testing import FakeProducer
+from faststream.nats.testing import FakeProducer, build_message
 from tests.brokers.base.testclient import BrokerTestclientTestcase
 
 from .basic import NatsMemoryTestcaseConfig
@@ -127,6 +127,41 @@ class TestTestclient(NatsMemoryTestcaseConfig, BrokerTestclientTestcase):
 
         assert len(routes) == 2
 
+    async def test_publish_batch(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        async def m(msg) -> None: ...
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch(1, "hi", subject=queue)
+
+            assert m.mock.call_count == 2
+            m.mock.assert_any_call(1)
+            m.mock.assert_any_call("hi")
+
+    async def test_js_publish_batch_to_pull_batch(
+        self,
+        queue: str,
+        stream: JStream,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(
+            queue,
+            stream=stream,
+            pull_sub=PullSub(batch=True),
+        )
+        async def m(msg) -> None: ...
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch(1, "hi", subject=queue, stream=stream.name)
+
+            m.mock.assert_called_once_with([1, "hi"])
+
     async def test_js_subscriber_mock(
         self,
         queue: str,
@@ -223,6 +258,55 @@ class TestTestclient(NatsMemoryTestcaseConfig, BrokerTestclientTestcase):
             await br.publish("hello", queue)
             subscriber.mock.assert_called_once_with(["hello"])
 
+    async def test_micro_batch(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, micro_batch=MicroBatch())
+        def subscriber(m) -> None:
+            pass
+
+        async with self.patch_broker(broker) as br:
+            await br.publish("hello", queue)
+            subscriber.mock.assert_called_once_with(["hello"])
+
+    async def test_ordering_key(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        processed = []
+
+        subscriber = broker.subscriber(
+            f"{queue}.*",
+            max_workers=2,
+            # int hash is the value itself, so subjects use different lanes
+            ordering_key=lambda msg: int(msg.subject.rsplit(".", 1)[-1]),
+        )
+
+        @subscriber
+        async def handler(msg: int) -> None:
+            if msg == 0:
+                await asyncio.sleep(0.1)
+            processed.append(msg)
+
+        async with self.patch_broker(broker):
+            subscriber.start_consume_task()
+
+            # 0 and 2 messages are sent to the same subject
+            for i in range(4):
+                subject = f"{queue}.{i % 2}"
+                await subscriber._put_msg(build_message(i, subject))
+
+            await asyncio.sleep(0.3)
+            await subscriber.stop()
+
+        assert [i for i in processed if i % 2 == 0] == [0, 2]
+        assert processed.index(3) < processed.index(0)
+
     async def test_consume_with_filter(
         self,
         queue,
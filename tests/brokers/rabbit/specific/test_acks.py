@@ -0,0 +1,103 @@
+import pytest
+
+from faststream.exceptions import SetupError
+from faststream.rabbit import DeferredAck
+from faststream.rabbit.subscriber.acks import DeliveryTagsTracker
+
+
+@pytest.mark.rabbit()
+def test_ack_highest_contiguous_tag() -> None:
+    tracker = DeliveryTagsTracker[str]()
+    for tag in range(1, 5):
+        tracker.add("channel", tag)
+
+    assert tracker.ack("channel", 2)
+    assert tracker.ack("channel", 4)
+    assert tracker.ackable() == {}
+
+    assert tracker.ack("channel", 1)
+    assert tracker.ackable() == {"channel": 2}
+
+    assert tracker.ack("channel", 3)
+    assert tracker.ackable() == {"channel": 4}
+    assert tracker.ackable() == {}
+
+
+@pytest.mark.rabbit()
+def test_settled_tag_is_skipped() -> None:
+    tracker = DeliveryTagsTracker[str]()
+    for tag in range(1, 4):
+        tracker.add("channel", tag)
+
+    tracker.ack("channel", 1)
+    tracker.settle("channel", 2)
+    tracker.ack("channel", 3)
+
+    # rejected tag is not acknowledged by the multiple ack
+    assert tracker.ackable() == {"channel": 3}
+
+
+@pytest.mark.rabbit()
+def test_settled_tail_is_not_acked() -> None:
+    tracker = DeliveryTagsTracker[str]()
+    for tag in range(1, 3):
+        tracker.add("channel", tag)
+
+    tracker.ack("channel", 1)
+    tracker.settle("channel", 2)
+
+    assert tracker.ackable() == {"channel": 1}
+    assert tracker.ackable() == {}
+
+
+@pytest.mark.rabbit()
+def test_settle_multiple() -> None:
+    tracker = DeliveryTagsTracker[str]()
+    for tag in range(1, 5):
+        tracker.add("channel", tag)
+
+    tracker.ack("channel", 1)
+    tracker.settle("channel", 2, multiple=True)
+    tracker.ack("channel", 4)
+
+    assert tracker.ackable() == {}
+
+    tracker.ack("channel", 3)
+    assert tracker.ackable() == {"channel": 4}
+
+
+@pytest.mark.rabbit()
+def test_channels_are_tracked_separately() -> None:
+    tracker = DeliveryTagsTracker[str]()
+    tracker.add("first", 1)
+    tracker.add("second", 1)
+    tracker.add("second", 2)
+
+    tracker.ack("first", 1)
+    tracker.ack("second", 2)
+    assert tracker.ackable() == {"first": 1}
+
+    tracker.remove("second")
+    assert not tracker.ack("second", 1)
+
+
+@pytest.mark.rabbit()
+def test_untracked_tag() -> None:
+    tracker = DeliveryTagsTracker[str]()
+    assert not tracker.ack("channel", 1)
+
+    tracker.add("channel", 2)
+    assert not tracker.ack("channel", 1)
+
+
+@pytest.mark.rabbit()
+@pytest.mark.parametrize(
+    "options",
+    (
+        pytest.param({"max_messages": 0}, id="max_messages"),
+        pytest.param({"interval_ms": 0}, id="interval_ms"),
+    ),
+)
+def test_deferred_ack_validation(options: dict[str, int]) -> None:
+    with pytest.raises(SetupError):
+        DeferredAck(**options)
@@ -1,8 +1,29 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 
-from faststream.rabbit import Channel, RabbitBroker
+from faststream.exceptions import SetupError
+from faststream.rabbit import Channel, RabbitBroker, RabbitExchange, RabbitQueue
+from faststream.rabbit.helpers.channel_manager import ChannelManagerImpl
+from faststream.rabbit.helpers.declarer import RabbitDeclarerImpl
+from faststream.rabbit.publisher.producer import AioPikaFastProducerImpl
+
+
+def _make_channel(**kwargs: Any) -> MagicMock:
+    channel = MagicMock(is_closed=False, close=AsyncMock())
+    channel.declare_queue = AsyncMock(
+        side_effect=lambda **kwargs: MagicMock(channel=channel),
+    )
+    return channel
+
+
+def _make_connection() -> MagicMock:
+    connection = MagicMock(is_closed=False)
+    connection.channel = AsyncMock(side_effect=_make_channel)
+    return connection
 
 
 @pytest.mark.connected()
@@ -29,3 +50,156 @@ async def test_subscriber_use_shared_channel() -> None:
 
         assert sub3._queue_obj.channel is not default_channel
         assert sub3._queue_obj.channel is sub4._queue_obj.channel
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_channels_pool_round_robin() -> None:
+    connection = _make_connection()
+
+    manager = ChannelManagerImpl(Channel(pool_size=3))
+    manager.connect(connection)
+
+    channels = [await manager.get_channel() for _ in range(6)]
+
+    assert connection.channel.await_count == 3
+    assert len({id(ch) for ch in channels[:3]}) == 3
+    assert channels[:3] == channels[3:]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_channels_pool_rebuild_closed() -> None:
+    connection = _make_connection()
+
+    manager = ChannelManagerImpl(Channel(pool_size=2))
+    manager.connect(connection)
+
+    first, second = await manager.get_channel(), await manager.get_channel()
+    first.is_closed = True
+
+    rebuilt = await manager.get_channel()
+
+    assert rebuilt is not first
+    first.close.assert_awaited_once()
+    assert await manager.get_channel() is second
+    assert await manager.get_channel() is rebuilt
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_channels_pool_rebuild_resets_declarations() -> None:
+    connection = _make_connection()
+
+    manager = ChannelManagerImpl(Channel(pool_size=2))
+    declarer = RabbitDeclarerImpl(manager)
+    manager.on_rebuild(declarer.forget_channel)
+    manager.connect(connection)
+
+    queue = await declarer.declare_queue(RabbitQueue("test"))
+    assert await declarer.declare_queue(RabbitQueue("test")) is queue
+
+    queue.channel.is_closed = True
+    await manager.get_channel()
+    await manager.get_channel()  # rebuild the closed channel
+
+    new_queue = await declarer.declare_queue(RabbitQueue("test"))
+    assert new_queue is not queue
+    assert not new_queue.channel.is_closed
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_publish_by_specified_channel() -> None:
+    declared = MagicMock()
+    declarer = MagicMock(declare_exchange=AsyncMock(return_value=declared))
+
+    producer = AioPikaFastProducerImpl(declarer=declarer, parser=None, decoder=None)
+
+    channel = MagicMock()
+    channel.default_exchange.publish = AsyncMock()
+
+    await producer._publish(
+        "hello",
+        exchange=RabbitExchange(),
+        routing_key="test",
+        channel=channel,
+    )
+
+    channel.default_exchange.publish.assert_awaited_once()
+    declared.publish.assert_not_called()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_channels_pool_wait_connection_restore() -> None:
+    connection = _make_connection()
+
+    manager = ChannelManagerImpl()
+    manager.connect(connection)
+
+    channel = await manager.get_channel()
+    channel.is_closed = connection.is_closed = True
+
+    # robust connection restores the channel itself
+    assert await manager.get_channel() is channel
+    assert connection.channel.await_count == 1
+
+
+@pytest.mark.rabbit()
+@pytest.mark.parametrize(
+    "options",
+    (
+        pytest.param({"pool_size": 0}, id="pool_size"),
+        pytest.param({"pool_size": 2, "channel_number": 1}, id="channel_number"),
+    ),
+)
+def test_channels_pool_validation(options: dict[str, int]) -> None:
+    with pytest.raises(SetupError):
+        Channel(**options)
+
+
+@pytest.mark.connected()
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_publish_by_channels_pool() -> None:
+    queue = uuid4().hex
+    broker = RabbitBroker(logger=None, default_channel=Channel(pool_size=4))
+
+    received: list[int] = []
+    done = asyncio.Event()
+
+    @broker.subscriber(queue)
+    async def handler(m: int) -> None:
+        received.append(m)
+        if len(received) == 20:
+            done.set()
+
+    async with broker:
+        await broker.start()
+
+        await asyncio.gather(*(broker.publish(i, queue) for i in range(20)))
+        await asyncio.wait_for(done.wait(), timeout=3)
+
+    assert sorted(received) == list(range(20))
+
+
+@pytest.mark.connected()
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_request_by_channels_pool() -> None:
+    queue = uuid4().hex
+    broker = RabbitBroker(logger=None, default_channel=Channel(pool_size=4))
+
+    @broker.subscriber(queue)
+    async def handler(m: int) -> int:
+        return m * 2
+
+    async with broker:
+        await broker.start()
+
+        responses = await asyncio.gather(
+            *(broker.request(i, queue, timeout=3) for i in range(10)),
+        )
+
+    assert [await r.decode() for r in responses] == [i * 2 for i in range(10)]
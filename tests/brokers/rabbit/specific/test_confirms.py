@@ -0,0 +1,140 @@
+import asyncio
+import gc
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from aio_pika.exceptions import DeliveryError, PublishError
+
+from faststream.exceptions import SetupError
+from faststream.rabbit import Channel, RabbitBroker
+from faststream.rabbit.publisher.producer import ConfirmationWindow
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_window_limits_unconfirmed() -> None:
+    window = ConfirmationWindow(2)
+    confirms = [asyncio.Event() for _ in range(3)]
+
+    async def publish(i: int) -> int:
+        await confirms[i].wait()
+        return i
+
+    futures = []
+    for i in range(2):
+        await window.acquire()
+        futures.append(window.publish(publish(i)))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(window.acquire(), timeout=0.01)
+
+    confirms[0].set()
+    await asyncio.wait_for(window.acquire(), timeout=1)
+    futures.append(window.publish(publish(2)))
+
+    confirms[1].set()
+    confirms[2].set()
+    await window.flush()
+
+    assert [f.result() for f in futures] == [0, 1, 2]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_window_reports_errors_by_futures() -> None:
+    window = ConfirmationWindow(1)
+
+    async def publish() -> None:
+        raise DeliveryError(None, None)
+
+    await window.acquire()
+    future = window.publish(publish())
+
+    await window.flush()
+
+    with pytest.raises(DeliveryError):
+        future.result()
+
+    # the slot is released after the failure
+    await asyncio.wait_for(window.acquire(), timeout=1)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_window_ignored_error_is_not_logged() -> None:
+    window = ConfirmationWindow(1)
+
+    loop = asyncio.get_running_loop()
+    errors: list[dict[str, Any]] = []
+    loop.set_exception_handler(lambda _, context: errors.append(context))
+
+    async def publish() -> None:
+        raise DeliveryError(None, None)
+
+    try:
+        await window.acquire()
+        window.publish(publish())
+        await window.flush()
+
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert not errors
+
+
+@pytest.mark.rabbit()
+def test_max_unconfirmed_validation() -> None:
+    with pytest.raises(SetupError):
+        Channel(max_unconfirmed=0)
+
+
+@pytest.mark.connected()
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_publish_no_confirm() -> None:
+    queue = uuid4().hex
+    broker = RabbitBroker(logger=None, default_channel=Channel(max_unconfirmed=10))
+
+    received: list[int] = []
+    done = asyncio.Event()
+
+    @broker.subscriber(queue)
+    async def handler(m: int) -> None:
+        received.append(m)
+        if len(received) == 100:
+            done.set()
+
+    async with broker:
+        await broker.start()
+
+        futures = [await broker.publish(i, queue, no_confirm=True) for i in range(100)]
+        await broker.flush()
+
+        assert all(f.done() and f.exception() is None for f in futures)
+
+        await asyncio.wait_for(done.wait(), timeout=3)
+
+    assert sorted(received) == list(range(100))
+
+
+@pytest.mark.connected()
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_publish_no_confirm_returned() -> None:
+    broker = RabbitBroker(logger=None, default_channel=Channel(on_return_raises=True))
+
+    async with broker:
+        await broker.start()
+
+        future = await broker.publish(
+            "",
+            uuid4().hex,
+            mandatory=True,
+            no_confirm=True,
+        )
+        await broker.flush()
+
+        with pytest.raises(PublishError):
+            future.result()
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.exceptions import IncorrectState
+from faststream.rabbit.publisher.producer import (
+    AioPikaFastProducerImpl,
+    ReplyDispatcher,
+)
+from faststream.rabbit.response import RabbitPublishCommand
+from faststream.response.publish_type import PublishType
+
+
+def make_message(correlation_id: str | None) -> MagicMock:
+    message = MagicMock()
+    message.correlation_id = correlation_id
+    return message
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_responses_are_routed_by_correlation_id() -> None:
+    queue = AsyncMock()
+    dispatcher = ReplyDispatcher()
+
+    first = await dispatcher.register("1", queue)
+    second = await dispatcher.register("2", queue)
+
+    # reply queue is consumed once
+    queue.consume.assert_awaited_once()
+    callback = queue.consume.call_args.kwargs["callback"]
+
+    second_message, first_message = make_message("2"), make_message("1")
+    await callback(second_message)
+    await callback(first_message)
+
+    assert await first is first_message
+    assert await second is second_message
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_late_response_is_dropped() -> None:
+    queue = AsyncMock()
+    dispatcher = ReplyDispatcher()
+
+    response = await dispatcher.register("1", queue)
+    dispatcher.discard("1")
+
+    callback = queue.consume.call_args.kwargs["callback"]
+    await callback(make_message("1"))
+
+    assert not response.done()
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_duplicated_correlation_id() -> None:
+    dispatcher = ReplyDispatcher()
+    await dispatcher.register("1", AsyncMock())
+
+    with pytest.raises(IncorrectState):
+        await dispatcher.register("1", AsyncMock())
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_close_fails_waiting_requests() -> None:
+    dispatcher = ReplyDispatcher()
+    response = await dispatcher.register("1", AsyncMock())
+
+    dispatcher.close()
+
+    with pytest.raises(IncorrectState):
+        await asyncio.wait_for(response, timeout=1)
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_unknown_response_is_logged() -> None:
+    queue = AsyncMock()
+    logger = MagicMock()
+    dispatcher = ReplyDispatcher(logger)
+
+    response = await dispatcher.register("1", queue)
+
+    callback = queue.consume.call_args.kwargs["callback"]
+    await callback(make_message(None))
+
+    assert not response.done()
+    logger.log.assert_called_once()
+    assert logger.log.call_args.args[1] == logging.WARNING
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_request_uses_id_generator() -> None:
+    queue = AsyncMock()
+    declarer = AsyncMock()
+    declarer.declare_queue.return_value = queue
+
+    producer = AioPikaFastProducerImpl(
+        declarer=declarer,
+        parser=None,
+        decoder=None,
+        id_generator=lambda: "custom-id",
+    )
+    producer.connect()
+
+    async def publish(**kwargs: Any) -> None:
+        callback = queue.consume.call_args.kwargs["callback"]
+        await callback(make_message(kwargs["correlation_id"]))
+
+    producer._publish = publish  # type: ignore[method-assign]
+
+    response = await producer.request(
+        RabbitPublishCommand("hi", _publish_type=PublishType.REQUEST, timeout=1),
+    )
+
+    assert response.correlation_id == "custom-id"
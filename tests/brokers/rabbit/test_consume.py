@@ -1,13 +1,14 @@
 import asyncio
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import aiormq
 import pytest
 from aio_pika import IncomingMessage, Message
 from aiormq.abc import ConfirmationFrameType
 
-from faststream import AckPolicy
+from faststream import AckPolicy, MicroBatch
 from faststream.exceptions import AckMessage, NackMessage, RejectMessage, SkipMessage
-from faststream.rabbit import RabbitExchange, RabbitQueue
+from faststream.rabbit import DeferredAck, RabbitExchange, RabbitQueue
 from faststream.rabbit.annotations import RabbitMessage
 from tests.brokers.base.consume import BrokerRealConsumeTestcase
 from tests.tools import spy_decorator
@@ -119,6 +120,139 @@ class TestConsume(RabbitTestcaseConfig, BrokerRealConsumeTestcase):
 
         assert event.is_set()
 
+    @pytest.mark.asyncio()
+    async def test_consume_micro_batch(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        event = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(
+            queue,
+            micro_batch=MicroBatch(max_size=3, max_latency=3.0),
+        )
+        async def handler(msg) -> None:
+            mock(msg)
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with patch.object(
+                IncomingMessage,
+                "ack",
+                spy_decorator(IncomingMessage.ack),
+            ) as m:
+                for i in range(3):
+                    await br.publish(i, queue)
+
+                await asyncio.wait(
+                    (asyncio.create_task(event.wait()),),
+                    timeout=3,
+                )
+
+                assert m.mock.call_count == 3
+
+        assert event.is_set()
+        mock.assert_called_once_with([0, 1, 2])
+
+    @pytest.mark.asyncio()
+    async def test_micro_batch_manual_ack_per_message(
+        self,
+        queue: str,
+    ) -> None:
+        event = asyncio.Event()
+
+        consume_broker = self.get_broker(apply_types=True)
+
+        @consume_broker.subscriber(
+            queue,
+            micro_batch=MicroBatch(max_size=2, max_latency=3.0),
+        )
+        async def handler(msg: RabbitMessage) -> None:
+            await msg.messages[0].reject()
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with (
+                patch.object(
+                    IncomingMessage,
+                    "ack",
+                    spy_decorator(IncomingMessage.ack),
+                ) as ack,
+                patch.object(
+                    IncomingMessage,
+                    "reject",
+                    spy_decorator(IncomingMessage.reject),
+                ) as reject,
+            ):
+                await br.publish("hello", queue)
+                await br.publish("world", queue)
+
+                await asyncio.wait(
+                    (asyncio.create_task(event.wait()),),
+                    timeout=3,
+                )
+
+                reject.mock.assert_called_once()
+                ack.mock.assert_called_once()
+
+        assert event.is_set()
+
+    @pytest.mark.asyncio()
+    async def test_consume_deferred_ack(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        event = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(
+            queue,
+            deferred_ack=DeferredAck(max_messages=3, interval_ms=3000),
+        )
+        async def handler(msg) -> None:
+            mock(msg)
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with (
+                patch.object(
+                    IncomingMessage,
+                    "ack",
+                    spy_decorator(IncomingMessage.ack),
+                ) as ack,
+                patch.object(
+                    aiormq.Channel,
+                    "basic_ack",
+                    spy_decorator(aiormq.Channel.basic_ack),
+                ) as basic_ack,
+            ):
+                basic_ack.mock.side_effect = lambda *args, **kwargs: event.set()
+
+                for i in range(3):
+                    await br.publish(i, queue)
+
+                await asyncio.wait(
+                    (asyncio.create_task(event.wait()),),
+                    timeout=3,
+                )
+
+                ack.mock.assert_not_called()
+                basic_ack.mock.assert_called_once()
+                assert basic_ack.mock.call_args.kwargs["multiple"]
+
+        assert event.is_set()
+        assert sorted(c.args[0] for c in mock.call_args_list) == [0, 1, 2]
+
     @pytest.mark.asyncio()
     async def test_consume_manual_ack(
         self,
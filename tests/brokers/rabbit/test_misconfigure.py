@@ -1,8 +1,11 @@
+from typing import Any
+
 import pytest
 
+from faststream import AckPolicy, MicroBatch
 from faststream.exceptions import SetupError
 from faststream.nats import NatsRouter
-from faststream.rabbit import RabbitBroker, RabbitRouter
+from faststream.rabbit import DeferredAck, RabbitBroker, RabbitRouter
 
 
 @pytest.mark.rabbit()
@@ -17,3 +20,30 @@ def test_use_only_rabbit_router() -> None:
 
     with pytest.raises(SetupError):
         broker.include_routers(routers)
+
+
+@pytest.mark.rabbit()
+def test_deferred_ack_with_micro_batch() -> None:
+    broker = RabbitBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber(
+            "queue",
+            deferred_ack=DeferredAck(),
+            micro_batch=MicroBatch(max_size=10),
+        )
+
+
+@pytest.mark.rabbit()
+@pytest.mark.parametrize(
+    "options",
+    (
+        pytest.param({"ack_policy": AckPolicy.ACK_FIRST}, id="ack_first"),
+        pytest.param({"no_ack": True}, id="no_ack"),
+    ),
+)
+def test_deferred_ack_without_ack(options: dict[str, Any]) -> None:
+    broker = RabbitBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber("queue", deferred_ack=DeferredAck(), **options)
@@ -198,3 +198,32 @@ class TestPublish(RabbitTestcaseConfig, BrokerPublishTestcase):
 
         assert event.is_set()
         mock.assert_called_with("Hello!")
+
+    @pytest.mark.asyncio()
+    async def test_publish_batch(
+        self,
+        queue: str,
+    ) -> None:
+        pub_broker = self.get_broker()
+
+        msgs_queue = asyncio.Queue(maxsize=2)
+
+        @pub_broker.subscriber(queue)
+        async def handler(msg) -> None:
+            await msgs_queue.put(msg)
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            confirms = await br.publish_batch(1, "hi", queue=queue)
+            assert len(confirms) == 2
+
+            result, _ = await asyncio.wait(
+                (
+                    asyncio.create_task(msgs_queue.get()),
+                    asyncio.create_task(msgs_queue.get()),
+                ),
+                timeout=self.timeout,
+            )
+
+        assert {1, "hi"} == {r.result() for r in result}
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from faststream import BaseMiddleware
@@ -25,7 +27,42 @@ class RabbitRequestsTestcase(RequestsTestcase):
 @pytest.mark.connected()
 @pytest.mark.rabbit()
 class TestRealRequests(RabbitTestcaseConfig, RabbitRequestsTestcase):
-    pass
+    async def test_concurrent_requests(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        async def handler(msg: int) -> int:
+            await asyncio.sleep(0.01 * (10 - msg))
+            return msg * 2
+
+        async with self.patch_broker(broker) as br:
+            await br.start()
+
+            responses = await asyncio.gather(
+                *(br.request(i, queue, timeout=3) for i in range(10)),
+            )
+
+            assert [await r.decode() for r in responses] == [i * 2 for i in range(10)]
+
+    async def test_slow_request_does_not_block_others(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        async def handler(msg: float) -> float:
+            await asyncio.sleep(msg)
+            return msg
+
+        async with self.patch_broker(broker) as br:
+            await br.start()
+
+            slow = asyncio.create_task(br.request(1.0, queue, timeout=3))
+            await asyncio.sleep(0.1)
+
+            response = await br.request(0, queue, timeout=0.5)
+            assert await response.decode() == 0
+            assert not slow.done()
+
+            assert await (await slow).decode() == 1.0
 
 
 @pytest.mark.rabbit()
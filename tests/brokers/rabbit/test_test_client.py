@@ -1,9 +1,10 @@
 import asyncio
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
-from faststream import BaseMiddleware
+from faststream import BaseMiddleware, MicroBatch
 from faststream.exceptions import SubscriberNotFound
 from faststream.rabbit import (
     ExchangeType,
@@ -12,8 +13,15 @@ from faststream.rabbit import (
     RabbitQueue,
 )
 from faststream.rabbit.annotations import RabbitMessage
-from faststream.rabbit.testing import FakeProducer, _is_handler_matches, apply_pattern
+from faststream.rabbit.testing import (
+    FakeProducer,
+    PatchedMessage,
+    _is_handler_matches,
+    apply_pattern,
+    build_message,
+)
 from tests.brokers.base.testclient import BrokerTestclientTestcase
+from tests.tools import spy_decorator
 
 from .basic import RabbitMemoryTestcaseConfig
 
@@ -153,6 +161,130 @@ class TestTestclient(RabbitMemoryTestcaseConfig, BrokerTestclientTestcase):
 
         assert len(routes) == 2
 
+    async def test_publish_batch(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        async def handler(msg) -> None: ...
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch(1, "hi", queue=queue)
+
+            assert handler.mock.call_count == 2
+            handler.mock.assert_any_call(1)
+            handler.mock.assert_any_call("hi")
+
+    async def test_micro_batch(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, micro_batch=MicroBatch())
+        async def handler(msg) -> None: ...
+
+        async with self.patch_broker(broker) as br:
+            await br.publish("hello", queue)
+
+            handler.mock.assert_called_once_with(["hello"])
+
+    async def test_micro_batch_collecting(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        batches = []
+
+        subscriber = broker.subscriber(
+            queue,
+            micro_batch=MicroBatch(max_size=2, max_latency=0.1),
+        )
+
+        @subscriber
+        async def handler(msg) -> None:
+            batches.append(msg)
+
+        async with self.patch_broker(broker):
+            subscriber.start_consume_task()
+
+            for i in range(3):
+                await subscriber._put_msg(build_message(i, queue))
+
+            await asyncio.sleep(0.3)
+            await subscriber.stop()
+
+        assert batches == [[0, 1], [2]]
+
+    async def test_micro_batch_custom_parser(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        batches, parsed, decoded = [], [], []
+
+        async def parser(msg, original):
+            parsed.append(msg.headers)
+            return await original(msg)
+
+        async def decoder(msg, original):
+            decoded.append(msg.correlation_id)
+            return await original(msg)
+
+        subscriber = broker.subscriber(
+            queue,
+            micro_batch=MicroBatch(max_size=2),
+            parser=parser,
+            decoder=decoder,
+        )
+
+        @subscriber
+        async def handler(msg) -> None:
+            batches.append(msg)
+
+        async with self.patch_broker(broker):
+            # custom parser and decoder are applied to each collected message
+            await subscriber.consume((build_message(1, queue), build_message(2, queue)))
+
+        assert batches == [[1, 2]]
+        assert len(parsed) == len(decoded) == 2
+
+    async def test_micro_batch_requeue_at_stop(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        subscriber = broker.subscriber(
+            queue,
+            micro_batch=MicroBatch(max_size=10, max_latency=10.0),
+        )
+
+        @subscriber
+        async def handler(msg) -> None: ...
+
+        async with self.patch_broker(broker):
+            subscriber.start_consume_task()
+
+            messages = [build_message(i, queue) for i in range(3)]
+            for msg in messages:
+                await subscriber._put_msg(msg)
+
+            with patch.object(
+                PatchedMessage,
+                "nack",
+                spy_decorator(PatchedMessage.nack),
+            ) as nack:
+                await subscriber.stop()
+
+            assert nack.mock.call_count == 3
+
+        handler.mock.assert_not_called()
+
     @pytest.mark.connected()
     async def test_broker_gets_patched_attrs_within_cm(self) -> None:
         await super().test_broker_gets_patched_attrs_within_cm(FakeProducer)
@@ -0,0 +1,72 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.redis.subscriber.acks import StreamAcker
+
+
+def _make_client() -> tuple[MagicMock, MagicMock]:
+    pipe = MagicMock()
+    pipe.__aenter__.return_value = pipe
+    pipe.execute = AsyncMock()
+
+    client = MagicMock()
+    client.pipeline.return_value = pipe
+    return client, pipe
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_acks_are_sent_by_stream() -> None:
+    client, pipe = _make_client()
+    acker = StreamAcker(client, group="group", max_messages=10)
+
+    acker.add("first", [b"1-0"])
+    acker.add("second", [b"2-0"])
+    acker.add("first", [b"3-0", b"4-0"])
+
+    await acker.flush()
+
+    client.pipeline.assert_called_once_with(transaction=False)
+    assert [c.args for c in pipe.xack.call_args_list] == [
+        ("first", "group", b"1-0", b"3-0", b"4-0"),
+        ("second", "group", b"2-0"),
+    ]
+    pipe.execute.assert_called_once()
+
+    # nothing to send twice
+    await acker.flush()
+    client.pipeline.assert_called_once()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_wait_for_max_messages() -> None:
+    client, _ = _make_client()
+    acker = StreamAcker(client, group="group", max_messages=2)
+
+    acker.add("stream", [b"1-0", b"2-0"])
+
+    # returns at once without timeout waiting
+    await acker.wait(timeout=100)
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_failed_acks_are_sent_again() -> None:
+    client, pipe = _make_client()
+    pipe.execute.side_effect = ConnectionError
+    acker = StreamAcker(client, group="group", max_messages=10)
+
+    acker.add("stream", [b"1-0"])
+
+    with pytest.raises(ConnectionError):
+        await acker.flush()
+
+    pipe.execute.side_effect = None
+    acker.add("stream", [b"2-0"])
+    pipe.xack.reset_mock()
+
+    await acker.flush()
+
+    pipe.xack.assert_called_once_with("stream", "group", b"1-0", b"2-0")
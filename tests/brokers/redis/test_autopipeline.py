@@ -0,0 +1,82 @@
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from faststream.redis.publisher.producer import AutoPipeline
+
+
+class FakePipeline:
+    def __init__(self, results: list[Any]) -> None:
+        self.results = results
+        self.commands: list[str] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    def publish(self, channel: str, msg: bytes) -> "FakePipeline":
+        self.commands.append(channel)
+        return self
+
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        assert not raise_on_error
+        return self.results[: len(self.commands)]
+
+
+def make_connection(*pipelines: FakePipeline) -> MagicMock:
+    connection = MagicMock()
+    connection.client.pipeline.side_effect = pipelines
+    return connection
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_concurrent_commands_are_pipelined() -> None:
+    pipe = FakePipeline([1, 2, 3])
+    connection = make_connection(pipe)
+    pipeline = AutoPipeline(connection)
+
+    results = await asyncio.gather(
+        *(
+            pipeline.execute(lambda p, i=i: p.publish(f"channel-{i}", b""))
+            for i in range(3)
+        ),
+    )
+
+    assert results == [1, 2, 3]
+    assert pipe.commands == ["channel-0", "channel-1", "channel-2"]
+    connection.client.pipeline.assert_called_once_with(transaction=False)
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_pipeline_max_size() -> None:
+    first, second = FakePipeline([1, 2]), FakePipeline([3])
+    pipeline = AutoPipeline(make_connection(first, second), max_size=2)
+
+    results = await asyncio.gather(
+        *(pipeline.execute(lambda p: p.publish("channel", b"")) for _ in range(3)),
+    )
+
+    assert results == [1, 2, 3]
+    assert len(first.commands) == 2
+    assert len(second.commands) == 1
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_command_error_is_raised_to_its_caller() -> None:
+    error = ValueError()
+    pipeline = AutoPipeline(make_connection(FakePipeline([1, error])))
+
+    results = await asyncio.gather(
+        pipeline.execute(lambda p: p.publish("channel", b"")),
+        pipeline.execute(lambda p: p.publish("channel", b"")),
+        return_exceptions=True,
+    )
+
+    assert results == [1, error]
@@ -776,6 +776,83 @@ class TestConsumeStream(RedisTestcaseConfig):
 
         assert event.is_set()
 
+    async def test_consume_batched_ack(
+        self,
+        queue: str,
+    ) -> None:
+        consume_broker = self.get_broker(apply_types=True)
+
+        consumed = asyncio.Queue[str]()
+
+        @consume_broker.subscriber(
+            stream=StreamSub(
+                queue,
+                group="group",
+                consumer=queue,
+                ack_batch_size=2,
+                ack_interval=10_000,
+            ),
+        )
+        async def handler(msg: str) -> None:
+            consumed.put_nowait(msg)
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with patch.object(Redis, "xack", spy_decorator(Redis.xack)) as m:
+                await br.publish("hello", stream=queue)
+                await br.publish("world", stream=queue)
+
+                for _ in range(2):
+                    await asyncio.wait_for(consumed.get(), timeout=3)
+
+                for _ in range(30):
+                    if m.mock.called:
+                        break
+                    await asyncio.sleep(0.1)
+
+                # both messages are acknowledged by a single command
+                m.mock.assert_called_once()
+                assert len(m.mock.call_args.args) == 4
+
+            pending = await br._connection.xpending(queue, "group")
+            assert pending["pending"] == 0
+
+    async def test_consume_claimed(
+        self,
+        queue: str,
+    ) -> None:
+        consume_broker = self.get_broker(apply_types=True)
+
+        consumed = asyncio.Event()
+
+        @consume_broker.subscriber(
+            stream=StreamSub(
+                queue,
+                group="group",
+                consumer="alive",
+                min_idle_time=10,
+            ),
+        )
+        async def handler(msg: str) -> None:
+            assert msg == "hello"
+            consumed.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            connection = br._connection
+            await connection.xgroup_create(queue, "group", id="$", mkstream=True)
+            await connection.xadd(queue, {"message": "hello"})
+
+            # message is read by a crashed consumer and never acknowledged
+            await connection.xreadgroup("group", "crashed", {queue: ">"})
+
+            await br.start()
+
+            await asyncio.wait_for(consumed.wait(), timeout=3)
+
+            pending = await connection.xpending(queue, "group")
+            assert pending["pending"] == 0
+
     @pytest.mark.flaky(reruns=3, reruns_delay=1)
     async def test_consume_and_delete_acked(
         self,
@@ -284,3 +284,24 @@ class TestPublish(RedisTestcaseConfig, BrokerPublishTestcase):
             await asyncio.wait(tasks, timeout=3)
 
         mock.assert_called_once_with([0, 1, 2, 3, 4])
+
+    @pytest.mark.asyncio()
+    async def test_publish_with_autopipeline(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker(autopipeline=True)
+
+        async with self.patch_broker(broker) as br:
+            await br.start()
+
+            with patch.object(Redis, "xadd", spy_decorator(Redis.xadd)) as m:
+                message_ids = await asyncio.gather(
+                    *(br.publish(i, stream=queue) for i in range(10)),
+                )
+
+            # commands are sent by pipeline, not by the client
+            assert not m.mock.called
+
+            assert len(set(message_ids)) == 10
+            assert await br._connection.xlen(queue) == 10
@@ -0,0 +1,113 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from faststream.exceptions import IncorrectState
+from faststream.redis.publisher.producer import ReplyListener
+
+
+class FakePubSub:
+    def __init__(self) -> None:
+        self.messages = asyncio.Queue[dict[str, Any] | Exception]()
+        self.closed = False
+
+    async def psubscribe(self, pattern: str) -> None:
+        self.messages.put_nowait({"type": "psubscribe", "pattern": pattern})
+
+    async def listen(self) -> AsyncIterator[dict[str, Any]]:
+        while True:
+            message = await self.messages.get()
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+    def reply(self, channel: str, data: bytes) -> None:
+        self.messages.put_nowait({
+            "type": "pmessage",
+            "channel": channel.encode(),
+            "data": data,
+        })
+
+
+def make_listener() -> tuple[ReplyListener, MagicMock, FakePubSub]:
+    psub = FakePubSub()
+    connection = MagicMock()
+    connection.client.pubsub.return_value = psub
+    return ReplyListener(connection), connection, psub
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_responses_are_routed_by_reply_channel() -> None:
+    listener, connection, psub = make_listener()
+
+    first_channel, first = await listener.register()
+    second_channel, second = await listener.register()
+
+    assert first_channel.startswith(listener.prefix)
+    assert first_channel != second_channel
+
+    psub.reply(second_channel, b"2")
+    psub.reply(first_channel, b"1")
+
+    assert (await first)["data"] == b"1"
+    assert (await second)["data"] == b"2"
+
+    # single subscription for all requests
+    connection.client.pubsub.assert_called_once()
+
+    await listener.close()
+    assert psub.closed
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_late_response_is_dropped() -> None:
+    listener, _, psub = make_listener()
+
+    channel, response = await listener.register()
+    listener.discard(channel)
+
+    psub.reply(channel, b"late")
+    await asyncio.sleep(0)
+
+    assert not response.done()
+    assert not listener._responses
+
+    await listener.close()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_subscription_error_fails_waiting_requests() -> None:
+    listener, _, psub = make_listener()
+
+    _, response = await listener.register()
+
+    error = ConnectionError()
+    psub.messages.put_nowait(error)
+
+    with pytest.raises(ConnectionError):
+        await response
+
+    # next request subscribes again
+    await listener.register()
+    await listener.close()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_close_fails_waiting_requests() -> None:
+    listener, _, _ = make_listener()
+
+    _, response = await listener.register()
+    await listener.close()
+
+    with pytest.raises(IncorrectState):
+        await response
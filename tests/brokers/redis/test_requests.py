@@ -1,7 +1,14 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from faststream import BaseMiddleware
 from faststream.redis import BinaryMessageFormatV1
+from faststream.redis.publisher.producer import RedisFastProducer, ReplyListener
+from faststream.redis.response import RedisPublishCommand
+from faststream.response.publish_type import PublishType
 from tests.brokers.base.requests import RequestsTestcase
 
 from .basic import RedisMemoryTestcaseConfig, RedisTestcaseConfig
@@ -32,9 +39,81 @@ class RedisRequestsTestcase(RequestsTestcase):
 @pytest.mark.connected()
 @pytest.mark.redis()
 class TestRealRequests(RedisTestcaseConfig, RedisRequestsTestcase):
-    pass
+    async def test_concurrent_requests(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        async def handler(msg: int) -> int:
+            await asyncio.sleep(0.01 * (10 - msg))
+            return msg * 2
+
+        async with self.patch_broker(broker) as br:
+            await br.start()
+
+            responses = await asyncio.gather(
+                *(br.request(i, queue, timeout=3) for i in range(10)),
+            )
+
+            # responses are routed to their requests by a shared subscription
+            assert [await r.decode() for r in responses] == [i * 2 for i in range(10)]
+
+    async def test_late_response_is_dropped(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        async def handler(msg: float) -> float:
+            await asyncio.sleep(msg)
+            return msg
+
+        async with self.patch_broker(broker) as br:
+            await br.start()
+
+            with pytest.raises(TimeoutError):
+                await br.request(0.5, queue, timeout=0.1)
+
+            response = await br.request(0, queue, timeout=3)
+            assert await response.decode() == 0
+
+            await asyncio.sleep(0.5)
+            assert not br.config.producer._replies._responses
 
 
 @pytest.mark.redis()
 class TestRequestTestClient(RedisMemoryTestcaseConfig, RedisRequestsTestcase):
     pass
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_request_timeout_includes_registration() -> None:
+    connection = MagicMock()
+    connection.client.publish = AsyncMock()
+
+    producer = RedisFastProducer(
+        connection,
+        parser=None,
+        decoder=None,
+        message_format=BinaryMessageFormatV1,
+        serializer=None,
+    )
+
+    async def slow_register(self: ReplyListener) -> tuple[str, asyncio.Future[None]]:
+        await asyncio.sleep(0.15)
+        return "reply", asyncio.get_running_loop().create_future()
+
+    cmd = RedisPublishCommand(
+        "hi",
+        channel="test",
+        timeout=0.2,
+        _publish_type=PublishType.REQUEST,
+    )
+
+    start = time.perf_counter()
+    with (
+        patch.object(ReplyListener, "register", slow_register),
+        pytest.raises(TimeoutError),
+    ):
+        await producer.request(cmd)
+
+    # a single deadline for the registration and the response waiting
+    assert time.perf_counter() - start < 0.3
@@ -1,5 +1,8 @@
+from typing import Any
+
 import pytest
 
+from faststream.exceptions import SetupError
 from faststream.redis import StreamSub
 
 
@@ -12,3 +15,28 @@ def test_stream_group() -> None:
         StreamSub("test", consumer="consumer")
 
     StreamSub("test", group="group", consumer="consumer")
+
+
+@pytest.mark.redis()
+@pytest.mark.parametrize(
+    "options",
+    (
+        pytest.param({"min_idle_time": 1000}, id="min_idle_time without group"),
+        pytest.param({"ack_batch_size": 10}, id="ack_batch_size without group"),
+        pytest.param(
+            {"group": "group", "consumer": "consumer", "min_idle_time": 0},
+            id="min_idle_time",
+        ),
+        pytest.param(
+            {"group": "group", "consumer": "consumer", "ack_batch_size": 0},
+            id="ack_batch_size",
+        ),
+        pytest.param(
+            {"group": "group", "consumer": "consumer", "ack_interval": 0},
+            id="ack_interval",
+        ),
+    ),
+)
+def test_stream_reclaim_and_acks_validation(options: dict[str, Any]) -> None:
+    with pytest.raises(SetupError):
+        StreamSub("test", **options)
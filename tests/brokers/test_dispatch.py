@@ -0,0 +1,68 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from faststream.redis import RedisBroker
+
+
+def _raw_message(data: bytes = b"hello") -> dict[str, Any]:
+    return {"type": "message", "channel": b"test", "data": data, "pattern": None}
+
+
+@pytest.mark.asyncio()
+@pytest.mark.redis()
+async def test_single_handler_fast_path(mock: MagicMock) -> None:
+    broker = RedisBroker(apply_types=False)
+
+    async def parser(msg: Any, original: Any) -> Any:
+        mock()
+        return await original(msg)
+
+    sub = broker.subscriber("test", parser=parser)
+
+    @sub
+    async def handler(msg: Any) -> None: ...
+
+    sub._build_fastdepends_model()
+    assert sub.calls._single is not None
+
+    h, message = await sub.calls.find_handler(_raw_message())
+    assert h.handler is handler
+    assert await message.decode() == b"hello"
+    mock.assert_called_once()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.redis()
+async def test_custom_filter_disables_fast_path() -> None:
+    broker = RedisBroker(apply_types=False)
+    sub = broker.subscriber("test")
+
+    @sub(filter=lambda m: m.body == b"hello")
+    async def handler(msg: Any) -> None: ...
+
+    sub._build_fastdepends_model()
+    assert sub.calls._single is None
+
+    assert await sub.calls.find_handler(_raw_message()) is not None
+    assert await sub.calls.find_handler(_raw_message(b"bye")) is None
+
+
+@pytest.mark.asyncio()
+@pytest.mark.redis()
+async def test_multiple_handlers_disable_fast_path() -> None:
+    broker = RedisBroker(apply_types=False)
+    sub = broker.subscriber("test")
+
+    @sub(filter=lambda m: m.body == b"hello")
+    async def first(msg: Any) -> None: ...
+
+    @sub
+    async def second(msg: Any) -> None: ...
+
+    sub._build_fastdepends_model()
+    assert sub.calls._single is None
+
+    h, _ = await sub.calls.find_handler(_raw_message(b"bye"))
+    assert h.handler is second
@@ -0,0 +1,111 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from faststream._internal.broker import BrokerUsecase
+from faststream.exceptions import SetupError
+from faststream.rabbit import RabbitBroker
+from faststream.rabbit.subscriber import RabbitSubscriber
+
+
+def _patch_subscribers(
+    subscribers: list[RabbitSubscriber],
+    calls: list[str],
+    fail: str | None = None,
+) -> dict[str, int]:
+    state = {"running": 0, "max_running": 0}
+
+    for sub in subscribers:
+
+        async def run(method: str, name: str = sub.queue.name) -> None:
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+            await asyncio.sleep(0.01)
+            state["running"] -= 1
+
+            calls.append(f"{method}:{name}")
+            if name == fail:
+                raise ValueError(name)
+
+        async def start(run: Any = run) -> None:
+            await run("start")
+
+        async def stop(run: Any = run) -> None:
+            await run("stop")
+
+        sub.start = start  # type: ignore[method-assign]
+        sub.stop = stop  # type: ignore[method-assign]
+
+    return state
+
+
+def _make_broker(start_concurrency: int) -> tuple[RabbitBroker, list[RabbitSubscriber]]:
+    broker = RabbitBroker(start_concurrency=start_concurrency)
+
+    # broker holds subscribers by weak references
+    subscribers = [broker.subscriber(f"queue-{i}") for i in range(5)]
+    for sub in subscribers:
+        sub(lambda: None)
+
+    return broker, subscribers
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_sequential_start() -> None:
+    broker, subscribers = _make_broker(1)
+
+    calls: list[str] = []
+    state = _patch_subscribers(subscribers, calls)
+
+    await BrokerUsecase.start(broker)
+    await BrokerUsecase.stop(broker)
+
+    names = [sub.queue.name for sub in broker.subscribers]
+    assert state["max_running"] == 1
+    assert calls == [
+        *(f"start:{name}" for name in names),
+        *(f"stop:{name}" for name in names),
+    ]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_concurrent_start() -> None:
+    broker, subscribers = _make_broker(3)
+
+    calls: list[str] = []
+    state = _patch_subscribers(subscribers, calls)
+
+    await BrokerUsecase.start(broker)
+    assert broker.running
+    assert state["max_running"] == 3
+    assert sorted(calls) == [f"start:queue-{i}" for i in range(5)]
+
+    state["max_running"] = 0
+    await BrokerUsecase.stop(broker)
+    assert not broker.running
+    assert state["max_running"] == 3
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_concurrent_start_error() -> None:
+    broker, subscribers = _make_broker(3)
+
+    calls: list[str] = []
+    _patch_subscribers(subscribers, calls, fail="queue-0")
+
+    with pytest.raises(ValueError, match="queue-0"):
+        await BrokerUsecase.start(broker)
+
+    # other subscribers are started anyway to be stopped correctly
+    assert len(calls) == 5
+    assert not broker.running
+
+
+@pytest.mark.rabbit()
+def test_start_concurrency_validation() -> None:
+    with pytest.raises(SetupError):
+        RabbitBroker(start_concurrency=0)
@@ -0,0 +1,60 @@
+import pytest
+
+from faststream.message import AckStatus, BatchStreamMessage, StreamMessage
+
+
+def test_lazy_correlation_id() -> None:
+    msg = StreamMessage(None, b"")
+
+    assert msg._correlation_id is None
+
+    correlation_id = msg.correlation_id
+    assert correlation_id
+    assert msg.correlation_id == correlation_id
+    assert msg.message_id == correlation_id
+
+
+def test_passed_ids() -> None:
+    msg = StreamMessage(None, b"", correlation_id="1", message_id="2")
+
+    assert msg.correlation_id == "1"
+    assert msg.message_id == "2"
+
+
+def test_lazy_collections() -> None:
+    msg = StreamMessage(None, b"")
+
+    assert msg._headers is None
+    assert msg._batch_headers is None
+    assert msg._path is None
+
+    msg.headers["key"] = "value"
+    assert msg.headers == {"key": "value"}
+    assert msg.batch_headers == []
+    assert msg.path == {}
+
+
+def test_custom_attributes() -> None:
+    msg = StreamMessage(None, b"")
+
+    msg.custom = 1
+
+    assert msg.custom == 1
+
+
+@pytest.mark.asyncio()
+async def test_batch_acks_per_message() -> None:
+    messages = [StreamMessage(i, str(i).encode()) for i in range(3)]
+    batch = BatchStreamMessage((0, 1, 2), messages)
+
+    assert batch.body == [b"0", b"1", b"2"]
+
+    await messages[1].reject()
+    await batch.ack()
+
+    assert [m.committed for m in messages] == [
+        AckStatus.ACKED,
+        AckStatus.REJECTED,
+        AckStatus.ACKED,
+    ]
+    assert batch.committed is AckStatus.ACKED
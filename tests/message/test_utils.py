@@ -0,0 +1,24 @@
+from faststream.message import NuidGenerator, UlidGenerator, gen_cor_id
+
+
+def test_gen_cor_id() -> None:
+    assert gen_cor_id() != gen_cor_id()
+
+
+def test_nuid_generator() -> None:
+    generator = NuidGenerator()
+
+    ids = {generator() for _ in range(1000)}
+
+    assert len(ids) == 1000
+    assert all(len(i) == 22 for i in ids)
+
+
+def test_ulid_generator_monotonic() -> None:
+    generator = UlidGenerator()
+
+    ids = [generator() for _ in range(1000)]
+
+    assert len(set(ids)) == 1000
+    assert ids == sorted(ids)
+    assert all(len(i) == 26 for i in ids)
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import Awaitable, Callable
 
 import prometheus_client
@@ -298,6 +299,12 @@ async def check_publish_type() -> None:
     assert_type(await broker.publish(None, "test"), None)
     assert_type(await broker.publish(None, "test", stream="stream"), PubAck)
 
+    assert_type(await broker.publish_batch(None, subject="test"), None)
+    assert_type(
+        await broker.publish_batch(None, subject="test", stream="stream"),
+        list[PubAck],
+    )
+
 
 async def check_publisher_publish_type() -> None:
     broker = NatsBroker()
@@ -306,3 +313,19 @@ async def check_publisher_publish_type() -> None:
 
     assert_type(await publisher.publish(None, "test"), None)
     assert_type(await publisher.publish(None, "test", stream="stream"), PubAck)
+
+
+async def check_publish_no_confirm_type() -> None:
+    broker = NatsBroker()
+
+    assert_type(
+        await broker.publish(None, "test", stream="stream", no_confirm=True),
+        asyncio.Future[PubAck],
+    )
+
+    publisher = broker.publisher("test")
+
+    assert_type(
+        await publisher.publish(None, "test", stream="stream", no_confirm=True),
+        asyncio.Future[PubAck],
+    )
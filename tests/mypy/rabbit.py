@@ -305,6 +305,9 @@ async def check_publish_type(optional_stream: str | None = "test") -> None:
 
     assert_type(publish_with_confirm, ConfirmationFrameType | None)
 
+    publish_batch_with_confirm = await broker.publish_batch(None, queue="test")
+    assert_type(publish_batch_with_confirm, list[ConfirmationFrameType | None])
+
 
 async def check_subscriber_get_one_type() -> None:
     broker = RabbitBroker()
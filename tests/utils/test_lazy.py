@@ -0,0 +1,34 @@
+from importlib import import_module
+
+import pytest
+
+from tests.marks import (
+    require_aiokafka,
+    require_aiopika,
+    require_confluent,
+    require_nats,
+    require_redis,
+)
+
+
+@pytest.mark.parametrize(
+    "module",
+    (
+        pytest.param("faststream"),
+        pytest.param("faststream.asgi"),
+        pytest.param("faststream.kafka", marks=require_aiokafka),
+        pytest.param("faststream.confluent", marks=require_confluent),
+        pytest.param("faststream.rabbit", marks=require_aiopika),
+        pytest.param("faststream.nats", marks=require_nats),
+        pytest.param("faststream.redis", marks=require_redis),
+    ),
+)
+def test_lazy_attributes(module: str) -> None:
+    package = import_module(module)
+
+    for name in package.__all__:
+        assert getattr(package, name) is not None, name
+        assert name in dir(package)
+
+    with pytest.raises(AttributeError):
+        package.NotExists  # noqa: B018
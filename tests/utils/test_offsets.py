@@ -0,0 +1,82 @@
+from faststream._internal.endpoint.subscriber.offsets import OffsetTracker
+
+
+def test_commit_contiguous_offsets() -> None:
+    tracker = OffsetTracker[str]()
+
+    for offset in range(4):
+        tracker.add("p", offset)
+
+    tracker.complete("p", 1)
+    tracker.complete("p", 2)
+    assert tracker.committable() == {}
+
+    tracker.complete("p", 0)
+    assert tracker.committable() == {"p": 3}
+
+
+def test_offsets_gaps() -> None:
+    tracker = OffsetTracker[str]()
+
+    tracker.add("p", 10)
+    tracker.add("p", 15)
+
+    tracker.complete("p", 15)
+    tracker.complete("p", 10)
+
+    assert tracker.committable() == {"p": 16}
+
+
+def test_mark_committed() -> None:
+    tracker = OffsetTracker[str]()
+
+    tracker.add("p", 0)
+    tracker.complete("p", 0)
+
+    offsets = tracker.committable()
+    assert offsets == {"p": 1}
+
+    tracker.mark_committed(offsets)
+    assert tracker.committable() == {}
+
+
+def test_partitions_are_independent() -> None:
+    tracker = OffsetTracker[str]()
+
+    tracker.add("p1", 0)
+    tracker.add("p2", 0)
+    tracker.complete("p2", 0)
+
+    assert tracker.committable() == {"p2": 1}
+    assert tracker.committable(["p1"]) == {}
+
+
+def test_reset() -> None:
+    tracker = OffsetTracker[str]()
+
+    for offset in range(3):
+        tracker.add("p", offset)
+
+    tracker.complete("p", 0)
+    tracker.complete("p", 2)
+    tracker.reset("p", 1)
+
+    # offsets are received again after seek
+    tracker.add("p", 1)
+    tracker.add("p", 2)
+
+    tracker.complete("p", 2)
+    assert tracker.committable() == {"p": 1}
+
+    tracker.complete("p", 1)
+    assert tracker.committable() == {"p": 3}
+
+
+def test_remove() -> None:
+    tracker = OffsetTracker[str]()
+
+    tracker.add("p", 0)
+    tracker.remove(["p"])
+
+    tracker.complete("p", 0)
+    assert tracker.committable() == {}